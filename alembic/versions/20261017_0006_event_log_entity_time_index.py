@@ -0,0 +1,32 @@
+"""Event log entity history index - (entity_type, entity_id, created_at)
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # get_entity_history filters on (entity_type, entity_id) and orders by
+    # created_at DESC; the old two-column index forced a sort step.
+    op.create_index(
+        "ix_event_logs_entity_time",
+        "event_logs",
+        ["entity_type", "entity_id", "created_at"],
+    )
+    op.drop_index("ix_event_logs_entity", table_name="event_logs")
+
+
+def downgrade() -> None:
+    op.create_index("ix_event_logs_entity", "event_logs", ["entity_type", "entity_id"])
+    op.drop_index("ix_event_logs_entity_time", table_name="event_logs")
@@ -0,0 +1,52 @@
+"""Event log payload as JSONB with jsonb_path_ops GIN index (PostgreSQL)
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # JSONB + GIN only exist on PostgreSQL; SQLite keeps plain JSON
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.alter_column(
+        "event_logs",
+        "payload",
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=False,
+        postgresql_using="payload::jsonb",
+    )
+    op.create_index(
+        "ix_event_logs_payload_gin",
+        "event_logs",
+        ["payload"],
+        postgresql_using="gin",
+        postgresql_ops={"payload": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("ix_event_logs_payload_gin", table_name="event_logs")
+    op.alter_column(
+        "event_logs",
+        "payload",
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using="payload::json",
+    )
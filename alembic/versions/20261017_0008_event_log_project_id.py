@@ -0,0 +1,59 @@
+"""Event log project_id column - promoted from payload for indexed lookups, replacing the payload GIN index
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("event_logs", sa.Column("project_id", sa.Uuid(), nullable=True))
+
+    # Backfill from the JSON payload (UUIDs are stored there as strings)
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            "UPDATE event_logs SET project_id = (payload->>'project_id')::uuid "
+            "WHERE payload ? 'project_id' "
+            "AND payload->>'project_id' ~* '^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'"
+        )
+    else:
+        # SQLite stores Uuid() as 32 hex chars without dashes
+        op.execute(
+            "UPDATE event_logs SET project_id = "
+            "replace(json_extract(payload, '$.project_id'), '-', '') "
+            "WHERE json_extract(payload, '$.project_id') IS NOT NULL"
+        )
+
+    op.create_index(
+        "ix_event_logs_project_time",
+        "event_logs",
+        ["project_id", "created_at"],
+    )
+
+    # Project activity no longer filters with payload @>, and nothing else
+    # does; the GIN index from 0007 would only slow down every insert
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_event_logs_payload_gin", table_name="event_logs")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.create_index(
+            "ix_event_logs_payload_gin",
+            "event_logs",
+            ["payload"],
+            postgresql_using="gin",
+            postgresql_ops={"payload": "jsonb_path_ops"},
+        )
+    op.drop_index("ix_event_logs_project_time", table_name="event_logs")
+    op.drop_column("event_logs", "project_id")
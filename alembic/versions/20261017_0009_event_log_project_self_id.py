@@ -0,0 +1,32 @@
+"""Event log project_id for project events - backfill project_id = entity_id
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Project events carry their own id in project_id so project activity is a
+    # single (project_id, created_at) index range
+    op.execute(
+        "UPDATE event_logs SET project_id = entity_id "
+        "WHERE entity_type = 'project' AND project_id IS NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "UPDATE event_logs SET project_id = NULL "
+        "WHERE entity_type = 'project' AND project_id = entity_id"
+    )
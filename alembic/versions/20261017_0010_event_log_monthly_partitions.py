@@ -0,0 +1,106 @@
+"""Event log range-partitioned by created_at, one partition per month (PostgreSQL)
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-17
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Months of empty partitions created ahead of today; the app keeps this
+# window topped up at startup (src.kernel.events.partitions)
+MONTHS_AHEAD = 3
+
+INDEXES = (
+    ("ix_event_logs_event_type", ["event_type"]),
+    ("ix_event_logs_entity_id", ["entity_id"]),
+    ("ix_event_logs_user_id", ["user_id"]),
+    ("ix_event_logs_created_at", ["created_at"]),
+    ("ix_event_logs_entity_time", ["entity_type", "entity_id", "created_at"]),
+    ("ix_event_logs_user_time", ["user_id", "created_at"]),
+    ("ix_event_logs_type_time", ["event_type", "created_at"]),
+    ("ix_event_logs_project_time", ["project_id", "created_at"]),
+)
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + (month.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_indexes() -> None:
+    # Indexes on the partitioned parent cascade to every partition
+    for name, columns in INDEXES:
+        op.create_index(name, "event_logs", columns)
+
+
+def upgrade() -> None:
+    # Declarative partitioning only exists on PostgreSQL; SQLite keeps one table
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.rename_table("event_logs", "event_logs_unpartitioned")
+    op.execute(
+        "ALTER TABLE event_logs_unpartitioned "
+        "RENAME CONSTRAINT event_logs_pkey TO event_logs_unpartitioned_pkey"
+    )
+    # The partition key must be part of the primary key, so it becomes
+    # (id, created_at); ids stay unique because they are generated UUIDs
+    op.execute(
+        "CREATE TABLE event_logs ("
+        "LIKE event_logs_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS, "
+        "PRIMARY KEY (id, created_at)"
+        ") PARTITION BY RANGE (created_at)"
+    )
+
+    oldest = bind.execute(
+        sa.text("SELECT min(created_at) FROM event_logs_unpartitioned")
+    ).scalar()
+    current = date.today().replace(day=1)
+    month = oldest.date().replace(day=1) if oldest else current
+    last = _add_months(current, MONTHS_AHEAD)
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE event_logs_y{month.year:04d}m{month.month:02d} "
+            f"PARTITION OF event_logs FOR VALUES FROM ('{month.isoformat()}') "
+            f"TO ('{_add_months(month, 1).isoformat()}')"
+        )
+        month = _add_months(month, 1)
+    # Catches rows outside the pre-created range instead of failing the insert
+    op.execute("CREATE TABLE event_logs_default PARTITION OF event_logs DEFAULT")
+
+    op.execute("INSERT INTO event_logs SELECT * FROM event_logs_unpartitioned")
+    op.drop_table("event_logs_unpartitioned")
+    _create_indexes()
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.rename_table("event_logs", "event_logs_partitioned")
+    op.execute(
+        "ALTER TABLE event_logs_partitioned "
+        "RENAME CONSTRAINT event_logs_pkey TO event_logs_partitioned_pkey"
+    )
+    op.execute(
+        "CREATE TABLE event_logs ("
+        "LIKE event_logs_partitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS, "
+        "PRIMARY KEY (id)"
+        ")"
+    )
+    op.execute("INSERT INTO event_logs SELECT * FROM event_logs_partitioned")
+    # Dropping the parent drops every attached partition with it
+    op.drop_table("event_logs_partitioned")
+    _create_indexes()
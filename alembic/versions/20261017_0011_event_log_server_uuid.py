@@ -0,0 +1,42 @@
+"""Event log id generated server-side with gen_random_uuid()
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SQLite cannot alter a column default in place; fresh SQLite databases get
+    # it from the model via create_all
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.alter_column(
+        "event_logs",
+        "id",
+        server_default=sa.text("gen_random_uuid()"),
+        existing_type=sa.Uuid(),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.alter_column(
+        "event_logs",
+        "id",
+        server_default=None,
+        existing_type=sa.Uuid(),
+        existing_nullable=False,
+    )
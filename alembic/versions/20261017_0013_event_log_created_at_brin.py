@@ -0,0 +1,37 @@
+"""Event log created_at BRIN index replacing the B-tree (PostgreSQL)
+
+Revision ID: 0013
+Revises: 0011
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0013"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # BRIN only exists on PostgreSQL; SQLite keeps the B-tree
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.create_index(
+        "ix_event_logs_created_at_brin",
+        "event_logs",
+        ["created_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+    op.drop_index("ix_event_logs_created_at", table_name="event_logs")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.create_index("ix_event_logs_created_at", "event_logs", ["created_at"])
+    op.drop_index("ix_event_logs_created_at_brin", table_name="event_logs")
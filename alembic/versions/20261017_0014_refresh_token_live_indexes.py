@@ -0,0 +1,47 @@
+"""Partial indexes on live (unrevoked) refresh tokens
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0014"
+down_revision: Union[str, None] = "0013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _live_predicate() -> sa.TextClause:
+    if op.get_bind().dialect.name == "postgresql":
+        return sa.text("revoked = false")
+    return sa.text("revoked = 0")
+
+
+def upgrade() -> None:
+    live = _live_predicate()
+    # Refresh rotation: token_hash = ? AND revoked = false AND expires_at > now()
+    op.create_index(
+        "ix_refresh_tokens_hash_live",
+        "refresh_tokens",
+        ["token_hash", "expires_at"],
+        postgresql_where=live,
+        sqlite_where=live,
+    )
+    # logout(revoke_all=True): user_id = ? AND revoked = false
+    op.create_index(
+        "ix_refresh_tokens_user_live",
+        "refresh_tokens",
+        ["user_id"],
+        postgresql_where=live,
+        sqlite_where=live,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_refresh_tokens_user_live", table_name="refresh_tokens")
+    op.drop_index("ix_refresh_tokens_hash_live", table_name="refresh_tokens")
@@ -0,0 +1,36 @@
+"""Require users.email to be stored lowercased and trimmed
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0015"
+down_revision: Union[str, None] = "0014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Normalize any rows written before IdentityService did it consistently;
+    # fails on the unique index if two accounts differ only by case, which
+    # must then be merged by hand
+    op.execute(
+        sa.text("UPDATE users SET email = lower(trim(email)) WHERE email != lower(trim(email))")
+    )
+    # SQLite cannot add a constraint in place, so batch mode recreates the table
+    with op.batch_alter_table("users", schema=None) as batch_op:
+        batch_op.create_check_constraint(
+            "ck_users_email_normalized",
+            "email = lower(trim(email))",
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("users", schema=None) as batch_op:
+        batch_op.drop_constraint("ck_users_email_normalized", type_="check")
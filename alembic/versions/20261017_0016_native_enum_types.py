@@ -0,0 +1,76 @@
+"""Native PostgreSQL enum types for event_logs.event_type and artifacts.artifact_type
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0016"
+down_revision: Union[str, None] = "0015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EVENT_TYPES = (
+    "user.registered", "user.logged_in", "user.logged_out", "user.updated",
+    "user.role_changed",
+    "project.created", "project.updated", "project.deleted",
+    "project.status_changed", "project.shared", "project.unshared",
+    "project.exported",
+    "artifact.created", "artifact.updated", "artifact.deleted",
+    "artifact.linked", "artifact.unlinked", "artifact.moved",
+    "comment.added", "comment.edited", "comment.deleted",
+    "thread.resolved", "thread.reopened",
+    "review.requested", "review.responded",
+    "ai.suggestion_generated", "ai.suggestion_accepted",
+    "ai.suggestion_rejected", "ai.suggestion_modified",
+    "mastery.checkpoint_started", "mastery.checkpoint_passed",
+    "mastery.checkpoint_failed", "mastery.tier_upgraded",
+    "mastery.ai_level_unlocked",
+    "validation.citation_verified", "validation.citation_flagged",
+    "validation.red_flag_detected",
+    "export.requested", "export.completed", "export.blocked",
+    "export.integrity_report",
+    "admin.advisor_override", "admin.bulk_operation",
+    "submission_unit.state_changed", "artifact.state_changed",
+)
+ARTIFACT_TYPES = (
+    "section", "claim", "evidence", "source", "note", "method", "result",
+    "discussion",
+)
+
+# (table, column, enum type name, values, previous VARCHAR length)
+COLUMNS = (
+    ("event_logs", "event_type", "event_type", EVENT_TYPES, 100),
+    ("artifacts", "artifact_type", "artifact_type", ARTIFACT_TYPES, 50),
+)
+
+
+def upgrade() -> None:
+    # SQLite has no enum types; the model keeps VARCHAR there
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column, type_name, values, _ in COLUMNS:
+        postgresql.ENUM(*values, name=type_name).create(op.get_bind(), checkfirst=True)
+        # Rewrites the table (and each event_logs partition) and rebuilds
+        # the indexes on the column
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {type_name} USING {column}::{type_name}"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column, type_name, _, length in COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE varchar({length}) USING {column}::text"
+        )
+        postgresql.ENUM(name=type_name).drop(op.get_bind(), checkfirst=True)
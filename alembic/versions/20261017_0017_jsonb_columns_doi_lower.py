@@ -0,0 +1,47 @@
+"""JSONB for artifact/source/evidence/review JSON columns; lower(doi) index
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0017"
+down_revision: Union[str, None] = "0016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_COLUMNS = (
+    ("artifacts", "extra_data"),
+    ("evidence", "source_refs"),
+    ("sources", "citation_data"),
+    ("review_requests", "required_changes"),
+)
+
+
+def upgrade() -> None:
+    # SQLite stores JSON as text either way; only PostgreSQL changes type
+    if op.get_bind().dialect.name == "postgresql":
+        for table, column in JSON_COLUMNS:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb"
+            )
+
+    # Source lookups match DOIs case-insensitively
+    op.drop_index("ix_sources_doi", table_name="sources")
+    op.create_index("ix_sources_doi_lower", "sources", [sa.text("lower(doi)")])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sources_doi_lower", table_name="sources")
+    op.create_index("ix_sources_doi", "sources", ["doi"])
+
+    if op.get_bind().dialect.name == "postgresql":
+        for table, column in JSON_COLUMNS:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE json USING {column}::json"
+            )
@@ -0,0 +1,57 @@
+"""Partial indexes over live artifacts and open comment threads; advisor queue index
+
+Revision ID: 0018
+Revises: 0017
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0018"
+down_revision: Union[str, None] = "0017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ARTIFACT_INDEXES = (
+    ("ix_artifacts_project_parent", ["project_id", "parent_id"]),
+    ("ix_artifacts_project_type", ["project_id", "artifact_type"]),
+)
+
+
+def _unresolved_predicate() -> sa.TextClause:
+    if op.get_bind().dialect.name == "postgresql":
+        return sa.text("resolved = false")
+    return sa.text("resolved = 0")
+
+
+def upgrade() -> None:
+    # Artifact reads filter on deleted_at IS NULL; index only live rows
+    live = sa.text("deleted_at IS NULL")
+    for name, columns in ARTIFACT_INDEXES:
+        op.drop_index(name, table_name="artifacts")
+        op.create_index(name, "artifacts", columns, postgresql_where=live, sqlite_where=live)
+
+    unresolved = _unresolved_predicate()
+    op.create_index(
+        "ix_comment_threads_unresolved",
+        "comment_threads",
+        ["artifact_id"],
+        postgresql_where=unresolved,
+        sqlite_where=unresolved,
+    )
+    op.create_index(
+        "ix_review_requests_reviewer_time",
+        "review_requests",
+        ["reviewer_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_review_requests_reviewer_time", table_name="review_requests")
+    op.drop_index("ix_comment_threads_unresolved", table_name="comment_threads")
+    for name, columns in ARTIFACT_INDEXES:
+        op.drop_index(name, table_name="artifacts")
+        op.create_index(name, "artifacts", columns)
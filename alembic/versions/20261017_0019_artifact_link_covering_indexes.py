@@ -0,0 +1,47 @@
+"""Covering indexes for artifact link traversal in both directions
+
+Revision ID: 0019
+Revises: 0018
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0019"
+down_revision: Union[str, None] = "0018"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # INCLUDE is PostgreSQL-only; SQLite gets the plain key columns.
+    # The single-column source index duplicates the composite's prefix.
+    op.drop_index("ix_artifact_links_source_artifact_id", table_name="artifact_links")
+    op.drop_index("ix_artifact_links_source_target", table_name="artifact_links")
+    op.create_index(
+        "ix_artifact_links_source_target",
+        "artifact_links",
+        ["source_artifact_id", "target_artifact_id"],
+        postgresql_include=["link_type", "strength"],
+    )
+    op.drop_index("ix_artifact_links_target_artifact_id", table_name="artifact_links")
+    op.create_index(
+        "ix_artifact_links_target_cover",
+        "artifact_links",
+        ["target_artifact_id"],
+        postgresql_include=["source_artifact_id", "link_type", "strength"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_artifact_links_target_cover", table_name="artifact_links")
+    op.create_index("ix_artifact_links_target_artifact_id", "artifact_links", ["target_artifact_id"])
+    op.drop_index("ix_artifact_links_source_target", table_name="artifact_links")
+    op.create_index(
+        "ix_artifact_links_source_target",
+        "artifact_links",
+        ["source_artifact_id", "target_artifact_id"],
+    )
+    op.create_index("ix_artifact_links_source_artifact_id", "artifact_links", ["source_artifact_id"])
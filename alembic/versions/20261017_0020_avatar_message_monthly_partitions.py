@@ -0,0 +1,115 @@
+"""Avatar messages range-partitioned by created_at, one partition per month (PostgreSQL)
+
+Revision ID: 0020
+Revises: 0019
+Create Date: 2026-10-17
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0020"
+down_revision: Union[str, None] = "0019"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same window as the event log (migration 0010); the app tops it up at
+# startup (src.kernel.events.partitions)
+MONTHS_AHEAD = 3
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + (month.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_constraints() -> None:
+    # LIKE ... INCLUDING CONSTRAINTS only copies CHECK constraints
+    op.create_foreign_key(
+        "avatar_messages_project_id_fkey",
+        "avatar_messages",
+        "research_projects",
+        ["project_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    op.create_foreign_key(
+        "avatar_messages_user_id_fkey",
+        "avatar_messages",
+        "users",
+        ["user_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    # Indexes on the partitioned parent cascade to every partition
+    op.create_index(
+        "ix_avatar_messages_project_user_created",
+        "avatar_messages",
+        ["project_id", "user_id", "created_at"],
+    )
+
+
+def upgrade() -> None:
+    # Declarative partitioning only exists on PostgreSQL; SQLite keeps one table
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.rename_table("avatar_messages", "avatar_messages_unpartitioned")
+    op.execute(
+        "ALTER TABLE avatar_messages_unpartitioned "
+        "RENAME CONSTRAINT avatar_messages_pkey TO avatar_messages_unpartitioned_pkey"
+    )
+    # The partition key must be part of the primary key, so it becomes
+    # (id, created_at); ids stay unique because they are generated UUIDs
+    op.execute(
+        "CREATE TABLE avatar_messages ("
+        "LIKE avatar_messages_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS, "
+        "PRIMARY KEY (id, created_at)"
+        ") PARTITION BY RANGE (created_at)"
+    )
+
+    oldest = bind.execute(
+        sa.text("SELECT min(created_at) FROM avatar_messages_unpartitioned")
+    ).scalar()
+    current = date.today().replace(day=1)
+    month = oldest.date().replace(day=1) if oldest else current
+    last = _add_months(current, MONTHS_AHEAD)
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE avatar_messages_y{month.year:04d}m{month.month:02d} "
+            f"PARTITION OF avatar_messages FOR VALUES FROM ('{month.isoformat()}') "
+            f"TO ('{_add_months(month, 1).isoformat()}')"
+        )
+        month = _add_months(month, 1)
+    # Catches rows outside the pre-created range instead of failing the insert
+    op.execute("CREATE TABLE avatar_messages_default PARTITION OF avatar_messages DEFAULT")
+
+    op.execute("INSERT INTO avatar_messages SELECT * FROM avatar_messages_unpartitioned")
+    op.drop_table("avatar_messages_unpartitioned")
+    _create_constraints()
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.rename_table("avatar_messages", "avatar_messages_partitioned")
+    op.execute(
+        "ALTER TABLE avatar_messages_partitioned "
+        "RENAME CONSTRAINT avatar_messages_pkey TO avatar_messages_partitioned_pkey"
+    )
+    op.execute(
+        "CREATE TABLE avatar_messages ("
+        "LIKE avatar_messages_partitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS, "
+        "PRIMARY KEY (id)"
+        ")"
+    )
+    op.execute("INSERT INTO avatar_messages SELECT * FROM avatar_messages_partitioned")
+    # Dropping the parent drops every attached partition with it
+    op.drop_table("avatar_messages_partitioned")
+    _create_constraints()
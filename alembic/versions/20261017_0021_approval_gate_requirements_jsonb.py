@@ -0,0 +1,32 @@
+"""approval_gates.requirements stored as JSONB instead of JSON text
+
+Revision ID: 0021
+Revises: 0020
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0021"
+down_revision: Union[str, None] = "0020"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SQLite already holds the same JSON text; only PostgreSQL changes type
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            "ALTER TABLE approval_gates "
+            "ALTER COLUMN requirements TYPE jsonb USING requirements::jsonb"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            "ALTER TABLE approval_gates "
+            "ALTER COLUMN requirements TYPE text USING requirements::text"
+        )
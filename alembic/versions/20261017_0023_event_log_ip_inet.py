@@ -0,0 +1,43 @@
+"""Event log ip_address stored as native inet (PostgreSQL)
+
+Revision ID: 0023
+Revises: 0022
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0023"
+down_revision: Union[str, None] = "0022"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SQLite has no inet type; the column stays String(45)
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    # Older rows may hold unvalidated X-Forwarded-For values; those become NULL
+    # instead of failing the conversion
+    op.execute(
+        "CREATE FUNCTION pg_temp.try_inet(value text) RETURNS inet AS $$ "
+        "BEGIN RETURN value::inet; "
+        "EXCEPTION WHEN others THEN RETURN NULL; "
+        "END $$ LANGUAGE plpgsql IMMUTABLE"
+    )
+    op.execute(
+        "ALTER TABLE event_logs "
+        "ALTER COLUMN ip_address TYPE inet USING pg_temp.try_inet(ip_address)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    # host() drops the /32 or /128 mask that inet::text would add
+    op.execute(
+        "ALTER TABLE event_logs "
+        "ALTER COLUMN ip_address TYPE varchar(45) USING host(ip_address)"
+    )
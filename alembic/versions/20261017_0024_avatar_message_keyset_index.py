@@ -0,0 +1,33 @@
+"""Avatar message history index gains id as a keyset tie-breaker
+
+Revision ID: 0024
+Revises: 0023
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0024"
+down_revision: Union[str, None] = "0023"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_avatar_messages_project_user_created", table_name="avatar_messages")
+    op.create_index(
+        "ix_avatar_messages_project_user_created",
+        "avatar_messages",
+        ["project_id", "user_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_avatar_messages_project_user_created", table_name="avatar_messages")
+    op.create_index(
+        "ix_avatar_messages_project_user_created",
+        "avatar_messages",
+        ["project_id", "user_id", "created_at"],
+    )
@@ -0,0 +1,42 @@
+"""Permission lookup index limited to unrevoked grants, covering expiry and level
+
+Revision ID: 0025
+Revises: 0024
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0025"
+down_revision: Union[str, None] = "0024"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = ["user_id", "resource_type", "resource_id"]
+
+
+def _unrevoked_predicate() -> sa.TextClause:
+    if op.get_bind().dialect.name == "postgresql":
+        return sa.text("revoked = false")
+    return sa.text("revoked = 0")
+
+
+def upgrade() -> None:
+    unrevoked = _unrevoked_predicate()
+    op.drop_index("ix_permissions_user_resource", table_name="permissions")
+    op.create_index(
+        "ix_permissions_user_resource",
+        "permissions",
+        COLUMNS,
+        postgresql_where=unrevoked,
+        sqlite_where=unrevoked,
+        postgresql_include=["expires_at", "level"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_permissions_user_resource", table_name="permissions")
+    op.create_index("ix_permissions_user_resource", "permissions", COLUMNS)
@@ -0,0 +1,37 @@
+"""Partial index on permissions.expires_at for the expiry sweep
+
+Revision ID: 0026
+Revises: 0025
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0026"
+down_revision: Union[str, None] = "0025"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _expiring_predicate() -> sa.TextClause:
+    if op.get_bind().dialect.name == "postgresql":
+        return sa.text("revoked = false AND expires_at IS NOT NULL")
+    return sa.text("revoked = 0 AND expires_at IS NOT NULL")
+
+
+def upgrade() -> None:
+    expiring = _expiring_predicate()
+    op.create_index(
+        "ix_permissions_cleanup",
+        "permissions",
+        ["expires_at"],
+        postgresql_where=expiring,
+        sqlite_where=expiring,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_permissions_cleanup", table_name="permissions")
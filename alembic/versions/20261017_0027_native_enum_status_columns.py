@@ -0,0 +1,67 @@
+"""Native PostgreSQL enum types for permission, project, submission unit and user enums
+
+Revision ID: 0027
+Revises: 0026
+Create Date: 2026-10-17
+
+"""
+from typing import Optional, Sequence, Union
+
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0027"
+down_revision: Union[str, None] = "0026"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PERMISSION_LEVELS = ("none", "view", "comment", "edit", "admin", "owner")
+RESOURCE_TYPES = ("project", "artifact", "comment")
+PROJECT_STATUSES = ("draft", "active", "submitted", "archived")
+SUBMISSION_UNIT_STATES = (
+    "draft", "ready_for_review", "under_review", "revisions_required",
+    "approved", "locked", "archived",
+)
+USER_ROLES = ("student", "advisor", "examiner", "admin")
+
+# (table, column, enum type name, values, server default)
+COLUMNS = (
+    ("permissions", "level", "permission_level", PERMISSION_LEVELS, None),
+    ("permissions", "resource_type", "resource_type", RESOURCE_TYPES, None),
+    ("research_projects", "status", "project_status", PROJECT_STATUSES, None),
+    ("submission_units", "state", "submission_unit_state", SUBMISSION_UNIT_STATES, "draft"),
+    ("users", "role", "user_role", USER_ROLES, None),
+)
+
+
+def _alter(table: str, column: str, new_type: str, default: Optional[str]) -> None:
+    # A VARCHAR default cannot be cast along with the column
+    if default is not None:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+    op.execute(
+        f"ALTER TABLE {table} ALTER COLUMN {column} "
+        f"TYPE {new_type} USING {column}::text::{new_type}"
+    )
+    if default is not None:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"SET DEFAULT '{default}'::{new_type}"
+        )
+
+
+def upgrade() -> None:
+    # SQLite has no enum types; the models keep VARCHAR there
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column, type_name, values, default in COLUMNS:
+        postgresql.ENUM(*values, name=type_name).create(op.get_bind(), checkfirst=True)
+        # Rewrites the table and rebuilds the indexes on the column
+        _alter(table, column, type_name, default)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column, type_name, _, default in COLUMNS:
+        _alter(table, column, "varchar(50)", default)
+        postgresql.ENUM(name=type_name).drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,23 @@
+"""Drop ix_checkpoint_attempts_user_id, covered by the composite user/project/type index
+
+Revision ID: 0028
+Revises: 0027
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0028"
+down_revision: Union[str, None] = "0027"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_checkpoint_attempts_user_id", table_name="checkpoint_attempts")
+
+
+def downgrade() -> None:
+    op.create_index("ix_checkpoint_attempts_user_id", "checkpoint_attempts", ["user_id"])
@@ -0,0 +1,57 @@
+"""Server-side gen_random_uuid() id defaults for user, project, permission, mastery and review tables
+
+Revision ID: 0029
+Revises: 0028
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0029"
+down_revision: Union[str, None] = "0028"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = (
+    "users",
+    "refresh_tokens",
+    "research_projects",
+    "project_shares",
+    "permissions",
+    "submission_units",
+    "review_responses",
+    "user_mastery_progress",
+    "checkpoint_attempts",
+    "content_verification_requests",
+)
+
+
+def upgrade() -> None:
+    # SQLite cannot alter a column default in place; fresh SQLite databases get
+    # it from the model via create_all
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "id",
+            server_default=sa.text("gen_random_uuid()"),
+            existing_type=sa.Uuid(),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "id",
+            server_default=None,
+            existing_type=sa.Uuid(),
+            existing_nullable=False,
+        )
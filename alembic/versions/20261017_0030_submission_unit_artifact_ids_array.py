@@ -0,0 +1,48 @@
+"""Submission unit artifact_ids stored as uuid[] with a GIN index (PostgreSQL)
+
+Revision ID: 0030
+Revises: 0029
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0030"
+down_revision: Union[str, None] = "0029"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SQLite has no array type; the column stays a JSON array there
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    # USING cannot contain a subquery, so unpack the JSON array in a function
+    op.execute(
+        "CREATE FUNCTION pg_temp.json_to_uuids(value json) RETURNS uuid[] AS $$ "
+        "SELECT array_agg(element::uuid) FROM json_array_elements_text(value) AS element "
+        "$$ LANGUAGE sql IMMUTABLE"
+    )
+    op.execute(
+        "ALTER TABLE submission_units ALTER COLUMN artifact_ids TYPE uuid[] "
+        "USING CASE WHEN artifact_ids IS NULL THEN NULL "
+        "ELSE coalesce(pg_temp.json_to_uuids(artifact_ids), '{}'::uuid[]) END"
+    )
+    op.create_index(
+        "ix_submission_units_artifact_ids",
+        "submission_units",
+        ["artifact_ids"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("ix_submission_units_artifact_ids", table_name="submission_units")
+    op.execute(
+        "ALTER TABLE submission_units ALTER COLUMN artifact_ids TYPE json "
+        "USING to_json(artifact_ids)"
+    )
@@ -2,6 +2,7 @@
 FastAPI dependencies for authentication, authorization, and database sessions.
 """
 
+import socket
 import uuid
 from typing import Annotated, Optional
 
@@ -106,12 +107,31 @@ def get_request_id(request: Request) -> Optional[str]:
     return getattr(request.state, "request_id", None)
 
 
+def _valid_ip(value: Optional[str]) -> Optional[str]:
+    """Return `value` if it is a literal IPv4/IPv6 address, else None."""
+    if not value:
+        return None
+    # inet_pton parses in C; much cheaper than ipaddress.ip_address per request
+    for family in (socket.AF_INET, socket.AF_INET6):
+        try:
+            socket.inet_pton(family, value)
+            return value
+        except OSError:
+            continue
+    return None
+
+
 def get_client_ip(request: Request) -> Optional[str]:
-    """Extract client IP from request."""
+    """
+    Extract client IP from request.
+    
+    X-Forwarded-For is client-controlled, so anything that is not a plain
+    IP address is dropped rather than written to the audit log's inet column.
+    """
     forwarded = request.headers.get("X-Forwarded-For")
     if forwarded:
-        return forwarded.split(",")[0].strip()
-    return request.client.host if request.client else None
+        return _valid_ip(forwarded.split(",")[0].strip())
+    return _valid_ip(request.client.host) if request.client else None
 
 
 def get_user_agent(request: Request) -> Optional[str]:
@@ -0,0 +1,21 @@
+"""
+Permission cache middleware.
+
+Scopes PermissionService's check cache to one request, so the dependency
+check and any repeated check in the handler share a single DB lookup.
+"""
+
+from typing import Callable
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.kernel.permissions import permission_cache_scope
+
+
+class PermissionCacheMiddleware(BaseHTTPMiddleware):
+    """Give each request a fresh permission check cache."""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        with permission_cache_scope():
+            return await call_next(request)
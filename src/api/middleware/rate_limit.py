@@ -31,7 +31,7 @@ def _get_user_id_from_jwt(request: Request) -> Optional[str]:
     if not token:
         return None
     try:
-        from jose import jwt
+        import jwt
         settings = get_settings()
         payload = jwt.decode(
             token,
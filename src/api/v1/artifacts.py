@@ -8,7 +8,7 @@ from typing import List, Optional
 
 from fastapi import APIRouter, HTTPException, Query, Request, status
 from sqlalchemy import select, and_, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only
 
 from src.api.deps import (
     DbSession,
@@ -36,6 +36,7 @@ from src.kernel.models.artifact import (
     Artifact,
     ArtifactVersion,
     ArtifactLink,
+    artifact_detail_options,
     compute_content_hash,
     ContributionCategory,
 )
@@ -187,11 +188,7 @@ async def get_artifact(
             Artifact.id == artifact_id,
             Artifact.deleted_at.is_(None),
         )
-    ).options(
-        selectinload(Artifact.children),
-        selectinload(Artifact.outgoing_links),
-        selectinload(Artifact.incoming_links),
-    )
+    ).options(*artifact_detail_options())
     
     result = await db.execute(query)
     artifact = result.scalar_one_or_none()
@@ -294,7 +291,7 @@ async def update_artifact(
     user: CurrentUser,
     db: DbSession,
 ):
-    """Update an artifact. Creates a new version."""
+    """Update an artifact. Creates a new version if the title or content changed."""
     query = select(Artifact).where(
         and_(
             Artifact.id == artifact_id,
@@ -323,12 +320,14 @@ async def update_artifact(
     
     previous_hash = artifact.content_hash
     previous_content = artifact.content
+    previous_title = artifact.title
 
     # Update fields
     if data.title is not None:
         artifact.title = data.title
 
-    if data.content is not None:
+    # Unchanged content keeps its hash; no need to hash it again
+    if data.content is not None and data.content != previous_content:
         artifact.content = data.content
         artifact.content_hash = compute_content_hash(data.content)
     
@@ -338,20 +337,20 @@ async def update_artifact(
     if data.metadata is not None:
         artifact.extra_data = data.metadata
     
-    # Increment version
-    artifact.version += 1
-    
-    # Create version record
-    version = ArtifactVersion(
-        artifact_id=artifact.id,
-        version_number=artifact.version,
-        title=artifact.title,
-        content=artifact.content,
-        content_hash=artifact.content_hash,
-        created_by=user.id,
-        contribution_category=artifact.contribution_category,
-    )
-    db.add(version)
+    # Versions snapshot title and content; a position/metadata-only edit (or
+    # resubmitting the same text) would store a duplicate of the latest one
+    if artifact.content_hash != previous_hash or artifact.title != previous_title:
+        artifact.version += 1
+        version = ArtifactVersion(
+            artifact_id=artifact.id,
+            version_number=artifact.version,
+            title=artifact.title,
+            content=artifact.content,
+            content_hash=artifact.content_hash,
+            created_by=user.id,
+            contribution_category=artifact.contribution_category,
+        )
+        db.add(version)
     
     # Log the event
     event_store = EventStore(db)
@@ -674,12 +673,23 @@ async def get_artifact_tree(
 ):
     """Get the full artifact tree for a project."""
     try:
-        # Get all artifacts for the project
+        # Get all artifacts for the project. Only the tree's own columns are
+        # read: content can be large (TOASTed) and the tree never shows it.
         query = select(Artifact).where(
             and_(
                 Artifact.project_id == project_id,
                 Artifact.deleted_at.is_(None),
             )
+        ).options(
+            load_only(
+                Artifact.id,
+                Artifact.parent_id,
+                Artifact.artifact_type,
+                Artifact.title,
+                Artifact.position,
+                Artifact.version,
+                raiseload=True,
+            )
         ).order_by(Artifact.position)
 
         result = await db.execute(query)
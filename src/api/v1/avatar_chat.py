@@ -15,7 +15,7 @@ from sqlalchemy import select, and_
 
 from src.api.deps import CurrentUser, DbSession, RequireProjectView
 from src.config import get_settings
-from src.kernel.models.avatar_conversation import AvatarMessage
+from src.kernel.models.avatar_conversation import AvatarMessage, count_tokens, fetch_recent
 from src.kernel.models.mastery import UserMasteryProgress
 from src.logging_config import get_logger
 
@@ -25,6 +25,9 @@ router = APIRouter()
 # Maximum conversation history messages to load per turn
 MAX_HISTORY_MESSAGES = 20
 
+# Token budget for that history, leaving room for the prompt and reply
+MAX_HISTORY_TOKENS = 12_000
+
 
 # ── Schemas ──────────────────────────────────────────────────────────────
 
@@ -193,20 +196,14 @@ async def _load_history(
     db, user_id: uuid.UUID, project_id: uuid.UUID,
 ) -> List[AvatarMessage]:
     """Load the most recent conversation messages for this user+project."""
-    q = (
-        select(AvatarMessage)
-        .where(
-            and_(
-                AvatarMessage.project_id == project_id,
-                AvatarMessage.user_id == user_id,
-                AvatarMessage.role.in_(["user", "assistant"]),
-            )
-        )
-        .order_by(AvatarMessage.created_at.desc())
-        .limit(MAX_HISTORY_MESSAGES)
+    rows = await fetch_recent(
+        db,
+        project_id,
+        user_id,
+        limit=MAX_HISTORY_MESSAGES,
+        roles=("user", "assistant"),
+        token_budget=MAX_HISTORY_TOKENS,
     )
-    result = await db.execute(q)
-    rows = list(result.scalars().all())
     rows.reverse()  # oldest first
     return rows
 
@@ -222,7 +219,7 @@ async def _save_message(
         role=role,
         content=content,
         teaching_mode=teaching_mode,
-        token_count=len(content.split()) * 2,  # rough estimate
+        token_count=count_tokens(content),
     )
     db.add(msg)
     await db.flush()
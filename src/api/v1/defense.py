@@ -81,7 +81,7 @@ async def get_guidance_next(
                 )
             )
             lc = await db.execute(
-                select(func.count(ArtifactLink.id)).where(
+                select(func.count()).select_from(ArtifactLink).where(
                     ArtifactLink.source_artifact_id.in_(subq)
                 )
             )
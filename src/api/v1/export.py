@@ -121,13 +121,15 @@ async def get_integrity_report(
     total_words = sum(len(a.content.split()) for a in artifacts)
     source_count = len([a for a in artifacts if a.artifact_type == ArtifactType.SOURCE])
     
-    # Count links
+    # Count links per source artifact (also tells which claims have evidence
+    # without loading each claim's outgoing_links)
     from src.kernel.models.artifact import ArtifactLink
-    links_query = select(func.count(ArtifactLink.id)).where(
+    links_query = select(ArtifactLink.source_artifact_id, func.count()).where(
         ArtifactLink.source_artifact_id.in_([a.id for a in artifacts])
-    )
+    ).group_by(ArtifactLink.source_artifact_id)
     links_result = await db.execute(links_query)
-    total_links = links_result.scalar() or 0
+    link_counts = dict(links_result.all())
+    total_links = sum(link_counts.values())
     
     # Contribution breakdown
     contribution_counts = {
@@ -200,7 +202,7 @@ async def get_integrity_report(
     if claims:
         # Check if claims have evidence links
         for claim in claims:
-            if len(claim.outgoing_links) == 0:
+            if not link_counts.get(claim.id):
                 items.append(IntegrityReportItem(
                     category="Evidence",
                     status="warning",
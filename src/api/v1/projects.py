@@ -5,11 +5,12 @@ Project endpoints.
 import asyncio
 import logging
 import uuid
+from functools import lru_cache
 from typing import List, Optional
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request, status
-from sqlalchemy import select, and_, or_, func, update
-from sqlalchemy.orm import selectinload
+from sqlalchemy import insert, select, and_, or_, func, update
+from sqlalchemy.orm import raiseload, selectinload
 
 from src.api.deps import (
     DbSession,
@@ -35,7 +36,7 @@ from src.kernel.models.artifact import Artifact, ArtifactType, ArtifactVersion,
 from src.kernel.models.user import User
 from src.kernel.models.event_log import EventType
 from src.kernel.events.event_store import EventStore
-from src.kernel.permissions.permission_service import PermissionService
+from src.kernel.permissions.permission_service import PermissionService, clear_permission_cache
 
 logger = logging.getLogger(__name__)
 
@@ -777,6 +778,12 @@ Use the citation format required by your institution.
 ]
 
 
+@lru_cache(maxsize=None)
+def _placeholder_hash(placeholder: str) -> str:
+    """Content hash of a scaffold placeholder; the set of templates is fixed."""
+    return compute_content_hash(placeholder)
+
+
 async def _scaffold_project_structure(
     db,
     project_id,
@@ -785,44 +792,40 @@ async def _scaffold_project_structure(
 ) -> int:
     """Create initial dissertation sections for a new project. Returns count created.
 
-    Pre-generates all IDs to avoid multiple flush() calls inside the loop,
-    which triggers 'cannot commit transaction - SQL statements in progress'
-    on aiosqlite.
+    Artifacts and their first versions are each written with one bulk
+    INSERT; the project row is flushed first so the foreign keys resolve.
     """
-    from src.kernel.models.base import generate_uuid
+    from src.kernel.models.base import bulk_insert
 
     sections = _SCAFFOLD_SECTIONS.get(discipline_type, _SCAFFOLD_SECTIONS["mixed"])
-    count = 0
-    for position, (title, artifact_type, placeholder) in enumerate(sections):
-        content_hash = compute_content_hash(placeholder)
-        art_id = generate_uuid()
-        artifact = Artifact(
-            id=art_id,
-            project_id=project_id,
-            artifact_type=artifact_type,
-            title=title,
-            content=placeholder,
-            content_hash=content_hash,
-            position=position,
-            contribution_category=ContributionCategory.PRIMARILY_HUMAN,
-            ai_modification_ratio=1.0,
-        )
-        db.add(artifact)
-        # Create initial version (pre-generated id avoids needing flush per artifact)
-        version = ArtifactVersion(
-            id=generate_uuid(),
-            artifact_id=art_id,
-            version_number=1,
-            title=title,
-            content=placeholder,
-            content_hash=content_hash,
-            created_by=user_id,
-            contribution_category=ContributionCategory.PRIMARILY_HUMAN,
-        )
-        db.add(version)
-        count += 1
-    # NOTE: caller is responsible for flushing / committing
-    return count
+    await db.flush()
+    artifact_ids = await Artifact.bulk_create(db, [
+        {
+            "project_id": project_id,
+            "artifact_type": artifact_type,
+            "title": title,
+            "content": placeholder,
+            "content_hash": _placeholder_hash(placeholder),
+            "position": position,
+            "contribution_category": ContributionCategory.PRIMARILY_HUMAN,
+            "ai_modification_ratio": 1.0,
+        }
+        for position, (title, artifact_type, placeholder) in enumerate(sections)
+    ])
+    await bulk_insert(db, ArtifactVersion, [
+        {
+            "artifact_id": art_id,
+            "version_number": 1,
+            "title": title,
+            "content": placeholder,
+            "content_hash": _placeholder_hash(placeholder),
+            "created_by": user_id,
+            "contribution_category": ContributionCategory.PRIMARILY_HUMAN,
+        }
+        for art_id, (title, _, placeholder) in zip(artifact_ids, sections)
+    ])
+    # NOTE: caller is responsible for committing
+    return len(artifact_ids)
 
 
 # ---------------------------------------------------------------------------
@@ -849,7 +852,7 @@ async def _background_generate_dissertation(
     """
     from src.database import async_session_maker
     from src.ai.dissertation_generator_v2 import generate_dissertation
-    from src.kernel.models.base import generate_uuid
+    from src.kernel.models.base import generate_uuid7
 
     import sys
     logger.info("Background generation v2 starting for project %s", project_id)
@@ -865,58 +868,62 @@ async def _background_generate_dissertation(
         print(f"[BACKGROUND] Generation complete: {dissertation.total_words} words", file=sys.stderr, flush=True)
 
         # Step 2: Update each artifact with the generated content
+        # All sections are fully AI-generated
+        contrib = ContributionCategory.UNMODIFIED_AI
+        ai_ratio = 0.0
+        # Hash before opening the transaction
+        hashes = [compute_content_hash(section.content) for section in dissertation.sections]
+
         async with async_session_maker() as db:
             try:
-                updated_count = 0
-                for section in dissertation.sections:
-                    # Find the matching artifact by title
-                    query = select(Artifact).where(
+                # Match sections to artifacts by title with one query
+                result = await db.execute(
+                    select(Artifact.title, Artifact.id).where(
                         and_(
                             Artifact.project_id == project_id,
-                            Artifact.title == section.title,
                             Artifact.deleted_at.is_(None),
                         )
                     )
-                    result = await db.execute(query)
-                    artifact = result.scalar_one_or_none()
-
-                    if not artifact:
+                )
+                artifact_ids = {}
+                for title, art_id in result.all():
+                    artifact_ids.setdefault(title, art_id)
+
+                artifact_rows = []
+                version_rows = []
+                for section, new_hash in zip(dissertation.sections, hashes):
+                    art_id = artifact_ids.get(section.title)
+                    if art_id is None:
                         logger.warning(
                             "Artifact '%s' not found for project %s, skipping",
                             section.title, project_id,
                         )
                         continue
 
-                    # All sections are fully AI-generated
-                    contrib = ContributionCategory.UNMODIFIED_AI
-                    ai_ratio = 0.0
-
-                    # Use UPDATE statement to ensure the change is persisted
-                    new_hash = compute_content_hash(section.content)
-                    await db.execute(
-                        update(Artifact)
-                        .where(Artifact.id == artifact.id)
-                        .values(
-                            content=section.content,
-                            content_hash=new_hash,
-                            contribution_category=contrib,
-                            ai_modification_ratio=ai_ratio,
-                        )
-                    )
-
-                    # Create a new version with the generated content
-                    version = ArtifactVersion(
-                        id=generate_uuid(),
-                        artifact_id=artifact.id,
-                        version_number=2,  # version 1 was the placeholder
-                        title=section.title,
-                        content=section.content,
-                        content_hash=new_hash,
-                        created_by=user_id,
-                        contribution_category=contrib,
-                    )
-                    db.add(version)
-                    updated_count += 1
+                    artifact_rows.append({
+                        "id": art_id,
+                        "content": section.content,
+                        "content_hash": new_hash,
+                        "contribution_category": contrib,
+                        "ai_modification_ratio": ai_ratio,
+                    })
+                    # New version with the generated content
+                    version_rows.append({
+                        "id": generate_uuid7(),
+                        "artifact_id": art_id,
+                        "version_number": 2,  # version 1 was the placeholder
+                        "title": section.title,
+                        "content": section.content,
+                        "content_hash": new_hash,
+                        "created_by": user_id,
+                        "contribution_category": contrib,
+                    })
+                updated_count = len(artifact_rows)
+
+                # One executemany each: bulk UPDATE by primary key, bulk INSERT
+                if artifact_rows:
+                    await db.execute(update(Artifact), artifact_rows)
+                    await db.execute(insert(ArtifactVersion), version_rows)
 
                 await db.flush()
                 await db.commit()
@@ -1045,6 +1052,8 @@ async def list_projects(
 ):
     """List user's projects (owned and shared)."""
     # Get owned projects
+    # Rows are built from columns only; raiseload turns any lazy load
+    # added later (an N+1 per project) into an error
     query = select(ResearchProject, User).join(
         User, ResearchProject.owner_id == User.id
     ).where(
@@ -1052,41 +1061,13 @@ async def list_projects(
             ResearchProject.owner_id == user.id,
             ResearchProject.deleted_at.is_(None),
         )
-    )
+    ).options(raiseload("*"))
     
     if status_filter:
         query = query.where(ResearchProject.status == status_filter)
     
     result = await db.execute(query)
-    owned_projects = result.all()
-    
-    projects = []
-    for project, owner in owned_projects:
-        # Count artifacts
-        count_query = select(func.count(Artifact.id)).where(
-            and_(
-                Artifact.project_id == project.id,
-                Artifact.deleted_at.is_(None),
-            )
-        )
-        count_result = await db.execute(count_query)
-        artifact_count = count_result.scalar() or 0
-        
-        projects.append(ProjectListResponse(
-            id=project.id,
-            title=project.title,
-            description=project.description,
-            discipline_type=_enum_val(project.discipline_type),
-            status=_enum_val(project.status),
-            owner_id=project.owner_id,
-            owner_name=owner.full_name,
-            integrity_score=project.integrity_score,
-            is_owner=True,
-            permission_level="owner",
-            artifact_count=artifact_count,
-            created_at=project.created_at,
-            updated_at=project.updated_at,
-        ))
+    rows = [(project, owner, None) for project, owner in result.all()]
     
     # Get shared projects
     if include_shared:
@@ -1099,38 +1080,44 @@ async def list_projects(
                 ProjectShare.user_id == user.id,
                 ResearchProject.deleted_at.is_(None),
             )
-        )
+        ).options(raiseload("*"))
         
         if status_filter:
             shared_query = shared_query.where(ResearchProject.status == status_filter)
         
         shared_result = await db.execute(shared_query)
-        
-        for project, owner, share in shared_result.all():
-            count_query = select(func.count(Artifact.id)).where(
-                and_(
-                    Artifact.project_id == project.id,
-                    Artifact.deleted_at.is_(None),
-                )
+        rows.extend(shared_result.all())
+    
+    # Count artifacts for every listed project in one grouped query
+    artifact_counts = {}
+    if rows:
+        count_query = select(Artifact.project_id, func.count()).where(
+            and_(
+                Artifact.project_id.in_([project.id for project, _, _ in rows]),
+                Artifact.deleted_at.is_(None),
             )
-            count_result = await db.execute(count_query)
-            artifact_count = count_result.scalar() or 0
-            
-            projects.append(ProjectListResponse(
-                id=project.id,
-                title=project.title,
-                description=project.description,
-discipline_type=_enum_val(project.discipline_type),
+        ).group_by(Artifact.project_id)
+        count_result = await db.execute(count_query)
+        artifact_counts = dict(count_result.all())
+    
+    projects = [
+        ProjectListResponse(
+            id=project.id,
+            title=project.title,
+            description=project.description,
+            discipline_type=_enum_val(project.discipline_type),
             status=_enum_val(project.status),
-                owner_id=project.owner_id,
-                owner_name=owner.full_name,
-                integrity_score=project.integrity_score,
-                is_owner=False,
-                permission_level=_enum_val(share.permission_level),
-                artifact_count=artifact_count,
-                created_at=project.created_at,
-                updated_at=project.updated_at,
-            ))
+            owner_id=project.owner_id,
+            owner_name=owner.full_name,
+            integrity_score=project.integrity_score,
+            is_owner=share is None,
+            permission_level="owner" if share is None else _enum_val(share.permission_level),
+            artifact_count=artifact_counts.get(project.id, 0),
+            created_at=project.created_at,
+            updated_at=project.updated_at,
+        )
+        for project, owner, share in rows
+    ]
     
     # Sort by updated_at descending
     projects.sort(key=lambda p: p.updated_at, reverse=True)
@@ -1433,6 +1420,8 @@ async def delete_project(
     
     from datetime import datetime, timezone
     project.deleted_at = datetime.now(timezone.utc)
+    # Checks cached earlier in this request still see the live project
+    clear_permission_cache()
     
     # Log the event
     event_store = EventStore(db)
@@ -1513,6 +1502,7 @@ async def share_project(
             invited_by=user.id,
         )
         db.add(share)
+    clear_permission_cache()
     
     # Log the event
     event_store = EventStore(db)
@@ -1595,6 +1585,7 @@ async def remove_collaborator(
         )
     
     await db.delete(share)
+    clear_permission_cache()
     
     # Log the event
     event_store = EventStore(db)
@@ -4,6 +4,7 @@ import uuid
 
 from fastapi import APIRouter, HTTPException, Request, status
 from sqlalchemy import select, and_
+from sqlalchemy.orm import raiseload
 
 from src.api.deps import DbSession, CurrentUser, RequireProjectView, RequireProjectEdit, get_client_ip
 from src.schemas.submission_unit import (
@@ -38,7 +39,7 @@ async def list_submission_units(
         and_(
             SubmissionUnit.project_id == project_id,
         )
-    )
+    ).options(raiseload("*"))  # responses use columns only; no lazy loads per unit
     result = await db.execute(q)
     units = result.scalars().all()
     return [
@@ -83,7 +84,7 @@ async def create_submission_unit(
     unit = SubmissionUnit(
         project_id=project_id,
         title=data.title,
-        artifact_ids=[str(aid) for aid in (data.artifact_ids or [])] if data.artifact_ids else [],
+        artifact_ids=list(data.artifact_ids or []),
         state=SubmissionUnitState.DRAFT,
     )
     db.add(unit)
@@ -4,6 +4,8 @@ Uses SQLAlchemy 2.0 async pattern.
 """
 
 from typing import AsyncGenerator
+
+import orjson
 from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import NullPool
@@ -23,6 +25,7 @@ if is_sqlite:
         echo=settings.debug,
         connect_args={"check_same_thread": False},
         poolclass=NullPool,
+        json_deserializer=orjson.loads,
     )
 
     @event.listens_for(engine.sync_engine, "connect")
@@ -41,6 +44,11 @@ else:
         pool_pre_ping=True,
         pool_size=5,
         max_overflow=10,
+        # Rows per multi-row INSERT ... VALUES statement for bulk inserts
+        # (e.g. EventStore.log_many); gains level off around 1000
+        insertmanyvalues_page_size=1000,
+        # JSON/JSONB results (writes go through JSONPayload's orjson encoder)
+        json_deserializer=orjson.loads,
     )
 
 # Session factory
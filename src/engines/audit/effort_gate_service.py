@@ -74,7 +74,8 @@ class EffortGateService:
             )
         )
         count_q = (
-            select(func.count(ArtifactLink.id))
+            select(func.count())
+            .select_from(ArtifactLink)
             .where(
                 and_(
                     ArtifactLink.source_artifact_id.in_(claim_ids_q.scalar_subquery()),
@@ -9,7 +9,7 @@ import uuid
 from typing import List, Optional
 
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.engines.validation.format_validator import ValidationResult, ValidationStatus
@@ -54,7 +54,8 @@ class CrossProjectChecker:
             .join(ResearchProject, Artifact.project_id == ResearchProject.id)
         )
         if doi:
-            q = q.where(Source.doi == doi)
+            # DOIs are case-insensitive; matches ix_sources_doi_lower
+            q = q.where(func.lower(Source.doi) == doi.lower())
         else:
             q = q.where(Source.isbn == isbn)
         q = q.where(Artifact.deleted_at.is_(None))
@@ -3,6 +3,7 @@ Layer 1: Format Validation - Local validation of citation formats.
 """
 
 import re
+from datetime import datetime
 from enum import Enum
 from typing import Optional, List
 from pydantic import BaseModel
@@ -39,6 +40,7 @@ class FormatValidator:
     # ISBN-10 and ISBN-13 patterns
     ISBN10_PATTERN = re.compile(r'^(?:\d[- ]?){9}[\dXx]$')
     ISBN13_PATTERN = re.compile(r'^(?:978|979)[- ]?(?:\d[- ]?){9}\d$')
+    ISBN_SEPARATOR_PATTERN = re.compile(r'[- ]')
     
     # arXiv pattern
     ARXIV_PATTERN = re.compile(r'^(\d{4}\.\d{4,5}|[a-z\-]+/\d{7})v?\d*$')
@@ -100,7 +102,7 @@ class FormatValidator:
             )
         
         # Clean ISBN
-        isbn_clean = re.sub(r'[- ]', '', isbn.strip())
+        isbn_clean = cls.ISBN_SEPARATOR_PATTERN.sub('', isbn.strip())
         
         # Check format
         if len(isbn_clean) == 10:
@@ -228,8 +230,6 @@ class FormatValidator:
     @classmethod
     def validate_year(cls, year: int) -> ValidationResult:
         """Validate publication year is reasonable."""
-        from datetime import datetime
-        
         current_year = datetime.now().year
         
         if year < 1450:  # Before printing press
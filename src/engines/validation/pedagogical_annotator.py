@@ -19,15 +19,22 @@ Annotation types:
   - CLAIM:      "This is an inferential claim that requires hedging."
 """
 
+import hashlib
 import re
 import uuid
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import orjson
 
 from src.config import get_settings
 from src.logging_config import get_logger
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 logger = get_logger(__name__)
 
 
@@ -40,7 +47,7 @@ class AnnotationType:
     CLAIM = "claim"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PedagogicalAnnotation:
     """One annotation attached to a text range within a section."""
     id: str
@@ -51,7 +58,7 @@ class PedagogicalAnnotation:
     created_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AnnotatedSection:
     """A section with pedagogical annotations attached."""
     section_title: str
@@ -106,7 +113,9 @@ _STRUCTURAL_PATTERNS = [
      "Uses 'before this work' framing – the gold-standard contribution format.",
      AnnotationType.STRUCTURAL),
 
-    (re.compile(r"\b(?:suggests?|indicates?|appears?\s+to|may)\b", re.I),
+    # Catch-all: keep last so the more specific patterns above win. "may" is by
+    # far the most frequent hedge in academic prose, so it leads the alternation.
+    (re.compile(r"\b(?:may|suggests?|indicates?|appears?\s+to)\b", re.I),
      "Uses hedging language – properly scopes an inferential claim.",
      AnnotationType.CLAIM),
 ]
@@ -114,18 +123,16 @@ _STRUCTURAL_PATTERNS = [
 
 # ── Core annotator ───────────────────────────────────────────────────────
 
-def annotate_section_rule_based(
-    text: str,
-    section_title: str = "",
-) -> AnnotatedSection:
-    """
-    Generate pedagogical annotations for a section using rule-based
-    pattern matching.
+def _split_paragraphs(text: str) -> List[str]:
+    """Split text into annotatable paragraphs (more than 8 words each)."""
+    return [p.strip() for p in text.split("\n\n") if p.strip() and len(p.split()) > 8]
 
-    Returns an AnnotatedSection with annotations for each paragraph
-    where a structural/defensive/rhetorical pattern is detected.
-    """
-    paragraphs = [p.strip() for p in text.split("\n\n") if p.strip() and len(p.split()) > 8]
+
+def _annotate_paragraphs(
+    paragraphs: List[str],
+    section_title: str,
+) -> AnnotatedSection:
+    """Apply the rule-based patterns to already-split paragraphs."""
     annotations: List[PedagogicalAnnotation] = []
 
     for i, para in enumerate(paragraphs):
@@ -148,8 +155,122 @@ def annotate_section_rule_based(
     )
 
 
+def annotate_section_rule_based(
+    text: str,
+    section_title: str = "",
+) -> AnnotatedSection:
+    """
+    Generate pedagogical annotations for a section using rule-based
+    pattern matching.
+
+    Returns an AnnotatedSection with annotations for each paragraph
+    where a structural/defensive/rhetorical pattern is detected.
+    """
+    return _annotate_paragraphs(_split_paragraphs(text), section_title)
+
+
+def _build_prompt(paragraphs: List[str], section_title: str) -> str:
+    """Build the deep-annotation prompt from the first 10 paragraphs."""
+    para_text = "\n\n---\n\n".join(
+        f"[Paragraph {i}] {p[:300]}"
+        for i, p in enumerate(islice(paragraphs, 10))
+    )
+    return (
+        "You are a PhD supervisor explaining to a student WHY each "
+        "paragraph in their dissertation exists. For each paragraph below, "
+        "provide:\n"
+        "1. A one-sentence explanation of its PURPOSE (why it exists)\n"
+        "2. What examiner criticism it prevents (if applicable)\n"
+        "3. Classification: STRUCTURAL / DEFENSIVE / RHETORICAL / CLAIM\n\n"
+        "Return JSON array: [{paragraph_index, type, explanation, "
+        "examiner_concern}]\n\n"
+        f"SECTION: {section_title}\n\n"
+        f"PARAGRAPHS:\n{para_text}"
+    )
+
+
+# ── AI response cache ────────────────────────────────────────────────────
+# Re-annotating unchanged text (re-validation, re-export) reuses the parsed
+# AI response instead of paying for another round-trip.
+
+_AI_CACHE_TTL = timedelta(hours=24)
+_AI_CACHE_MAX_ENTRIES = 256
+_ai_cache: Dict[str, tuple[datetime, list]] = {}
+
+
+def _annotation_cache_key(text: str, section_title: str) -> str:
+    """Content hash of the section title and text."""
+    return hashlib.blake2b(
+        f"{section_title}\0{text}".encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+
+def _get_cached_annotations(cache_key: str) -> Optional[list]:
+    """Return the cached AI response for a key, if still fresh."""
+    entry = _ai_cache.get(cache_key)
+    if entry is None:
+        return None
+    cached_time, ai_data = entry
+    if datetime.now() - cached_time >= _AI_CACHE_TTL:
+        del _ai_cache[cache_key]
+        return None
+    return ai_data
+
+
+def _store_cached_annotations(cache_key: str, ai_data: list) -> None:
+    """Cache an AI response, evicting the oldest entry when full."""
+    if cache_key not in _ai_cache and len(_ai_cache) >= _AI_CACHE_MAX_ENTRIES:
+        del _ai_cache[next(iter(_ai_cache))]
+    _ai_cache[cache_key] = (datetime.now(), ai_data)
+
+
+def clear_annotation_cache() -> None:
+    """Clear the AI annotation cache."""
+    _ai_cache.clear()
+
+
 # ── AI-powered deep annotator ───────────────────────────────────────────
 
+# One client per API key so repeated calls reuse its HTTP connection pool
+_client_cache: Dict[str, "AsyncOpenAI"] = {}
+
+
+def _get_client(api_key: str) -> "AsyncOpenAI":
+    """Return the shared AsyncOpenAI client for an API key."""
+    client = _client_cache.get(api_key)
+    if client is None:
+        from openai import AsyncOpenAI
+        client = AsyncOpenAI(api_key=api_key)
+        _client_cache[api_key] = client
+    return client
+
+
+async def _request_ai_annotations(
+    api_key: str,
+    paragraphs: List[str],
+    section_title: str,
+) -> list:
+    """Call the model and return the parsed JSON annotation list."""
+    client = _get_client(api_key)
+
+    prompt = _build_prompt(paragraphs, section_title)
+
+    response = await client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": "You are a PhD supervisor. Output valid JSON only."},
+            {"role": "user", "content": prompt},
+        ],
+        max_tokens=1500,
+        temperature=0.3,
+    )
+    content = (response.choices[0].message.content or "").strip()
+
+    if content.startswith("```"):
+        content = content.split("\n", 1)[-1].rsplit("```", 1)[0]
+    return orjson.loads(content)
+
+
 async def annotate_section_deep(
     text: str,
     section_title: str = "",
@@ -157,57 +278,28 @@ async def annotate_section_deep(
     """
     Generate rich pedagogical annotations using AI.
 
-    Falls back to rule-based if OpenAI unavailable.
+    Falls back to rule-based if OpenAI unavailable. AI responses are
+    cached by content hash, so unchanged sections skip the API call.
     """
-    # Start with rule-based
-    result = annotate_section_rule_based(text, section_title)
-
     settings = get_settings()
     key = (settings.openai_api_key or "").strip()
     is_placeholder = not key or key.startswith("sk-your-")
 
-    if is_placeholder or len(text.split()) < 30:
-        return result
+    # Rule-based only: no key, or fewer than 30 words (maxsplit bounds the
+    # token list instead of splitting the whole section)
+    if is_placeholder or len(text.split(None, 29)) < 30:
+        return annotate_section_rule_based(text, section_title)
+
+    # Start with rule-based
+    paragraphs = _split_paragraphs(text)
+    result = _annotate_paragraphs(paragraphs, section_title)
 
     try:
-        from openai import AsyncOpenAI
-        client = AsyncOpenAI(api_key=key)
-
-        paragraphs = [p.strip() for p in text.split("\n\n") if p.strip() and len(p.split()) > 8]
-        # Send first 10 paragraphs for annotation
-        para_text = "\n\n---\n\n".join(
-            f"[Paragraph {i}] {p[:300]}"
-            for i, p in enumerate(paragraphs[:10])
-        )
-
-        prompt = (
-            "You are a PhD supervisor explaining to a student WHY each "
-            "paragraph in their dissertation exists. For each paragraph below, "
-            "provide:\n"
-            "1. A one-sentence explanation of its PURPOSE (why it exists)\n"
-            "2. What examiner criticism it prevents (if applicable)\n"
-            "3. Classification: STRUCTURAL / DEFENSIVE / RHETORICAL / CLAIM\n\n"
-            "Return JSON array: [{paragraph_index, type, explanation, "
-            "examiner_concern}]\n\n"
-            f"SECTION: {section_title}\n\n"
-            f"PARAGRAPHS:\n{para_text}"
-        )
-
-        response = await client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are a PhD supervisor. Output valid JSON only."},
-                {"role": "user", "content": prompt},
-            ],
-            max_tokens=1500,
-            temperature=0.3,
-        )
-        content = (response.choices[0].message.content or "").strip()
-
-        import json
-        if content.startswith("```"):
-            content = content.split("\n", 1)[-1].rsplit("```", 1)[0]
-        ai_data = json.loads(content)
+        cache_key = _annotation_cache_key(text, section_title)
+        ai_data = _get_cached_annotations(cache_key)
+        if ai_data is None:
+            ai_data = await _request_ai_annotations(key, paragraphs, section_title)
+            _store_cached_annotations(cache_key, ai_data)
 
         # Replace rule-based annotations with richer AI ones
         existing_indices = {a.paragraph_index for a in result.annotations}
@@ -8,16 +8,54 @@ Detects critical validation failures that should block export:
 - Suspected fabricated sources
 """
 
+import re
 import uuid
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
-from pydantic import BaseModel
+from typing import FrozenSet, Iterable, List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict
 
 from src.engines.validation.format_validator import ValidationResult, ValidationStatus
 from src.engines.validation.existence_checker import SourceMetadata
 
 
+# Journal-name fragments that suggest a fabricated or predatory venue
+SUSPICIOUS_JOURNAL_PATTERNS = (
+    "predatory",
+    "pay to publish",
+    "instant accept",
+)
+_SUSPICIOUS_JOURNAL_RE = re.compile(
+    "|".join(re.escape(p) for p in SUSPICIOUS_JOURNAL_PATTERNS),
+    re.IGNORECASE,
+)
+
+
+def normalize_author_names(
+    authors: Iterable[str],
+) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """
+    Normalize an author list once for reuse across validation layers.
+
+    Returns (full_names, last_names), both lowercased. Blank entries are skipped.
+    """
+    full_names = set()
+    last_names = set()
+    for author in authors:
+        last_name = _last_name(author)
+        if last_name is None:
+            continue
+        full_names.add(author.lower())
+        last_names.add(last_name)
+    return frozenset(full_names), frozenset(last_names)
+
+
+def _last_name(author: str) -> Optional[str]:
+    """Lowercased last whitespace-separated token of a name, or None if blank."""
+    parts = author.rsplit(None, 1)
+    return parts[-1].lower() if parts else None
+
+
 class RedFlagType(str, Enum):
     """Types of red flags."""
     NONEXISTENT_DOI = "nonexistent_doi"
@@ -31,6 +69,8 @@ class RedFlagType(str, Enum):
 class RedFlag(BaseModel):
     """A detected red flag."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     flag_type: RedFlagType
     source_id: uuid.UUID
     severity: str  # high, medium
@@ -102,18 +142,25 @@ class RedFlagDetector:
         source_id: uuid.UUID,
         cited_authors: List[str],
         api_authors: Optional[List[str]],
+        precomputed_last_names: Optional[Tuple[FrozenSet[str], FrozenSet[str]]] = None,
     ) -> Optional[RedFlag]:
-        """Check if author names are completely different."""
+        """
+        Check if author names are completely different.
+        
+        precomputed_last_names: optional (cited, api) last-name sets already
+        built by the caller via normalize_author_names().
+        """
         if not cited_authors or not api_authors:
             return None
         
-        # Simple check: see if any cited author appears in API authors
-        cited_normalized = set(a.lower().split()[-1] for a in cited_authors)  # Last names
-        api_normalized = set(a.lower().split()[-1] for a in api_authors)
-        
-        overlap = cited_normalized & api_normalized
+        # Simple check: see if any cited author appears in API authors (by last name)
+        if precomputed_last_names is not None:
+            cited_normalized, api_normalized = precomputed_last_names
+        else:
+            cited_normalized = normalize_author_names(cited_authors)[1]
+            api_normalized = normalize_author_names(api_authors)[1]
         
-        if not overlap:
+        if cited_normalized.isdisjoint(api_normalized):
             return RedFlag(
                 flag_type=RedFlagType.AUTHOR_MISMATCH,
                 source_id=source_id,
@@ -142,23 +189,16 @@ class RedFlagDetector:
         - Suspicious author name patterns
         - Impossible publication dates
         """
-        # Check for obviously fake journal names
-        journal = citation_data.get("journal", "").lower()
-        suspicious_patterns = [
-            "predatory",
-            "pay to publish",
-            "instant accept",
-        ]
-        
-        for pattern in suspicious_patterns:
-            if pattern in journal:
-                return RedFlag(
-                    flag_type=RedFlagType.SUSPICIOUS_CITATION,
-                    source_id=source_id,
-                    severity="medium",
-                    message=f"Potentially suspicious journal: {citation_data.get('journal')}",
-                    blocks_export=False,  # Warning only
-                )
+        # Check for obviously fake journal names (single scan for all patterns)
+        journal = citation_data.get("journal") or ""
+        if _SUSPICIOUS_JOURNAL_RE.search(journal):
+            return RedFlag(
+                flag_type=RedFlagType.SUSPICIOUS_CITATION,
+                source_id=source_id,
+                severity="medium",
+                message=f"Potentially suspicious journal: {journal}",
+                blocks_export=False,  # Warning only
+            )
         
         return None
     
@@ -167,18 +207,31 @@ class RedFlagDetector:
         cls,
         project_author: str,
         sources: List[dict],
+        source_last_names: Optional[List[FrozenSet[str]]] = None,
     ) -> Optional[RedFlag]:
-        """Check if self-citation ratio is excessive."""
+        """
+        Check if self-citation ratio is excessive.
+        
+        source_last_names: optional per-source last-name sets (same order as
+        sources) already built via normalize_author_names().
+        """
         if not sources:
             return None
         
-        author_normalized = project_author.lower().split()[-1]
+        project_last = _last_name(project_author)
+        if project_last is None:
+            return None
         
-        self_citations = 0
-        for source in sources:
-            authors = source.get("authors", [])
-            if any(author_normalized in a.lower() for a in authors):
-                self_citations += 1
+        if source_last_names is not None:
+            self_citations = sum(1 for last_names in source_last_names if project_last in last_names)
+        else:
+            # Single pass over the flattened author lists; any() stops at the
+            # first match, and no per-source sets are allocated.
+            self_citations = sum(
+                1
+                for source in sources
+                if any(_last_name(a) == project_last for a in source.get("authors", []))
+            )
         
         ratio = self_citations / len(sources)
         
@@ -205,40 +258,30 @@ class RedFlagDetector:
         cited_data: dict,
         api_metadata: Optional[SourceMetadata],
         api_found: bool,
+        precomputed_authors: Optional[Tuple[FrozenSet[str], FrozenSet[str]]] = None,
     ) -> List[RedFlag]:
-        """Run all red flag checks on a source."""
-        flags = []
-        
-        # Check existence
-        if flag := cls.check_existence_failure(
-            source_id,
-            cited_data.get("doi"),
-            api_found,
-        ):
-            flags.append(flag)
+        """
+        Run all red flag checks on a source.
         
-        # Check date
-        if api_metadata:
-            flag = cls.check_date_mismatch(
-                source_id,
-                cited_data.get("year"),
-                api_metadata.year,
-            )
-            if flag:
-                flags.append(flag)
-
-        # Check authors
-        if api_metadata and api_metadata.authors:
-            flag = cls.check_author_mismatch(
+        precomputed_authors: optional (cited, api) last-name sets so the author
+        check does not re-normalize lists the caller already processed.
+        """
+        has_api_authors = bool(api_metadata and api_metadata.authors)
+        candidates = (
+            # Existence
+            cls.check_existence_failure(source_id, cited_data.get("doi"), api_found),
+            # Date
+            cls.check_date_mismatch(source_id, cited_data.get("year"), api_metadata.year)
+            if api_metadata else None,
+            # Authors
+            cls.check_author_mismatch(
                 source_id,
                 cited_data.get("authors", []),
                 api_metadata.authors,
+                precomputed_last_names=precomputed_authors,
             )
-            if flag:
-                flags.append(flag)
-        
-        # Check suspicious patterns
-        if flag := cls.check_suspicious_patterns(source_id, cited_data):
-            flags.append(flag)
-        
-        return flags
+            if has_api_authors else None,
+            # Suspicious patterns
+            cls.check_suspicious_patterns(source_id, cited_data),
+        )
+        return [flag for flag in candidates if flag is not None]
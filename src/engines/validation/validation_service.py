@@ -2,8 +2,9 @@
 Validation Service - Orchestrates 5-layer citation verification.
 """
 
+import asyncio
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel
 from sqlalchemy import and_, select
@@ -13,7 +14,7 @@ from src.engines.validation.format_validator import FormatValidator, ValidationR
 from src.engines.validation.existence_checker import ExistenceChecker, SourceMetadata
 from src.engines.validation.content_verifier import ContentVerifier, ContentVerificationRequest
 from src.engines.validation.cross_project_checker import CrossProjectChecker, ConflictingInterpretation
-from src.engines.validation.red_flag_detector import RedFlagDetector, RedFlag
+from src.engines.validation.red_flag_detector import RedFlagDetector, RedFlag, normalize_author_names
 from src.kernel.models.artifact import Artifact, ArtifactType, Source
 
 
@@ -71,10 +72,7 @@ class ValidationService:
             Complete validation result
         """
         format_results = []
-        existence_result = None
-        api_metadata = None
         content_checks = []
-        cross_project_result = None
         red_flags = []
         
         # Layer 1: Format validation
@@ -98,28 +96,36 @@ class ValidationService:
         # Check if Layer 1 passed
         layer1_passed = all(r.status != ValidationStatus.INVALID for r in format_results)
         
-        # Layer 2: Existence check (if Layer 1 passed and enabled)
-        api_found = False
-        if layer1_passed and run_api_checks:
-            if doi := citation_data.get("doi"):
-                existence_result, api_metadata = await ExistenceChecker.verify_doi(doi)
-                api_found = existence_result.status == ValidationStatus.VALID
-            elif isbn := citation_data.get("isbn"):
-                existence_result, api_metadata = await ExistenceChecker.verify_isbn(isbn)
-                api_found = existence_result.status == ValidationStatus.VALID
-            elif arxiv := citation_data.get("arxiv"):
-                existence_result, api_metadata = await ExistenceChecker.verify_arxiv(arxiv)
-                api_found = existence_result.status == ValidationStatus.VALID
+        # Layer 2 (existence, external APIs) and Layer 4 (cross-project, DB)
+        # are independent I/O, so run them concurrently.
+        (existence_result, api_metadata), (cross_project_result, conflicts) = await asyncio.gather(
+            self._check_existence(citation_data, layer1_passed and run_api_checks),
+            self.cross_project_checker.check_for_conflicts(
+                citation_data.get("doi"),
+                citation_data.get("isbn"),
+                project_id,
+                citation_data.get("interpretation", ""),
+            ),
+        )
+        api_found = (
+            existence_result is not None
+            and existence_result.status == ValidationStatus.VALID
+        )
+        
+        # Normalize author lists once; shared by Layer 3 and Layer 5
+        precomputed_authors = None
+        cited_authors = citation_data.get("authors", [])
+        if api_metadata and api_metadata.authors and cited_authors:
+            cited_full, cited_last = normalize_author_names(cited_authors)
+            api_full, api_last = normalize_author_names(api_metadata.authors)
+            precomputed_authors = (cited_last, api_last)
         
         # Layer 3: Content verification requests (if mismatches detected)
         if api_metadata:
             # Check for author mismatch
-            cited_authors = citation_data.get("authors", [])
-            if api_metadata.authors and cited_authors:
+            if precomputed_authors is not None:
                 # Simple check - if names don't match, request verification
-                cited_names = set(a.lower() for a in cited_authors)
-                api_names = set(a.lower() for a in api_metadata.authors)
-                if not cited_names & api_names:
+                if cited_full.isdisjoint(api_full):
                     content_checks.append(
                         ContentVerifier.create_author_check(
                             source_id,
@@ -141,20 +147,13 @@ class ValidationService:
                     )
                 )
         
-        # Layer 4: Cross-project check
-        cross_project_result, conflicts = await self.cross_project_checker.check_for_conflicts(
-            citation_data.get("doi"),
-            citation_data.get("isbn"),
-            project_id,
-            citation_data.get("interpretation", ""),
-        )
-        
         # Layer 5: Red flag detection
         red_flags = RedFlagDetector.aggregate_flags(
             source_id,
             citation_data,
             api_metadata,
             api_found,
+            precomputed_authors=precomputed_authors,
         )
         
         # Determine overall status
@@ -180,7 +179,9 @@ class ValidationService:
             blocks_export = False
             message = "All validation checks passed"
         
-        return FullValidationResult(
+        # Every field is already a validated model or plain value built above,
+        # so skip re-validating the nested lists (called once per source).
+        return FullValidationResult.model_construct(
             source_id=source_id,
             format_results=format_results,
             existence_result=existence_result,
@@ -193,6 +194,22 @@ class ValidationService:
             message=message,
         )
     
+    @staticmethod
+    async def _check_existence(
+        citation_data: Dict[str, Any],
+        enabled: bool,
+    ) -> Tuple[Optional[ValidationResult], Optional[SourceMetadata]]:
+        """Layer 2: verify the source exists via DOI, then ISBN, then arXiv."""
+        if not enabled:
+            return None, None
+        if doi := citation_data.get("doi"):
+            return await ExistenceChecker.verify_doi(doi)
+        if isbn := citation_data.get("isbn"):
+            return await ExistenceChecker.verify_isbn(isbn)
+        if arxiv := citation_data.get("arxiv"):
+            return await ExistenceChecker.verify_arxiv(arxiv)
+        return None, None
+    
     async def validate_all_sources_in_project(
         self,
         project_id: uuid.UUID,
@@ -218,11 +235,12 @@ class ValidationService:
 
         results: Dict[uuid.UUID, FullValidationResult] = {}
         for source, artifact in rows:
-            citation_data = source.citation_data if isinstance(source.citation_data, dict) else {}
+            # One shallow copy per row; never mutate the ORM-loaded JSON
+            citation_data = dict(source.citation_data) if isinstance(source.citation_data, dict) else {}
             if source.doi:
-                citation_data = {**citation_data, "doi": source.doi}
+                citation_data["doi"] = source.doi
             if source.isbn:
-                citation_data = {**citation_data, "isbn": source.isbn}
+                citation_data["isbn"] = source.isbn
             full = await self.validate_source(
                 source_id=artifact.id,
                 citation_data=citation_data,
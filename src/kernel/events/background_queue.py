@@ -0,0 +1,160 @@
+"""
+Background event queue for high-volume telemetry events.
+
+Critical events (security, state mutations) are logged synchronously in the
+request's own transaction, before commit, per the EventStore invariant.
+Telemetry events carry no state change and are not on the audit-integrity
+path, so they can be queued here and written in batches by a worker task,
+keeping the insert off the request's latency path. On PostgreSQL those batch
+transactions commit asynchronously (synchronous_commit = off).
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.kernel.events.event_store import EventStore
+from src.kernel.models.event_log import EventType
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Event types that may be written asynchronously; everything else is critical
+TELEMETRY_EVENT_TYPES = frozenset({
+    EventType.AI_SUGGESTION_GENERATED,
+})
+
+
+def is_telemetry_event(event_type: EventType) -> bool:
+    """True if the event type may bypass the synchronous audit path."""
+    return event_type in TELEMETRY_EVENT_TYPES
+
+
+class BackgroundEventQueue:
+    """
+    In-process queue drained by a worker that batches inserts.
+
+    Usage:
+        queue = BackgroundEventQueue(async_session_maker)
+        queue.start()
+        queue.enqueue({"event_type": ..., "entity_type": ..., "entity_id": ...})
+        await queue.stop()  # drains remaining events
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        maxsize: int = 10_000,
+        batch_size: int = 500,
+        max_wait: float = 0.05,
+    ):
+        """
+        Args:
+            session_factory: Creates the sessions batches are written with
+            maxsize: enqueue() refuses events beyond this (with a warning)
+            batch_size: Maximum events written per transaction
+            max_wait: Seconds a batch waits for more events after its first
+                one, unless it fills up sooner
+        """
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._worker: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    def start(self) -> None:
+        """Start the worker task on the running event loop."""
+        if not self.running:
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write any events still queued, then stop the worker."""
+        if self._worker is None:
+            return
+        if self.running:
+            # The worker is idle at get() once every queued event is written
+            await self._queue.join()
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    def enqueue(self, event: Dict[str, Any]) -> bool:
+        """
+        Queue an event (EventStore.log keyword arguments) without waiting.
+
+        Returns:
+            False if the queue is full and the event was not queued
+        """
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.warning("Background event queue full; rejected %s", event.get("event_type"))
+            return False
+        return True
+
+    async def _take_batch(self, first: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Add up to batch_size - 1 more events to `first`, waiting at most
+        max_wait for them so bursts are coalesced into one insert.
+        """
+        batch = [first]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            async with self.session_factory() as session:
+                connection = await session.connection()
+                if connection.dialect.name == "postgresql":
+                    # Telemetry tolerates losing the last few batches on a
+                    # crash, so don't wait for the WAL flush on commit
+                    await session.execute(text("SET LOCAL synchronous_commit = off"))
+                await EventStore(session).log_many(batch)
+                await session.commit()
+        except Exception as exc:
+            logger.error("Failed to write %d background events: %s", len(batch), exc)
+
+    async def _run(self) -> None:
+        while True:
+            first = await self._queue.get()
+            batch = await self._take_batch(first)
+            await self._write_batch(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+
+_background_queue: Optional[BackgroundEventQueue] = None
+
+
+def get_background_event_queue() -> Optional[BackgroundEventQueue]:
+    """The application's queue, or None when it has not been started."""
+    if _background_queue is not None and _background_queue.running:
+        return _background_queue
+    return None
+
+
+def set_background_event_queue(queue: Optional[BackgroundEventQueue]) -> None:
+    """Install (or clear, with None) the application's queue."""
+    global _background_queue
+    _background_queue = queue
@@ -7,15 +7,56 @@ This is a core architectural invariant of the system.
 
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Type
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Sequence, Tuple, Type
 
 from pydantic import BaseModel
-from sqlalchemy import select, and_, desc
+from sqlalchemy import Integer, Select, bindparam, insert, select, and_, desc, func, literal, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.kernel.models.base import JSONPayload
 from src.kernel.models.event_log import EventLog, EventType
 
 
+def _coerce_uuid(value: Any) -> Optional[uuid.UUID]:
+    """Return value as a UUID if it is one (or a UUID string), else None."""
+    if isinstance(value, uuid.UUID):
+        return value
+    if isinstance(value, str):
+        try:
+            return uuid.UUID(value)
+        except ValueError:
+            return None
+    return None
+
+
+# Prebuilt statements for the unfiltered (most common) read shapes. Values are
+# passed as execution parameters, so these are constructed once at import and
+# each call reuses SQLAlchemy's compiled SQL and the driver's prepared statement.
+_ENTITY_HISTORY = (
+    select(EventLog)
+    .where(
+        EventLog.entity_type == bindparam("entity_type"),
+        EventLog.entity_id == bindparam("entity_id"),
+    )
+    .order_by(desc(EventLog.created_at))
+    .offset(bindparam("offset", type_=Integer))
+    .limit(bindparam("limit", type_=Integer))
+)
+_USER_ACTIVITY = (
+    select(EventLog)
+    .where(EventLog.user_id == bindparam("user_id"))
+    .order_by(desc(EventLog.created_at))
+    .limit(bindparam("limit", type_=Integer))
+)
+_PROJECT_ACTIVITY = (
+    select(EventLog)
+    .where(EventLog.project_id == bindparam("project_id"))
+    .order_by(desc(EventLog.created_at))
+    .limit(bindparam("limit", type_=Integer))
+)
+
+
 class EventStore:
     """
     Service for managing the immutable event log.
@@ -31,6 +72,24 @@ class EventStore:
         )
     """
     
+    # Batches at or above this size are written with COPY on PostgreSQL
+    COPY_THRESHOLD = 100
+    
+    # Rows fetched per round-trip by the stream_* read methods
+    STREAM_BATCH_SIZE = 500
+    
+    # Columns written by the COPY path (id and created_at use server defaults)
+    _COPY_COLUMNS = (
+        "event_type",
+        "entity_type",
+        "entity_id",
+        "user_id",
+        "project_id",
+        "payload",
+        "ip_address",
+        "user_agent",
+    )
+    
     def __init__(self, session: AsyncSession):
         self.session = session
     
@@ -43,6 +102,7 @@ class EventStore:
         payload: Optional[Dict[str, Any]] = None,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
+        project_id: Optional[uuid.UUID] = None,
     ) -> EventLog:
         """
         Log an event to the immutable audit log.
@@ -54,31 +114,130 @@ class EventStore:
             entity_type: The type of entity (user, project, artifact, etc.)
             entity_id: The ID of the entity
             user_id: The ID of the user who triggered the event (optional for system events)
-            payload: Additional event data
+            payload: Additional event data; UUID, datetime, enum and Pydantic
+                values are encoded when the row is written
             ip_address: Client IP address
             user_agent: Client user agent
+            project_id: Owning project; defaults to entity_id for project events,
+                else payload["project_id"] if present
             
         Returns:
             The created EventLog record
         """
-        # Ensure payload is JSON-serializable
-        if payload:
-            payload = self._serialize_payload(payload)
-        
-        event = EventLog(
+        event = self._build_event(
             event_type=event_type,
             entity_type=entity_type,
             entity_id=entity_id,
             user_id=user_id,
-            payload=payload or {},
+            payload=payload,
             ip_address=ip_address,
             user_agent=user_agent,
+            project_id=project_id,
         )
         
         self.session.add(event)
         # Note: Caller should flush/commit after all operations
         return event
     
+    async def log_many(self, events: Sequence[Dict[str, Any]]) -> int:
+        """
+        Log a batch of events to the immutable audit log.
+        
+        Each item takes the same keyword arguments as log(). On PostgreSQL,
+        batches of COPY_THRESHOLD or more are streamed with COPY in the
+        session's current transaction; smaller batches (and other databases)
+        are written with one bulk INSERT executed immediately, which the
+        driver sends as multi-row VALUES pages instead of a round-trip per
+        event. No EventLog objects are created.
+        
+        Args:
+            events: Keyword-argument dicts for log()
+            
+        Returns:
+            Number of events written
+        """
+        if not events:
+            return 0
+        
+        rows = [self._build_row(**event) for event in events]
+        
+        connection = await self.session.connection()
+        if len(rows) >= self.COPY_THRESHOLD and connection.dialect.name == "postgresql":
+            raw = await connection.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                EventLog.__tablename__,
+                records=[
+                    (
+                        row["event_type"].value if isinstance(row["event_type"], EventType) else row["event_type"],
+                        row["entity_type"],
+                        row["entity_id"],
+                        row["user_id"],
+                        row["project_id"],
+                        JSONPayload.serialize(row["payload"]),
+                        row["ip_address"],
+                        row["user_agent"],
+                    )
+                    for row in rows
+                ],
+                columns=list(self._COPY_COLUMNS),
+            )
+        else:
+            # ORM bulk INSERT: skips the unit of work and identity map
+            await self.session.execute(insert(EventLog), rows)
+        return len(rows)
+    
+    def _build_event(
+        self,
+        event_type: EventType,
+        entity_type: str,
+        entity_id: uuid.UUID,
+        user_id: Optional[uuid.UUID] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        project_id: Optional[uuid.UUID] = None,
+    ) -> EventLog:
+        """Build (but do not add) an EventLog row."""
+        return EventLog(**self._build_row(
+            event_type=event_type,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            user_id=user_id,
+            payload=payload,
+            ip_address=ip_address,
+            user_agent=user_agent,
+            project_id=project_id,
+        ))
+    
+    @staticmethod
+    def _build_row(
+        event_type: EventType,
+        entity_type: str,
+        entity_id: uuid.UUID,
+        user_id: Optional[uuid.UUID] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        project_id: Optional[uuid.UUID] = None,
+    ) -> Dict[str, Any]:
+        """Column values for an EventLog row; every row has the same keys."""
+        if project_id is None:
+            if entity_type == "project":
+                project_id = entity_id
+            elif isinstance(payload, dict):
+                project_id = _coerce_uuid(payload.get("project_id"))
+        
+        return {
+            "event_type": event_type,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "user_id": user_id,
+            "project_id": project_id,
+            "payload": payload or {},
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+        }
+    
     async def log_from_model(
         self,
         event_type: EventType,
@@ -92,6 +251,9 @@ class EventStore:
         """
         Log an event using a Pydantic model as payload.
         
+        The payload is model_dump(mode="json"), so the returned record holds
+        the same plain dict that is read back from the database.
+        
         Args:
             event_type: The type of event
             entity_type: The type of entity
@@ -104,15 +266,15 @@ class EventStore:
         Returns:
             The created EventLog record
         """
-        payload = payload_model.model_dump(mode="json")
         return await self.log(
             event_type=event_type,
             entity_type=entity_type,
             entity_id=entity_id,
             user_id=user_id,
-            payload=payload,
+            payload=payload_model.model_dump(mode="json"),
             ip_address=ip_address,
             user_agent=user_agent,
+            project_id=_coerce_uuid(getattr(payload_model, "project_id", None)),
         )
     
     async def get_entity_history(
@@ -136,21 +298,23 @@ class EventStore:
         Returns:
             List of EventLog records, newest first
         """
-        query = select(EventLog).where(
-            and_(
-                EventLog.entity_type == entity_type,
-                EventLog.entity_id == entity_id,
-            )
-        )
-        
-        if event_types:
-            query = query.where(EventLog.event_type.in_(event_types))
-        
-        query = query.order_by(desc(EventLog.created_at)).offset(offset).limit(limit)
-        
-        result = await self.session.execute(query)
+        query, params = self._entity_history_query(entity_type, entity_id, event_types, limit, offset)
+        result = await self.session.execute(query, params)
         return list(result.scalars().all())
     
+    async def stream_entity_history(
+        self,
+        entity_type: str,
+        entity_id: uuid.UUID,
+        event_types: Optional[List[EventType]] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> AsyncIterator[EventLog]:
+        """Like get_entity_history(), but yields rows in STREAM_BATCH_SIZE batches."""
+        query, params = self._entity_history_query(entity_type, entity_id, event_types, limit, offset)
+        async for event in self._stream(query, params):
+            yield event
+    
     async def get_user_activity(
         self,
         user_id: uuid.UUID,
@@ -172,20 +336,23 @@ class EventStore:
         Returns:
             List of EventLog records, newest first
         """
-        query = select(EventLog).where(EventLog.user_id == user_id)
-        
-        if since:
-            query = query.where(EventLog.created_at >= since)
-        if until:
-            query = query.where(EventLog.created_at <= until)
-        if event_types:
-            query = query.where(EventLog.event_type.in_(event_types))
-        
-        query = query.order_by(desc(EventLog.created_at)).limit(limit)
-        
-        result = await self.session.execute(query)
+        query, params = self._user_activity_query(user_id, since, until, event_types, limit)
+        result = await self.session.execute(query, params)
         return list(result.scalars().all())
     
+    async def stream_user_activity(
+        self,
+        user_id: uuid.UUID,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        event_types: Optional[List[EventType]] = None,
+        limit: int = 100,
+    ) -> AsyncIterator[EventLog]:
+        """Like get_user_activity(), but yields rows in STREAM_BATCH_SIZE batches."""
+        query, params = self._user_activity_query(user_id, since, until, event_types, limit)
+        async for event in self._stream(query, params):
+            yield event
+    
     async def get_project_activity(
         self,
         project_id: uuid.UUID,
@@ -205,29 +372,99 @@ class EventStore:
         Returns:
             List of EventLog records, newest first
         """
-        conditions = [
+        query, params = self._project_activity_query(project_id, include_artifacts, since, limit)
+        result = await self.session.execute(query, params)
+        return list(result.scalars().all())
+    
+    async def stream_project_activity(
+        self,
+        project_id: uuid.UUID,
+        include_artifacts: bool = True,
+        since: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> AsyncIterator[EventLog]:
+        """Like get_project_activity(), but yields rows in STREAM_BATCH_SIZE batches."""
+        query, params = self._project_activity_query(project_id, include_artifacts, since, limit)
+        async for event in self._stream(query, params):
+            yield event
+    
+    async def _stream(self, query: Select, params: Dict[str, Any]) -> AsyncIterator[EventLog]:
+        """Yield query results, fetching STREAM_BATCH_SIZE rows at a time."""
+        result = await self.session.stream_scalars(
+            query, params, execution_options={"yield_per": self.STREAM_BATCH_SIZE}
+        )
+        async for event in result:
+            yield event
+    
+    @staticmethod
+    def _entity_history_query(
+        entity_type: str,
+        entity_id: uuid.UUID,
+        event_types: Optional[List[EventType]],
+        limit: int,
+        offset: int,
+    ) -> Tuple[Select, Dict[str, Any]]:
+        params = {"entity_type": entity_type, "entity_id": entity_id, "limit": limit, "offset": offset}
+        if not event_types:
+            return _ENTITY_HISTORY, params
+        
+        query = select(EventLog).where(
             and_(
-                EventLog.entity_type == "project",
-                EventLog.entity_id == project_id,
+                EventLog.entity_type == entity_type,
+                EventLog.entity_id == entity_id,
+                EventLog.event_type.in_(event_types),
             )
-        ]
+        )
+        return query.order_by(desc(EventLog.created_at)).offset(offset).limit(limit), {}
+    
+    @staticmethod
+    def _user_activity_query(
+        user_id: uuid.UUID,
+        since: Optional[datetime],
+        until: Optional[datetime],
+        event_types: Optional[List[EventType]],
+        limit: int,
+    ) -> Tuple[Select, Dict[str, Any]]:
+        if not (since or until or event_types):
+            return _USER_ACTIVITY, {"user_id": user_id, "limit": limit}
+        
+        query = select(EventLog).where(EventLog.user_id == user_id)
+        
+        if since:
+            query = query.where(EventLog.created_at >= since)
+        if until:
+            query = query.where(EventLog.created_at <= until)
+        if event_types:
+            query = query.where(EventLog.event_type.in_(event_types))
+        
+        return query.order_by(desc(EventLog.created_at)).limit(limit), {}
+    
+    @staticmethod
+    def _project_activity_query(
+        project_id: uuid.UUID,
+        include_artifacts: bool,
+        since: Optional[datetime],
+        limit: int,
+    ) -> Tuple[Select, Dict[str, Any]]:
+        if include_artifacts and not since:
+            return _PROJECT_ACTIVITY, {"project_id": project_id, "limit": limit}
         
         if include_artifacts:
-            # Include events where project_id is in the payload
-            conditions.append(
-                EventLog.payload["project_id"].astext == str(project_id)
+            # project_id is set on the project's own events as well as on events
+            # for its artifacts, so one ix_event_logs_project_time range covers both
+            query = select(EventLog).where(EventLog.project_id == project_id)
+        else:
+            query = select(EventLog).where(
+                and_(
+                    EventLog.entity_type == "project",
+                    EventLog.entity_id == project_id,
+                )
             )
         
-        from sqlalchemy import or_
-        query = select(EventLog).where(or_(*conditions))
-        
         if since:
             query = query.where(EventLog.created_at >= since)
         
-        query = query.order_by(desc(EventLog.created_at)).limit(limit)
-        
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return query.order_by(desc(EventLog.created_at)).limit(limit), {}
     
     async def count_events(
         self,
@@ -250,45 +487,81 @@ class EventStore:
         Returns:
             Count of matching events
         """
-        from sqlalchemy import func
+        query = select(func.count()).select_from(EventLog).where(
+            *self._event_filters(entity_type, entity_id, event_type, user_id, since)
+        )
+        
+        result = await self.session.execute(query)
+        return result.scalar() or 0
+    
+    async def exists(
+        self,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[uuid.UUID] = None,
+        event_type: Optional[EventType] = None,
+        user_id: Optional[uuid.UUID] = None,
+        since: Optional[datetime] = None,
+    ) -> bool:
+        """
+        Check whether any event matches the given criteria.
         
-        query = select(func.count(EventLog.id))
+        Stops at the first matching row, so prefer this over count_events()
+        when only "are there any?" matters. Takes the same filters.
+        """
+        query = select(literal(1)).select_from(EventLog).where(
+            *self._event_filters(entity_type, entity_id, event_type, user_id, since)
+        ).limit(1)
+        
+        result = await self.session.execute(query)
+        return result.scalar() is not None
+    
+    async def approximate_count(self) -> int:
+        """
+        Estimated total number of events, for dashboards.
         
+        On PostgreSQL this reads the planner's reltuples statistics for the
+        table and its partitions instead of scanning. It falls back to an
+        exact count on other databases or before the table was ever analyzed.
+        """
+        connection = await self.session.connection()
+        if connection.dialect.name == "postgresql":
+            result = await self.session.execute(
+                text(
+                    "SELECT sum(c.reltuples)::bigint, min(c.reltuples) FROM pg_class c "
+                    "WHERE c.relkind = 'r' AND (c.oid = CAST(:table AS regclass) "
+                    "OR c.oid IN (SELECT inhrelid FROM pg_inherits "
+                    "WHERE inhparent = CAST(:table AS regclass)))"
+                ),
+                {"table": EventLog.__tablename__},
+            )
+            estimate, never_analyzed = result.one()
+            # Only plain tables hold rows (a partitioned parent has no stats);
+            # reltuples is -1 until a table or partition is first analyzed
+            if estimate is not None and never_analyzed is not None and never_analyzed >= 0:
+                return max(int(estimate), 0)
+        return await self.count_events()
+    
+    @staticmethod
+    def _event_filters(
+        entity_type: Optional[str],
+        entity_id: Optional[uuid.UUID],
+        event_type: Optional[EventType],
+        user_id: Optional[uuid.UUID],
+        since: Optional[datetime],
+    ) -> List[Any]:
+        """WHERE clauses shared by count_events() and exists()."""
+        filters = []
         if entity_type:
-            query = query.where(EventLog.entity_type == entity_type)
+            filters.append(EventLog.entity_type == entity_type)
         if entity_id:
-            query = query.where(EventLog.entity_id == entity_id)
+            filters.append(EventLog.entity_id == entity_id)
         if event_type:
-            query = query.where(EventLog.event_type == event_type)
+            filters.append(EventLog.event_type == event_type)
         if user_id:
-            query = query.where(EventLog.user_id == user_id)
+            filters.append(EventLog.user_id == user_id)
         if since:
-            query = query.where(EventLog.created_at >= since)
-        
-        result = await self.session.execute(query)
-        return result.scalar() or 0
-    
-    def _serialize_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert payload values to JSON-serializable types."""
-        result = {}
-        for key, value in payload.items():
-            if isinstance(value, uuid.UUID):
-                result[key] = str(value)
-            elif isinstance(value, datetime):
-                result[key] = value.isoformat()
-            elif isinstance(value, dict):
-                result[key] = self._serialize_payload(value)
-            elif isinstance(value, list):
-                result[key] = [
-                    self._serialize_payload(v) if isinstance(v, dict)
-                    else str(v) if isinstance(v, uuid.UUID)
-                    else v.isoformat() if isinstance(v, datetime)
-                    else v
-                    for v in value
-                ]
-            else:
-                result[key] = value
-        return result
+            filters.append(EventLog.created_at >= since)
+        return filters
 
 
 # Convenience functions for common logging patterns
@@ -347,6 +620,14 @@ async def log_artifact_updated(
     )
 
 
+_AI_ACTION_TO_EVENT: Mapping[str, EventType] = MappingProxyType({
+    "generated": EventType.AI_SUGGESTION_GENERATED,
+    "accepted": EventType.AI_SUGGESTION_ACCEPTED,
+    "rejected": EventType.AI_SUGGESTION_REJECTED,
+    "modified": EventType.AI_SUGGESTION_MODIFIED,
+})
+
+
 async def log_ai_suggestion(
     session: AsyncSession,
     suggestion_id: uuid.UUID,
@@ -356,16 +637,20 @@ async def log_ai_suggestion(
     action: str,  # generated, accepted, rejected, modified
     modification_ratio: Optional[float] = None,
     ip_address: Optional[str] = None,
-) -> EventLog:
-    """Log an AI suggestion event."""
-    store = EventStore(session)
+) -> Optional[EventLog]:
+    """
+    Log an AI suggestion event.
     
-    event_type_map = {
-        "generated": EventType.AI_SUGGESTION_GENERATED,
-        "accepted": EventType.AI_SUGGESTION_ACCEPTED,
-        "rejected": EventType.AI_SUGGESTION_REJECTED,
-        "modified": EventType.AI_SUGGESTION_MODIFIED,
-    }
+    Telemetry events ("generated") go to the background event queue when it
+    is running, in which case None is returned; accept/reject/modify events
+    stay on the synchronous audit path.
+    """
+    from src.kernel.events.background_queue import (
+        get_background_event_queue,
+        is_telemetry_event,
+    )
+    
+    event_type = _AI_ACTION_TO_EVENT.get(action, EventType.AI_SUGGESTION_GENERATED)
     
     payload = {
         "suggestion_type": suggestion_type,
@@ -374,11 +659,17 @@ async def log_ai_suggestion(
     if modification_ratio is not None:
         payload["modification_ratio"] = modification_ratio
     
-    return await store.log(
-        event_type=event_type_map.get(action, EventType.AI_SUGGESTION_GENERATED),
-        entity_type="ai_suggestion",
-        entity_id=suggestion_id,
-        user_id=user_id,
-        payload=payload,
-        ip_address=ip_address,
-    )
+    event = {
+        "event_type": event_type,
+        "entity_type": "ai_suggestion",
+        "entity_id": suggestion_id,
+        "user_id": user_id,
+        "payload": payload,
+        "ip_address": ip_address,
+    }
+    
+    queue = get_background_event_queue()
+    if queue is not None and is_telemetry_event(event_type) and queue.enqueue(event):
+        return None
+    
+    return await EventStore(session).log(**event)
@@ -5,20 +5,23 @@ These are the payload schemas for events logged to the audit trail.
 """
 
 import uuid
-from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BaseEvent(BaseModel):
-    """Base event payload structure."""
+    """
+    Base event payload structure.
     
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    Event time is not part of the payload: EventLog.created_at records it
+    (server default now()). The schema is closed; put ad-hoc data in
+    `metadata`.
+    """
+    
+    model_config = ConfigDict(extra="forbid")
     
-    class Config:
-        extra = "allow"
+    metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
 # User Events
@@ -0,0 +1,162 @@
+"""
+Monthly partition maintenance for time-series tables (PostgreSQL only).
+
+Migrations 0010 and 0020 turn event_logs and avatar_messages into tables
+range-partitioned by created_at. These helpers pre-create upcoming monthly
+partitions, so new rows never land in the default partition, and detach
+partitions older than the retention window. They do nothing on SQLite or on
+an unpartitioned table, e.g. one created by init_db's create_all.
+"""
+
+import asyncio
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+EVENT_LOG_TABLE = "event_logs"
+AVATAR_MESSAGE_TABLE = "avatar_messages"
+
+
+def partition_name(month: date, table: str = EVENT_LOG_TABLE) -> str:
+    """Name of the partition of `table` holding the month that starts at `month`."""
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month `months` after the month containing `month`."""
+    index = month.year * 12 + (month.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+async def is_partitioned(conn: AsyncConnection, table: str = EVENT_LOG_TABLE) -> bool:
+    """True if `table` is a partitioned PostgreSQL table."""
+    if conn.dialect.name != "postgresql":
+        return False
+    result = await conn.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = :table AND pg_table_is_visible(c.oid)"
+        ),
+        {"table": table},
+    )
+    return result.scalar() is not None
+
+
+async def ensure_event_log_partitions(
+    conn: AsyncConnection,
+    months_ahead: int = 3,
+    today: Optional[date] = None,
+    table: str = EVENT_LOG_TABLE,
+) -> List[str]:
+    """
+    Create monthly partitions from the current month through `months_ahead`.
+
+    Returns the names of partitions that were created.
+    """
+    if not await is_partitioned(conn, table):
+        return []
+
+    current = (today or date.today()).replace(day=1)
+    created = []
+    for offset in range(months_ahead + 1):
+        start = add_months(current, offset)
+        name = partition_name(start, table)
+        exists = await conn.execute(
+            text("SELECT to_regclass(:name)"), {"name": name}
+        )
+        if exists.scalar() is not None:
+            continue
+        await conn.execute(
+            text(
+                f'CREATE TABLE "{name}" PARTITION OF {table} '
+                f"FOR VALUES FROM ('{start.isoformat()}') "
+                f"TO ('{add_months(start, 1).isoformat()}')"
+            )
+        )
+        created.append(name)
+        logger.info("Created partition %s", name)
+    return created
+
+
+async def detach_expired_event_log_partitions(
+    conn: AsyncConnection,
+    retention_months: int,
+    today: Optional[date] = None,
+    table: str = EVENT_LOG_TABLE,
+) -> List[str]:
+    """
+    Detach monthly partitions that end before the retention window.
+
+    Detached tables are kept (not dropped) so they can be archived.
+    Returns the names of partitions that were detached.
+    """
+    if retention_months <= 0 or not await is_partitioned(conn, table):
+        return []
+
+    cutoff = add_months((today or date.today()).replace(day=1), -retention_months)
+    result = await conn.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :table AND c.relname LIKE :pattern"
+        ),
+        {"table": table, "pattern": f"{table}_y%m%"},
+    )
+    detached = []
+    for name in sorted(result.scalars()):
+        suffix = name[len(table) + 2:]
+        year, _, month = suffix.partition("m")
+        if not (year.isdigit() and month.isdigit()):
+            continue
+        start = date(int(year), int(month), 1)
+        if add_months(start, 1) > cutoff:
+            continue
+        await conn.execute(
+            text(f'ALTER TABLE {table} DETACH PARTITION "{name}"')
+        )
+        detached.append(name)
+        logger.info("Detached partition %s", name)
+    return detached
+
+
+async def maintain_event_log_partitions(
+    engine: AsyncEngine,
+    months_ahead: int,
+    retention_months: int,
+    avatar_message_retention_months: int = 0,
+) -> None:
+    """Run one maintenance pass per table: pre-create upcoming, detach expired."""
+    retention = {
+        EVENT_LOG_TABLE: retention_months,
+        AVATAR_MESSAGE_TABLE: avatar_message_retention_months,
+    }
+    async with engine.begin() as conn:
+        for table, months in retention.items():
+            await ensure_event_log_partitions(conn, months_ahead, table=table)
+            await detach_expired_event_log_partitions(conn, months, table=table)
+
+
+async def run_event_log_partition_maintenance(
+    engine: AsyncEngine,
+    months_ahead: int,
+    retention_months: int,
+    avatar_message_retention_months: int = 0,
+    interval_seconds: float = 24 * 60 * 60,
+) -> None:
+    """Background loop running a maintenance pass every `interval_seconds`."""
+    while True:
+        try:
+            await maintain_event_log_partitions(
+                engine, months_ahead, retention_months, avatar_message_retention_months
+            )
+        except Exception as exc:
+            logger.warning("Partition maintenance failed: %s", exc)
+        await asyncio.sleep(interval_seconds)
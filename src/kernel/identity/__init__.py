@@ -2,7 +2,13 @@
 Identity Core - Authentication and user management.
 """
 
-from src.kernel.identity.password import PasswordHasher, verify_password, hash_password
+from src.kernel.identity.password import (
+    PasswordHasher,
+    verify_password,
+    hash_password,
+    verify_password_async,
+    hash_password_async,
+)
 from src.kernel.identity.jwt import (
     JWTManager,
     TokenPair,
@@ -17,6 +23,8 @@ __all__ = [
     "PasswordHasher",
     "verify_password",
     "hash_password",
+    "verify_password_async",
+    "hash_password_async",
     "JWTManager",
     "TokenPair",
     "AccessTokenPayload",
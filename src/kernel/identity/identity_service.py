@@ -4,16 +4,53 @@ Identity service for user management operations.
 
 import uuid
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Dict, Optional
 
-from sqlalchemy import select, and_, or_
+from sqlalchemy import bindparam, func, inspect, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.kernel.models.user import User, UserRole, RefreshToken
 from src.kernel.models.event_log import EventType
 from src.kernel.events.event_store import EventStore
-from src.kernel.identity.password import hash_password, verify_password
-from src.kernel.identity.jwt import JWTManager, TokenPair
+from src.kernel.identity.password import (
+    PasswordHasher,
+    dummy_verify_async,
+    hash_password_async,
+    verify_password_async,
+)
+from src.kernel.identity.jwt import JWTManager, TokenPair, get_jwt_manager
+
+# Prebuilt statements for the per-request auth queries. Values are passed as
+# execution parameters, so each call reuses SQLAlchemy's compiled SQL.
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_LIVE_REFRESH_TOKEN = (
+    select(RefreshToken, User)
+    .join(User, User.id == RefreshToken.user_id)
+    .where(
+        RefreshToken.token_hash == bindparam("token_hash"),
+        RefreshToken.revoked == False,
+        RefreshToken.expires_at > func.now(),
+        User.is_active == True,
+    )
+)
+_REVOKE_USER_TOKENS = (
+    update(RefreshToken)
+    .where(
+        RefreshToken.user_id == bindparam("for_user_id"),
+        RefreshToken.revoked == False,
+    )
+    .values(revoked=True)
+)
+_REVOKE_TOKEN = (
+    update(RefreshToken)
+    .where(RefreshToken.token_hash == bindparam("for_token_hash"))
+    .values(revoked=True)
+)
+
+
+def normalize_email(email: str) -> str:
+    """Canonical form emails are stored and looked up in (see ck_users_email_normalized)."""
+    return email.lower().strip()
 
 
 class IdentityService:
@@ -25,8 +62,11 @@ class IdentityService:
     
     def __init__(self, session: AsyncSession):
         self.session = session
-        self.jwt_manager = JWTManager()
+        self.jwt_manager = get_jwt_manager()
         self.event_store = EventStore(session)
+        # Users already loaded by email; only found users are kept, so a
+        # registration is never hidden behind a cached miss
+        self._users_by_email: Dict[str, User] = {}
     
     async def register_user(
         self,
@@ -52,21 +92,24 @@ class IdentityService:
         Raises:
             ValueError: If email already exists
         """
+        email = normalize_email(email)
+        
         # Check for existing user
-        existing = await self.get_user_by_email(email)
+        existing = await self.get_user_by_email_normalized(email)
         if existing:
             raise ValueError("Email already registered")
         
         # Create user
         user = User(
-            email=email.lower().strip(),
-            password_hash=hash_password(password),
+            email=email,
+            password_hash=await hash_password_async(password),
             full_name=full_name.strip(),
             role=role,
         )
         
         self.session.add(user)
         await self.session.flush()  # Get the ID
+        self._users_by_email[user.email] = user
         
         # Log the event
         await self.event_store.log(
@@ -74,7 +117,7 @@ class IdentityService:
             entity_type="user",
             entity_id=user.id,
             user_id=user.id,
-            payload={"email": user.email, "role": user.role.value if hasattr(user.role, "value") else user.role},
+            payload={"email": user.email, "role": user.role.value},
             ip_address=ip_address,
         )
         
@@ -101,28 +144,32 @@ class IdentityService:
         """
         user = await self.get_user_by_email(email)
         if not user:
+            # Same hashing cost as a wrong password (no email enumeration)
+            await dummy_verify_async(password)
             return None
         
-        if not verify_password(password, user.password_hash):
+        if not await verify_password_async(password, user.password_hash):
             return None
         
         if not user.is_active:
             return None
         
-        # Create tokens (role may be enum or str when loaded from SQLite)
-        role_value = user.role.value if hasattr(user.role, "value") else user.role
+        # Upgrade legacy (bcrypt) or outdated hashes while the password is known
+        if PasswordHasher.needs_rehash(user.password_hash):
+            user.password_hash = await hash_password_async(password)
+        
+        # Create tokens
         token_pair, access_jti, refresh_jti = self.jwt_manager.create_token_pair(
             user_id=user.id,
             email=user.email,
-            role=role_value,
+            role=user.role.value,
         )
         
         # Store refresh token
         refresh_token_record = RefreshToken(
             user_id=user.id,
             token_hash=JWTManager.hash_token(token_pair.refresh_token),
-            expires_at=datetime.now(timezone.utc) + 
-                       __import__('datetime').timedelta(days=self.jwt_manager.refresh_token_expire_days),
+            expires_at=datetime.now(timezone.utc) + self.jwt_manager.refresh_token_expire_delta,
         )
         self.session.add(refresh_token_record)
         
@@ -161,43 +208,37 @@ class IdentityService:
         if not payload:
             return None
         
-        # Check if token is in database and not revoked
-        token_hash = JWTManager.hash_token(refresh_token)
-        query = select(RefreshToken).where(
-            and_(
-                RefreshToken.token_hash == token_hash,
-                RefreshToken.revoked == False,
-                RefreshToken.expires_at > datetime.now(timezone.utc),
-            )
+        # Check the token is stored and live, loading its (active) user with it
+        result = await self.session.execute(
+            _LIVE_REFRESH_TOKEN, {"token_hash": JWTManager.hash_token(refresh_token)}
         )
-        result = await self.session.execute(query)
-        token_record = result.scalar_one_or_none()
-        
-        if not token_record:
-            return None
+        row = result.one_or_none()
+        if not row:
+            # Tokens issued before the BLAKE2b switch (see legacy_hash_token)
+            result = await self.session.execute(
+                _LIVE_REFRESH_TOKEN, {"token_hash": JWTManager.legacy_hash_token(refresh_token)}
+            )
+            row = result.one_or_none()
         
-        # Get user
-        user = await self.get_user_by_id(uuid.UUID(payload.sub))
-        if not user or not user.is_active:
+        if not row:
             return None
+        token_record, user = row
         
         # Revoke old refresh token (rotation)
         token_record.revoked = True
         
         # Create new token pair
-        role_val = user.role.value if hasattr(user.role, "value") else user.role
         new_token_pair, access_jti, refresh_jti = self.jwt_manager.create_token_pair(
             user_id=user.id,
             email=user.email,
-            role=role_val,
+            role=user.role.value,
         )
         
         # Store new refresh token
         new_refresh_token = RefreshToken(
             user_id=user.id,
             token_hash=JWTManager.hash_token(new_token_pair.refresh_token),
-            expires_at=datetime.now(timezone.utc) + 
-                       __import__('datetime').timedelta(days=self.jwt_manager.refresh_token_expire_days),
+            expires_at=datetime.now(timezone.utc) + self.jwt_manager.refresh_token_expire_delta,
         )
         self.session.add(new_refresh_token)
         
@@ -222,30 +263,18 @@ class IdentityService:
         Returns:
             True if successful
         """
+        # Single bulk UPDATE, without loading the token rows
         if revoke_all:
-            # Revoke all user's refresh tokens
-            query = select(RefreshToken).where(
-                and_(
-                    RefreshToken.user_id == user_id,
-                    RefreshToken.revoked == False,
-                )
-            )
-            result = await self.session.execute(query)
-            tokens = result.scalars().all()
-            
-            for token in tokens:
-                token.revoked = True
+            await self.session.execute(_REVOKE_USER_TOKENS, {"for_user_id": user_id})
         elif refresh_token:
-            # Revoke specific token
-            token_hash = JWTManager.hash_token(refresh_token)
-            query = select(RefreshToken).where(
-                RefreshToken.token_hash == token_hash
+            result = await self.session.execute(
+                _REVOKE_TOKEN, {"for_token_hash": JWTManager.hash_token(refresh_token)}
             )
-            result = await self.session.execute(query)
-            token_record = result.scalar_one_or_none()
-            
-            if token_record:
-                token_record.revoked = True
+            if result.rowcount == 0:
+                # Tokens issued before the BLAKE2b switch (see legacy_hash_token)
+                await self.session.execute(
+                    _REVOKE_TOKEN, {"for_token_hash": JWTManager.legacy_hash_token(refresh_token)}
+                )
         
         # Log the event
         await self.event_store.log(
@@ -260,16 +289,27 @@ class IdentityService:
         return True
     
     async def get_user_by_id(self, user_id: uuid.UUID) -> Optional[User]:
-        """Get a user by ID."""
-        query = select(User).where(User.id == user_id)
-        result = await self.session.execute(query)
-        return result.scalar_one_or_none()
+        """Get a user by ID (no query if the session already holds the user)."""
+        return await self.session.get(User, user_id)
     
     async def get_user_by_email(self, email: str) -> Optional[User]:
-        """Get a user by email."""
-        query = select(User).where(User.email == email.lower().strip())
-        result = await self.session.execute(query)
-        return result.scalar_one_or_none()
+        """Get a user by email (no query if this service already loaded them)."""
+        return await self.get_user_by_email_normalized(normalize_email(email))
+    
+    async def get_user_by_email_normalized(self, email: str) -> Optional[User]:
+        """get_user_by_email() for an email already passed through normalize_email()."""
+        user = self._users_by_email.get(email)
+        if user is not None:
+            # Skip entries a rollback discarded or expired
+            state = inspect(user)
+            if state.persistent and "email" not in state.expired_attributes and user.email == email:
+                return user
+        
+        result = await self.session.execute(_USER_BY_EMAIL, {"email": email})
+        user = result.scalar_one_or_none()
+        if user is not None:
+            self._users_by_email[email] = user
+        return user
     
     async def update_user(
         self,
@@ -301,9 +341,9 @@ class IdentityService:
             changes["full_name"] = full_name
         
         if email is not None:
-            new_email = email.lower().strip()
+            new_email = normalize_email(email)
             # Check if email is taken
-            existing = await self.get_user_by_email(new_email)
+            existing = await self.get_user_by_email_normalized(new_email)
             if existing and existing.id != user_id:
                 raise ValueError("Email already in use")
             user.email = new_email
@@ -344,10 +384,10 @@ class IdentityService:
         if not user:
             return False
         
-        if not verify_password(current_password, user.password_hash):
+        if not await verify_password_async(current_password, user.password_hash):
             return False
         
-        user.password_hash = hash_password(new_password)
+        user.password_hash = await hash_password_async(new_password)
         
         # Revoke all refresh tokens on password change
         await self.logout(user_id, revoke_all=True, ip_address=ip_address)
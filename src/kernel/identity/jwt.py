@@ -4,11 +4,15 @@ JWT token management for authentication.
 
 import hashlib
 import secrets
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
-from jose import JWTError, jwt
+import jwt
+import orjson
+from jwt import PyJWTError
+from jwt.exceptions import DecodeError
 from pydantic import BaseModel
 
 from src.config import get_settings
@@ -20,22 +24,30 @@ class AccessTokenPayload(BaseModel):
     sub: str  # User ID
     email: str
     role: str
-    exp: datetime
-    iat: datetime
+    exp: int  # Unix epoch seconds (RFC 7519 NumericDate)
+    iat: int
     jti: str  # Token ID for revocation tracking
     
     class Config:
         from_attributes = True
+    
+    @property
+    def exp_datetime(self) -> datetime:
+        return datetime.fromtimestamp(self.exp, tz=timezone.utc)
 
 
 class RefreshTokenPayload(BaseModel):
     """JWT refresh token payload."""
     
     sub: str  # User ID
-    exp: datetime
-    iat: datetime
+    exp: int  # Unix epoch seconds
+    iat: int
     jti: str
     type: str = "refresh"
+    
+    @property
+    def exp_datetime(self) -> datetime:
+        return datetime.fromtimestamp(self.exp, tz=timezone.utc)
 
 
 class TokenPair(BaseModel):
@@ -47,25 +59,88 @@ class TokenPair(BaseModel):
     expires_in: int  # Seconds until access token expires
 
 
+class _OrjsonJWT(jwt.PyJWT):
+    """PyJWT with the claims encoded and parsed by orjson instead of json."""
+    
+    def _encode_payload(self, payload, headers=None, json_encoder=None) -> bytes:
+        return orjson.dumps(payload)
+    
+    def _decode_payload(self, decoded) -> dict:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise DecodeError(f"Invalid payload string: {e}") from e
+        if not isinstance(payload, dict):
+            raise DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+_jwt = _OrjsonJWT()
+
+
 class JWTManager:
     """
     JWT token creation and verification.
     
     Handles access tokens (short-lived) and refresh tokens (long-lived).
+    Verified access tokens are cached briefly by token digest, so a client
+    reusing the same token skips the signature check and payload parsing.
+    Refresh tokens are single-use under rotation and are not cached.
     """
     
+    # Cached access token verifications kept before the oldest is evicted
+    VERIFY_CACHE_MAX_ENTRIES = 10_000
+    
     def __init__(
         self,
         secret_key: Optional[str] = None,
         algorithm: str = "HS256",
         access_token_expire_minutes: int = 30,
         refresh_token_expire_days: int = 7,
+        verify_cache_ttl_seconds: float = 30,
     ):
+        """
+        Args:
+            verify_cache_ttl_seconds: How long a verified access token's payload
+                is reused without re-decoding; 0 disables the cache
+        """
         settings = get_settings()
         self.secret_key = secret_key or settings.secret_key
         self.algorithm = algorithm or settings.algorithm
         self.access_token_expire_minutes = access_token_expire_minutes
         self.refresh_token_expire_days = refresh_token_expire_days
+        self.access_token_expire_delta = timedelta(minutes=access_token_expire_minutes)
+        self.refresh_token_expire_delta = timedelta(days=refresh_token_expire_days)
+        self.verify_cache_ttl_seconds = verify_cache_ttl_seconds
+        self._access_cache: Dict[bytes, Tuple[float, AccessTokenPayload]] = {}
+    
+    @staticmethod
+    def _cache_key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+    
+    def _get_cached(self, key: bytes) -> Optional[AccessTokenPayload]:
+        """Return a cached payload if still fresh and not yet expired."""
+        cache = self._access_cache
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        cached_at, payload = entry
+        if (
+            time.monotonic() - cached_at >= self.verify_cache_ttl_seconds
+            or payload.exp <= time.time()
+        ):
+            del cache[key]
+            return None
+        return payload
+    
+    def _store_cached(self, key: bytes, payload: AccessTokenPayload) -> None:
+        """Cache a verified payload, evicting the oldest entry when full."""
+        if self.verify_cache_ttl_seconds <= 0:
+            return
+        cache = self._access_cache
+        if key not in cache and len(cache) >= self.VERIFY_CACHE_MAX_ENTRIES:
+            del cache[next(iter(cache))]
+        cache[key] = (time.monotonic(), payload)
     
     def create_access_token(
         self,
@@ -87,20 +162,20 @@ class JWTManager:
             Tuple of (token, expiration_datetime, token_id)
         """
         now = datetime.now(timezone.utc)
-        expire = now + (expires_delta or timedelta(minutes=self.access_token_expire_minutes))
+        expire = now + (expires_delta or self.access_token_expire_delta)
         jti = str(uuid.uuid4())
         
         payload = {
             "sub": str(user_id),
             "email": email,
             "role": role,
-            "exp": expire,
-            "iat": now,
+            "exp": int(expire.timestamp()),
+            "iat": int(now.timestamp()),
             "jti": jti,
             "type": "access",
         }
         
-        token = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+        token = _jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
         return token, expire, jti
     
     def create_refresh_token(
@@ -119,18 +194,18 @@ class JWTManager:
             Tuple of (token, expiration_datetime, token_id)
         """
         now = datetime.now(timezone.utc)
-        expire = now + (expires_delta or timedelta(days=self.refresh_token_expire_days))
+        expire = now + (expires_delta or self.refresh_token_expire_delta)
         jti = str(uuid.uuid4())
         
         payload = {
             "sub": str(user_id),
-            "exp": expire,
-            "iat": now,
+            "exp": int(expire.timestamp()),
+            "iat": int(now.timestamp()),
             "jti": jti,
             "type": "refresh",
         }
         
-        token = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+        token = _jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
         return token, expire, jti
     
     def create_token_pair(
@@ -173,8 +248,13 @@ class JWTManager:
         Returns:
             AccessTokenPayload if valid, None otherwise
         """
+        key = self._cache_key(token)
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
+        
         try:
-            payload = jwt.decode(
+            payload = _jwt.decode(
                 token,
                 self.secret_key,
                 algorithms=[self.algorithm],
@@ -184,16 +264,19 @@ class JWTManager:
             if payload.get("type") != "access":
                 return None
             
-            return AccessTokenPayload(
+            verified = AccessTokenPayload(
                 sub=payload["sub"],
                 email=payload["email"],
                 role=payload["role"],
-                exp=datetime.fromtimestamp(payload["exp"], tz=timezone.utc),
-                iat=datetime.fromtimestamp(payload["iat"], tz=timezone.utc),
+                exp=payload["exp"],
+                iat=payload["iat"],
                 jti=payload["jti"],
             )
-        except JWTError:
+        except PyJWTError:
             return None
+        
+        self._store_cached(key, verified)
+        return verified
     
     def verify_refresh_token(self, token: str) -> Optional[RefreshTokenPayload]:
         """
@@ -206,7 +289,7 @@ class JWTManager:
             RefreshTokenPayload if valid, None otherwise
         """
         try:
-            payload = jwt.decode(
+            payload = _jwt.decode(
                 token,
                 self.secret_key,
                 algorithms=[self.algorithm],
@@ -218,11 +301,11 @@ class JWTManager:
             
             return RefreshTokenPayload(
                 sub=payload["sub"],
-                exp=datetime.fromtimestamp(payload["exp"], tz=timezone.utc),
-                iat=datetime.fromtimestamp(payload["iat"], tz=timezone.utc),
+                exp=payload["exp"],
+                iat=payload["iat"],
                 jti=payload["jti"],
             )
-        except JWTError:
+        except PyJWTError:
             return None
     
     @staticmethod
@@ -236,7 +319,19 @@ class JWTManager:
             token: The token to hash
             
         Returns:
-            SHA-256 hash of the token
+            BLAKE2b-256 hash of the token (64 hex chars)
+        """
+        return hashlib.blake2b(token.encode(), digest_size=32).hexdigest()
+    
+    # Refresh tokens issued before the switch to BLAKE2b are stored under their
+    # SHA-256 hash. IdentityService falls back to it so those sessions keep
+    # working; every such token expires within the 7-day refresh lifetime.
+    @staticmethod
+    def legacy_hash_token(token: str) -> str:
+        """
+        SHA-256 hash that refresh tokens were stored under before BLAKE2b.
+        
+        Only computed when a lookup by hash_token() misses.
         """
         return hashlib.sha256(token.encode()).hexdigest()
 
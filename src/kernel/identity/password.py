@@ -1,11 +1,51 @@
 """
-Password hashing utilities using bcrypt.
+Password hashing utilities using Argon2id.
+
+New hashes use Argon2id. Existing bcrypt hashes still verify, and
+needs_rehash() reports them so they can be upgraded on the next login.
 """
 
+import asyncio
+import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
 import bcrypt
+from argon2 import PasswordHasher as Argon2Hasher
+from argon2.exceptions import InvalidHashError, VerificationError, VerifyMismatchError
+
+# Argon2id parameters (OWASP minimum: 19 MiB memory, 2 iterations, 1 lane)
+ARGON2_TIME_COST = 2
+ARGON2_MEMORY_COST = 19456  # KiB
+ARGON2_PARALLELISM = 1
+
+# Prefix shared by all bcrypt hash variants ($2a$, $2b$, $2y$)
+BCRYPT_PREFIX = "$2"
+
+# Maximum concurrent hash/verify calls. Argon2 releases the GIL, so these run in
+# parallel; the cap bounds CPU and memory (~19 MiB each) under login storms
+# and keeps them from occupying the loop's default executor
+HASH_WORKERS = os.cpu_count() or 1
+
+_argon2 = Argon2Hasher(
+    time_cost=ARGON2_TIME_COST,
+    memory_cost=ARGON2_MEMORY_COST,
+    parallelism=ARGON2_PARALLELISM,
+    hash_len=32,
+    salt_len=16,
+)
 
-# Number of rounds for bcrypt hashing (12 is secure default)
-BCRYPT_ROUNDS = 12
+_hash_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_hash_executor() -> ThreadPoolExecutor:
+    global _hash_executor
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(
+            max_workers=HASH_WORKERS, thread_name_prefix="password-hash"
+        )
+    return _hash_executor
 
 
 class PasswordHasher:
@@ -16,32 +56,28 @@ class PasswordHasher:
         """
         Truncate password to 72 bytes (bcrypt limit) and encode.
         
-        bcrypt only uses the first 72 bytes of a password.
-        This method ensures we don't exceed that limit.
+        bcrypt only uses the first 72 bytes of a password, so legacy
+        bcrypt hashes are checked against the same truncated bytes.
         """
         return password.encode('utf-8')[:72]
     
     @staticmethod
     def hash(password: str) -> str:
         """
-        Hash a password using bcrypt.
+        Hash a password using Argon2id.
         
         Args:
             password: Plain text password
             
         Returns:
-            Hashed password string
+            Hashed password string (salt and parameters encoded in it)
         """
-        # Truncate to 72 bytes (bcrypt limit) and encode
-        pwd_bytes = PasswordHasher._truncate_password(password)
-        salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
-        hashed = bcrypt.hashpw(pwd_bytes, salt)
-        return hashed.decode('utf-8')
+        return _argon2.hash(password)
     
     @staticmethod
     def verify(plain_password: str, hashed_password: str) -> bool:
         """
-        Verify a password against its hash.
+        Verify a password against its hash (Argon2id or legacy bcrypt).
         
         Args:
             plain_password: Plain text password to verify
@@ -50,20 +86,38 @@ class PasswordHasher:
         Returns:
             True if password matches, False otherwise
         """
+        if hashed_password.startswith(BCRYPT_PREFIX):
+            try:
+                pwd_bytes = PasswordHasher._truncate_password(plain_password)
+                return bcrypt.checkpw(pwd_bytes, hashed_password.encode('utf-8'))
+            except Exception:
+                return False
         try:
-            # Truncate to 72 bytes (bcrypt limit) for consistency
-            pwd_bytes = PasswordHasher._truncate_password(plain_password)
-            hash_bytes = hashed_password.encode('utf-8')
-            return bcrypt.checkpw(pwd_bytes, hash_bytes)
-        except Exception:
+            return _argon2.verify(hashed_password, plain_password)
+        except (VerifyMismatchError, VerificationError, InvalidHashError):
             return False
     
+    @staticmethod
+    async def hash_async(password: str) -> str:
+        """hash() in a worker thread, so hashing does not block the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_hash_executor(), PasswordHasher.hash, password)
+    
+    @staticmethod
+    async def verify_async(plain_password: str, hashed_password: str) -> bool:
+        """verify() in a worker thread, so hashing does not block the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_hash_executor(), PasswordHasher.verify, plain_password, hashed_password
+        )
+    
     @staticmethod
     def needs_rehash(hashed_password: str) -> bool:
         """
         Check if a password hash needs to be upgraded.
         
-        Currently checks if the hash uses a different number of rounds.
+        True for legacy bcrypt hashes and for Argon2 hashes made with
+        different parameters than the current ones.
         
         Args:
             hashed_password: Existing password hash
@@ -71,18 +125,31 @@ class PasswordHasher:
         Returns:
             True if hash should be regenerated
         """
-        try:
-            # bcrypt hashes encode the rounds in positions 4-6
-            # Format: $2b$XX$... where XX is the rounds
-            parts = hashed_password.split('$')
-            if len(parts) >= 3:
-                current_rounds = int(parts[2])
-                return current_rounds != BCRYPT_ROUNDS
+        if hashed_password.startswith(BCRYPT_PREFIX):
             return True
+        try:
+            return _argon2.check_needs_rehash(hashed_password)
         except Exception:
             return True
 
 
+_dummy_hash: Optional[str] = None
+
+
+async def dummy_verify_async(plain_password: str) -> None:
+    """
+    Run a verification whose result is discarded.
+    
+    Called when the account does not exist, so a failed login takes as long
+    as one with a wrong password and response times don't reveal which
+    emails are registered.
+    """
+    global _dummy_hash
+    if _dummy_hash is None:
+        _dummy_hash = PasswordHasher.hash(secrets.token_urlsafe(16))
+    await PasswordHasher.verify_async(plain_password, _dummy_hash)
+
+
 # Convenience functions
 def hash_password(password: str) -> str:
     """Hash a password."""
@@ -92,3 +159,13 @@ def hash_password(password: str) -> str:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password."""
     return PasswordHasher.verify(plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    return await PasswordHasher.hash_async(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password without blocking the event loop."""
+    return await PasswordHasher.verify_async(plain_password, hashed_password)
@@ -5,7 +5,7 @@ Core SQLAlchemy models for the Stable Kernel layer.
 These models implement the artifact graph store with versioning.
 """
 
-from src.kernel.models.base import Base, TimestampMixin, SoftDeleteMixin, generate_uuid
+from src.kernel.models.base import Base, TimestampMixin, SoftDeleteMixin, generate_uuid, generate_uuid7
 from src.kernel.models.user import User, UserRole, RefreshToken
 from src.kernel.models.project import (
     ResearchProject,
@@ -30,6 +30,9 @@ from src.kernel.models.artifact import (
     ContributionCategory,
     ArtifactState,
     compute_content_hash,
+    artifact_detail_options,
+    descendants_query,
+    ancestors_query,
 )
 from src.kernel.models.submission_unit import SubmissionUnit, SubmissionUnitState
 from src.kernel.models.collaboration import (
@@ -52,6 +55,7 @@ __all__ = [
     "TimestampMixin",
     "SoftDeleteMixin",
     "generate_uuid",
+    "generate_uuid7",
     # User
     "User",
     "UserRole",
@@ -78,6 +82,9 @@ __all__ = [
     "ContributionCategory",
     "ArtifactState",
     "compute_content_hash",
+    "artifact_detail_options",
+    "descendants_query",
+    "ancestors_query",
     "SubmissionUnit",
     "SubmissionUnitState",
     # Collaboration
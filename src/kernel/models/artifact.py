@@ -8,23 +8,38 @@ import hashlib
 import uuid
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
 from sqlalchemy import (
     DateTime,
+    Enum as SQLEnum,
     Float,
     ForeignKey,
     Integer,
+    Select,
     String,
     Text,
     func,
     Index,
-    JSON,
     Uuid,
+    literal,
+    select,
+    text,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, aliased, mapped_column, raiseload, relationship, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from src.kernel.models.base import (
+    Base,
+    JSONPayload,
+    TimestampMixin,
+    SoftDeleteMixin,
+    bulk_insert,
+    generate_uuid,
+    generate_uuid7,
+    server_uuid,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-
-from src.kernel.models.base import Base, TimestampMixin, SoftDeleteMixin, generate_uuid
 
 if TYPE_CHECKING:
     from src.kernel.models.project import ResearchProject
@@ -99,7 +114,13 @@ class ContributionCategory(str, Enum):
 
 
 def compute_content_hash(content: str) -> str:
-    """Compute SHA-256 hash of content."""
+    """
+    Compute SHA-256 hash of content.
+    
+    hashlib runs OpenSSL's SHA-256 (SHA-NI accelerated on CPUs that have it)
+    and releases the GIL while hashing large inputs. Stored hashes are
+    compared across versions and events, so the algorithm must not change.
+    """
     return hashlib.sha256(content.encode()).hexdigest()
 
 
@@ -124,9 +145,15 @@ class Artifact(Base, TimestampMixin, SoftDeleteMixin):
         index=True,
     )
     
-    # Type and hierarchy
+    # Type and hierarchy. A native enum on PostgreSQL, which keeps
+    # ix_artifacts_project_type compact; VARCHAR elsewhere.
     artifact_type: Mapped[ArtifactType] = mapped_column(
-        String(50),
+        SQLEnum(
+            ArtifactType,
+            name="artifact_type",
+            length=50,
+            values_callable=lambda types: [t.value for t in types],
+        ),
         nullable=False,
     )
     parent_id: Mapped[Optional[uuid.UUID]] = mapped_column(
@@ -191,7 +218,7 @@ class Artifact(Base, TimestampMixin, SoftDeleteMixin):
     
     # Extra data (metadata is reserved by SQLAlchemy)
     extra_data: Mapped[Optional[dict]] = mapped_column(
-        JSON,
+        JSONPayload(),
         nullable=True,
     )
     
@@ -210,11 +237,16 @@ class Artifact(Base, TimestampMixin, SoftDeleteMixin):
         back_populates="parent",
         cascade="all, delete-orphan",
     )
+    # Version history is only read by the history endpoint, which queries
+    # ArtifactVersion directly; never load it implicitly. The database
+    # cascades deletes, so the ORM never needs to load it for that either.
     versions: Mapped[List["ArtifactVersion"]] = relationship(
         "ArtifactVersion",
         back_populates="artifact",
         cascade="all, delete-orphan",
         order_by="ArtifactVersion.version_number.desc()",
+        lazy="raise",
+        passive_deletes=True,
     )
     outgoing_links: Mapped[List["ArtifactLink"]] = relationship(
         "ArtifactLink",
@@ -235,23 +267,124 @@ class Artifact(Base, TimestampMixin, SoftDeleteMixin):
     )
     
     __table_args__ = (
-        Index("ix_artifacts_project_parent", "project_id", "parent_id"),
-        Index("ix_artifacts_project_type", "project_id", "artifact_type"),
-    )
+        # Partial: reads filter on deleted_at IS NULL, so soft-deleted rows
+        # are left out of the index (ix_artifacts_project_id covers the rest)
+        Index(
+            "ix_artifacts_project_parent",
+            "project_id",
+            "parent_id",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_artifacts_project_type",
+            "project_id",
+            "artifact_type",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+    )
+    
+    @classmethod
+    async def bulk_create(
+        cls, session: AsyncSession, rows: Sequence[Dict[str, Any]]
+    ) -> List[uuid.UUID]:
+        """
+        Insert many artifacts at once (see bulk_insert); returns their ids.
+        
+        content_hash is computed from content when a row does not supply it.
+        """
+        return await bulk_insert(session, cls, [
+            row if "content_hash" in row
+            else {**row, "content_hash": compute_content_hash(row.get("content", ""))}
+            for row in rows
+        ])
     
     def __repr__(self) -> str:
         return f"<Artifact {self.artifact_type.value} {self.id}>"
 
 
+def artifact_detail_options() -> Tuple[LoaderOption, ...]:
+    """
+    Loader options for an artifact detail read.
+    
+    Children and links are loaded with one SELECT ... IN per relationship;
+    any other relationship access raises instead of issuing a lazy query.
+    """
+    return (
+        selectinload(Artifact.children),
+        selectinload(Artifact.outgoing_links),
+        selectinload(Artifact.incoming_links),
+        raiseload("*"),
+    )
+
+
+def descendants_query(root_id: uuid.UUID, project_id: uuid.UUID) -> Select:
+    """
+    All live artifacts below root_id, in one recursive CTE query.
+    
+    Rows come back shallowest first, then by position. The project filter is
+    repeated in both CTE terms so each step stays on ix_artifacts_project_parent;
+    a soft-deleted artifact hides its whole subtree, as in the tree view.
+    """
+    tree = (
+        select(Artifact.id, literal(1).label("depth"))
+        .where(
+            Artifact.parent_id == root_id,
+            Artifact.project_id == project_id,
+            Artifact.deleted_at.is_(None),
+        )
+        .cte("artifact_descendants", recursive=True)
+    )
+    child = aliased(Artifact)
+    tree = tree.union_all(
+        select(child.id, tree.c.depth + 1)
+        .join(tree, child.parent_id == tree.c.id)
+        .where(child.project_id == project_id, child.deleted_at.is_(None))
+    )
+    return (
+        select(Artifact)
+        .join(tree, Artifact.id == tree.c.id)
+        .order_by(tree.c.depth, Artifact.position)
+    )
+
+
+def ancestors_query(artifact_id: uuid.UUID, project_id: uuid.UUID) -> Select:
+    """
+    The chain of parents above artifact_id (e.g. for breadcrumbs), root first,
+    in one recursive CTE query. The artifact itself is not included.
+    """
+    chain = (
+        select(Artifact.id, Artifact.parent_id, literal(0).label("depth"))
+        .where(Artifact.id == artifact_id, Artifact.project_id == project_id)
+        .cte("artifact_ancestors", recursive=True)
+    )
+    parent = aliased(Artifact)
+    chain = chain.union_all(
+        select(parent.id, parent.parent_id, chain.c.depth + 1)
+        .join(chain, parent.id == chain.c.parent_id)
+        .where(parent.project_id == project_id)
+    )
+    return (
+        select(Artifact)
+        .join(chain, Artifact.id == chain.c.id)
+        .where(chain.c.depth > 0)
+        .order_by(chain.c.depth.desc())
+    )
+
+
 class ArtifactVersion(Base):
     """Immutable version history for artifacts."""
     
     __tablename__ = "artifact_versions"
     
+    # ORM writes use the time-ordered client default; the server default
+    # covers bulk and raw SQL inserts that omit the id
     id: Mapped[uuid.UUID] = mapped_column(
         Uuid(),
         primary_key=True,
-        default=generate_uuid,
+        default=generate_uuid7,
+        server_default=server_uuid(),
     )
     artifact_id: Mapped[uuid.UUID] = mapped_column(
         Uuid(),
@@ -321,17 +454,17 @@ class ArtifactLink(Base, TimestampMixin):
         primary_key=True,
         default=generate_uuid,
     )
+    # Indexed by ix_artifact_links_source_target (leading column)
     source_artifact_id: Mapped[uuid.UUID] = mapped_column(
         Uuid(),
         ForeignKey("artifacts.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
+    # Indexed by ix_artifact_links_target_cover
     target_artifact_id: Mapped[uuid.UUID] = mapped_column(
         Uuid(),
         ForeignKey("artifacts.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     link_type: Mapped[LinkType] = mapped_column(
         String(50),
@@ -367,7 +500,19 @@ class ArtifactLink(Base, TimestampMixin):
     )
     
     __table_args__ = (
-        Index("ix_artifact_links_source_target", "source_artifact_id", "target_artifact_id"),
+        # Covering (INCLUDE, PostgreSQL) so link traversals and counts in
+        # either direction are index-only scans with no heap fetch per link
+        Index(
+            "ix_artifact_links_source_target",
+            "source_artifact_id",
+            "target_artifact_id",
+            postgresql_include=["link_type", "strength"],
+        ),
+        Index(
+            "ix_artifact_links_target_cover",
+            "target_artifact_id",
+            postgresql_include=["source_artifact_id", "link_type", "strength"],
+        ),
     )
     
     def __repr__(self) -> str:
@@ -440,7 +585,7 @@ class Evidence(Base, TimestampMixin):
         nullable=False,
     )
     source_refs: Mapped[Optional[List[str]]] = mapped_column(
-        JSON,
+        JSONPayload(),
         nullable=True,
     )
 
@@ -464,13 +609,13 @@ class Source(Base, TimestampMixin):
     
     # Citation data
     citation_data: Mapped[dict] = mapped_column(
-        JSON,
+        JSONPayload(),
         nullable=False,
     )
+    # Indexed as lower(doi) (see __table_args__): DOIs are case-insensitive
     doi: Mapped[Optional[str]] = mapped_column(
         String(255),
         nullable=True,
-        index=True,
     )
     isbn: Mapped[Optional[str]] = mapped_column(
         String(20),
@@ -495,6 +640,10 @@ class Source(Base, TimestampMixin):
         Text,
         nullable=True,
     )
+    
+    __table_args__ = (
+        Index("ix_sources_doi_lower", func.lower(doi)),
+    )
 
 
 class ProvenanceRecord(Base):
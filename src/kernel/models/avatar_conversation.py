@@ -2,14 +2,30 @@
 Avatar conversation models – persistent message history for the teaching avatar.
 """
 
+import asyncio
+import importlib.util
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence
 
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, aliased, mapped_column
 
-from src.kernel.models.base import Base, generate_uuid
+from src.kernel.models.base import Base, generate_uuid7, server_uuid
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Model whose tokenizer is used for AvatarMessage.token_count
+TOKEN_COUNT_MODEL = "gpt-4o"
+
+# Longer content is estimated instead of tokenized; token_count is advisory
+MAX_TOKENIZED_CHARS = 32_000
+
+# tiktoken encodings by model, filled by load_token_encoding(); only
+# successful loads are kept, so a failed load can be retried
+_encodings: Dict[str, Any] = {}
 
 
 class AvatarMessage(Base):
@@ -18,13 +34,18 @@ class AvatarMessage(Base):
 
     Stores the full conversation history per user+project so the avatar
     can sustain multi-turn Socratic exchanges and remember context.
+    On PostgreSQL the table is range-partitioned by month on created_at
+    (migration 0020), with a (id, created_at) primary key.
     """
 
     __tablename__ = "avatar_messages"
 
+    # ORM writes use the time-ordered client default; the server default
+    # covers bulk and raw SQL inserts that omit the id
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
-        default=generate_uuid,
+        default=generate_uuid7,
+        server_default=server_uuid(),
     )
     project_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("research_projects.id", ondelete="CASCADE"),
@@ -56,8 +77,107 @@ class AvatarMessage(Base):
     )
 
     __table_args__ = (
+        # Keyset pagination: (created_at, id) < cursor ORDER BY both DESC is
+        # a backward range scan; id breaks ties between same-timestamp rows
         Index(
             "ix_avatar_messages_project_user_created",
-            "project_id", "user_id", "created_at",
+            "project_id", "user_id", "created_at", "id",
         ),
     )
+
+
+def load_token_encoding(model: str = TOKEN_COUNT_MODEL) -> bool:
+    """
+    Load the tiktoken encoding for `model` so count_tokens can use it.
+
+    Blocking: on a cold tiktoken cache this downloads the BPE file, so call
+    it off the event loop. Returns False if tiktoken is unavailable.
+    """
+    if model in _encodings:
+        return True
+    try:
+        import tiktoken
+
+        _encodings[model] = tiktoken.encoding_for_model(model)
+        return True
+    except Exception as exc:
+        # Not installed, unknown model, or the BPE file could not be fetched
+        logger.warning("tiktoken unavailable for %s, estimating tokens: %s", model, exc)
+        return False
+
+
+async def run_token_encoding_loader(
+    model: str = TOKEN_COUNT_MODEL,
+    retry_seconds: float = 5 * 60,
+) -> None:
+    """Background task loading the encoding in a thread, retrying until it succeeds."""
+    if importlib.util.find_spec("tiktoken") is None:
+        logger.warning("tiktoken is not installed, estimating avatar message tokens")
+        return
+    while not await asyncio.to_thread(load_token_encoding, model):
+        await asyncio.sleep(retry_seconds)
+
+
+def count_tokens(content: str, model: str = TOKEN_COUNT_MODEL) -> int:
+    """
+    Token count of `content` for `model`, for context window management.
+
+    Falls back to ~4 characters per token until the encoding is loaded (see
+    load_token_encoding), without tiktoken, or for very long content.
+    """
+    encoding = _encodings.get(model)
+    if encoding is None or len(content) > MAX_TOKENIZED_CHARS:
+        return max(1, len(content) // 4) if content else 0
+    # encode_ordinary skips the special-token scan that encode() performs
+    return len(encoding.encode_ordinary(content))
+
+
+async def fetch_recent(
+    session: AsyncSession,
+    project_id: uuid.UUID,
+    user_id: uuid.UUID,
+    before_id: Optional[uuid.UUID] = None,
+    limit: int = 50,
+    roles: Optional[Sequence[str]] = None,
+    token_budget: Optional[int] = None,
+) -> List[AvatarMessage]:
+    """
+    Most recent messages of a conversation, newest first.
+
+    Keyset-paginated: pass the id of the oldest message already loaded as
+    `before_id` to get the page before it, so every page is one bounded
+    index range scan instead of an OFFSET over the whole history. With
+    `token_budget`, stops once the messages kept would exceed it (the
+    newest message is always kept).
+    """
+    q = select(AvatarMessage).where(
+        AvatarMessage.project_id == project_id,
+        AvatarMessage.user_id == user_id,
+    )
+    if roles is not None:
+        q = q.where(AvatarMessage.role.in_(roles))
+    if before_id is not None:
+        # Cursor values come from the row itself (an unknown id matches
+        # nothing), so they compare exactly as stored
+        cursor = aliased(AvatarMessage)
+        q = q.where(
+            tuple_(AvatarMessage.created_at, AvatarMessage.id)
+            < select(cursor.created_at, cursor.id)
+            .where(cursor.id == before_id)
+            .scalar_subquery()
+        )
+    q = q.order_by(AvatarMessage.created_at.desc(), AvatarMessage.id.desc()).limit(limit)
+
+    result = await session.execute(q)
+    messages = list(result.scalars())
+    if token_budget is None:
+        return messages
+
+    kept: List[AvatarMessage] = []
+    used = 0
+    for message in messages:
+        used += message.token_count or count_tokens(message.content)
+        if kept and used > token_budget:
+            break
+        kept.append(message)
+    return kept
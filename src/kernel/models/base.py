@@ -2,12 +2,21 @@
 Base model with common fields and utilities.
 """
 
+import os
+import time
 import uuid
 from datetime import datetime
-from typing import Any
+from typing import Any, Dict, List, Sequence
 
-from sqlalchemy import DateTime, func, Uuid
+import orjson
+from pydantic import BaseModel
+from sqlalchemy import DateTime, func, insert, JSON, String, Uuid, literal
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.types import TypeDecorator
 
 
 class Base(DeclarativeBase):
@@ -52,3 +61,169 @@ class SoftDeleteMixin:
 def generate_uuid() -> uuid.UUID:
     """Generate a new UUID."""
     return uuid.uuid4()
+
+
+def generate_uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+    
+    The top 48 bits are the Unix time in milliseconds, so ids created close
+    together land next to each other in a B-tree primary key index instead of
+    at random pages. Used for append-heavy tables. Rows that already hold
+    version 4 ids are unaffected; both versions share the same column type.
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    value = (unix_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    # Version nibble (0111) and RFC 4122 variant bits (10)
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
+
+async def bulk_insert(
+    session: AsyncSession,
+    model: type,
+    rows: Sequence[Dict[str, Any]],
+) -> List[uuid.UUID]:
+    """
+    Insert many rows of `model` with one ORM bulk INSERT; returns their ids.
+    
+    Rows without an id get a time-ordered one here, so no RETURNING round
+    trip is needed. This skips the unit of work: no objects enter the
+    identity map and relationships/backrefs on loaded objects are not
+    updated. Runs in the session's current transaction.
+    """
+    rows = [row if "id" in row else {**row, "id": generate_uuid7()} for row in rows]
+    if rows:
+        await session.execute(insert(model), rows)
+    return [row["id"] for row in rows]
+
+
+class server_uuid(FunctionElement):
+    """
+    Server-side random UUID, for use as a server_default.
+    
+    Rendered as gen_random_uuid() on PostgreSQL and as 32 random hex chars
+    (the Uuid() storage format) on SQLite.
+    """
+    
+    type = Uuid()
+    inherit_cache = True
+
+
+@compiles(server_uuid, "postgresql")
+def _server_uuid_postgresql(element, compiler, **kw) -> str:
+    return "gen_random_uuid()"
+
+
+@compiles(server_uuid)
+def _server_uuid_default(element, compiler, **kw) -> str:
+    return "(lower(hex(randomblob(16))))"
+
+
+def _json_default(value: Any) -> Any:
+    """orjson fallback for types it does not serialize natively."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class JSONPayload(TypeDecorator):
+    """
+    JSON column (JSONB on PostgreSQL) bound with orjson.
+    
+    Values may hold UUID, datetime, enum and Pydantic models at any depth;
+    they are encoded in one orjson.dumps call instead of being converted to
+    JSON-safe types first and then re-encoded by the stdlib serializer.
+    """
+    
+    impl = JSON
+    cache_ok = True
+    
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(JSON())
+    
+    @staticmethod
+    def serialize(value: Any) -> str:
+        """Encode a value exactly as it is bound to the column."""
+        return orjson.dumps(
+            value, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+    
+    def bind_processor(self, dialect):
+        serialize = self.serialize
+        
+        def process(value):
+            return None if value is None else serialize(value)
+        
+        return process
+
+
+class UuidArray(TypeDecorator):
+    """
+    List of UUIDs: uuid[] on PostgreSQL, a JSON array of strings elsewhere.
+    
+    Accepts UUIDs or their string form and always loads uuid.UUID values.
+    On PostgreSQL the column can back a GIN index for ANY()/@> lookups.
+    """
+    
+    impl = JSON
+    cache_ok = True
+    
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(ARRAY(Uuid()))
+        return dialect.type_descriptor(JSON())
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        ids = [v if isinstance(v, uuid.UUID) else uuid.UUID(str(v)) for v in value]
+        if dialect.name == "postgresql":
+            return ids
+        return [str(v) for v in ids]
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return [v if isinstance(v, uuid.UUID) else uuid.UUID(v) for v in value]
+
+
+class json_set_key(FunctionElement):
+    """
+    A JSONPayload column with one top-level key set, for in-place UPDATEs.
+    
+    Rendered as jsonb_set() on PostgreSQL and json_set() on SQLite, so only
+    the new value travels to the database instead of the whole document.
+    A NULL column is treated as an empty object.
+    """
+    
+    type = JSONPayload()
+    inherit_cache = True
+    
+    def __init__(self, column: Any, key: str, value: Any):
+        super().__init__(
+            column,
+            literal(key, String()),
+            literal(JSONPayload.serialize(value), String()),
+        )
+
+
+@compiles(json_set_key, "postgresql")
+def _json_set_key_postgresql(element, compiler, **kw) -> str:
+    column, key, value = (compiler.process(c, **kw) for c in element.clauses)
+    return (
+        f"jsonb_set(coalesce({column}, '{{}}'::jsonb), "
+        f"ARRAY[CAST({key} AS text)], CAST({value} AS jsonb))"
+    )
+
+
+@compiles(json_set_key)
+def _json_set_key_default(element, compiler, **kw) -> str:
+    column, key, value = (compiler.process(c, **kw) for c in element.clauses)
+    return (
+        f"json_set(coalesce({column}, '{{}}'), "
+        f"'$.\"' || {key} || '\"', json({value}))"
+    )
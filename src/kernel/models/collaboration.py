@@ -5,12 +5,21 @@ Collaboration models - comments, reviews, and approval gates.
 import uuid
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text, func, Uuid, JSON
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text, func, text, update, Uuid
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.kernel.models.base import Base, TimestampMixin, generate_uuid
+from src.kernel.models.base import (
+    Base,
+    JSONPayload,
+    TimestampMixin,
+    bulk_insert,
+    generate_uuid,
+    generate_uuid7,
+    json_set_key,
+)
 
 if TYPE_CHECKING:
     from src.kernel.models.user import User
@@ -71,6 +80,23 @@ class CommentThread(Base, TimestampMixin):
         order_by="Comment.created_at",
     )
     
+    __table_args__ = (
+        # Open threads of an artifact (list_comment_threads without resolved ones)
+        Index(
+            "ix_comment_threads_unresolved",
+            "artifact_id",
+            postgresql_where=text("resolved = false"),
+            sqlite_where=text("resolved = 0"),
+        ),
+    )
+    
+    @classmethod
+    async def bulk_create(
+        cls, session: AsyncSession, rows: Sequence[Dict[str, Any]]
+    ) -> List[uuid.UUID]:
+        """Insert many threads at once (see bulk_insert); returns their ids."""
+        return await bulk_insert(session, cls, rows)
+    
     def __repr__(self) -> str:
         return f"<CommentThread {self.id} artifact={self.artifact_id}>"
 
@@ -83,7 +109,7 @@ class Comment(Base, TimestampMixin):
     id: Mapped[uuid.UUID] = mapped_column(
         Uuid(),
         primary_key=True,
-        default=generate_uuid,
+        default=generate_uuid7,
     )
     thread_id: Mapped[uuid.UUID] = mapped_column(
         Uuid(),
@@ -119,6 +145,13 @@ class Comment(Base, TimestampMixin):
         back_populates="comments",
     )
     
+    @classmethod
+    async def bulk_create(
+        cls, session: AsyncSession, rows: Sequence[Dict[str, Any]]
+    ) -> List[uuid.UUID]:
+        """Insert many comments at once (see bulk_insert); returns their ids."""
+        return await bulk_insert(session, cls, rows)
+    
     def __repr__(self) -> str:
         return f"<Comment {self.id} by {self.author_id}>"
 
@@ -187,7 +220,7 @@ class ReviewRequest(Base, TimestampMixin):
         nullable=True,
     )
     required_changes: Mapped[Optional[dict]] = mapped_column(
-        JSON,
+        JSONPayload(),
         nullable=True,
     )
     optional_suggestions: Mapped[Optional[str]] = mapped_column(
@@ -195,8 +228,35 @@ class ReviewRequest(Base, TimestampMixin):
         nullable=True,
     )
     
+    __table_args__ = (
+        # Advisor queue: reviewer_id = ? [AND status = ?] ORDER BY created_at DESC
+        Index("ix_review_requests_reviewer_time", "reviewer_id", "created_at"),
+    )
+    
     def __repr__(self) -> str:
         return f"<ReviewRequest {self.id} status={self.status.value}>"
+    
+    async def patch_required_change(
+        self, session: AsyncSession, key: str, value: Any
+    ) -> None:
+        """
+        Set one entry of required_changes with a server-side JSON update.
+        
+        Other keys are left untouched, so concurrent patches to different
+        keys do not overwrite each other. The loaded attribute is expired
+        and reloads on next access.
+        """
+        await session.execute(
+            update(ReviewRequest)
+            .where(ReviewRequest.id == self.id)
+            .values(
+                required_changes=json_set_key(
+                    ReviewRequest.required_changes, key, value
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+        session.expire(self, ["required_changes"])
 
 
 class ApprovalGate(Base, TimestampMixin):
@@ -243,7 +303,7 @@ class ApprovalGate(Base, TimestampMixin):
     
     # Requirements
     requirements: Mapped[Optional[dict]] = mapped_column(
-        type_=Text,  # Store as JSON string
+        JSONPayload(),
         nullable=True,
     )
     
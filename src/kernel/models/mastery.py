@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, List, Optional
 from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, String, Text, func, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.kernel.models.base import Base, TimestampMixin, generate_uuid
+from src.kernel.models.base import Base, TimestampMixin, generate_uuid, server_uuid
 
 if TYPE_CHECKING:
     from src.kernel.models.user import User
@@ -27,6 +27,7 @@ class UserMasteryProgress(Base, TimestampMixin):
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
         default=generate_uuid,
+        server_default=server_uuid(),
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
@@ -77,11 +78,12 @@ class CheckpointAttempt(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
         default=generate_uuid,
+        server_default=server_uuid(),
     )
+    # Lookups by user use the ix_checkpoint_attempts_user_project_type prefix
     user_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     project_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("research_projects.id", ondelete="CASCADE"),
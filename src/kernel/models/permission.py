@@ -2,15 +2,16 @@
 Permission models for RBAC.
 """
 
+import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, func, Index, Uuid
+from sqlalchemy import Boolean, DateTime, Enum as SQLEnum, ForeignKey, func, Index, text, Uuid
 from sqlalchemy.orm import Mapped, mapped_column
 
-from src.kernel.models.base import Base, generate_uuid
+from src.kernel.models.base import Base, generate_uuid, server_uuid
 
 
 class PermissionLevel(str, Enum):
@@ -43,6 +44,7 @@ class Permission(Base):
         Uuid(),
         primary_key=True,
         default=generate_uuid,
+        server_default=server_uuid(),
     )
     
     # Subject (who has the permission)
@@ -55,7 +57,12 @@ class Permission(Base):
     
     # Resource (what the permission is for)
     resource_type: Mapped[ResourceType] = mapped_column(
-        String(50),
+        SQLEnum(
+            ResourceType,
+            name="resource_type",
+            length=50,
+            values_callable=lambda types: [t.value for t in types],
+        ),
         nullable=False,
     )
     resource_id: Mapped[uuid.UUID] = mapped_column(
@@ -65,7 +72,12 @@ class Permission(Base):
     
     # Permission level
     level: Mapped[PermissionLevel] = mapped_column(
-        String(50),
+        SQLEnum(
+            PermissionLevel,
+            name="permission_level",
+            length=50,
+            values_callable=lambda levels: [level.value for level in levels],
+        ),
         nullable=False,
     )
     
@@ -99,8 +111,27 @@ class Permission(Base):
     )
     
     __table_args__ = (
-        Index("ix_permissions_user_resource", "user_id", "resource_type", "resource_id"),
+        # Permission checks and revocation only look at unrevoked grants; the
+        # partial index skips revoked rows and INCLUDE answers the expiry and
+        # level checks from the index alone on PostgreSQL
+        Index(
+            "ix_permissions_user_resource",
+            "user_id",
+            "resource_type",
+            "resource_id",
+            postgresql_where=text("revoked = false"),
+            sqlite_where=text("revoked = 0"),
+            postgresql_include=["expires_at", "level"],
+        ),
         Index("ix_permissions_resource", "resource_type", "resource_id"),
+        # Expiry sweep (PermissionService.revoke_expired_permissions): only
+        # unrevoked grants that can expire
+        Index(
+            "ix_permissions_cleanup",
+            "expires_at",
+            postgresql_where=text("revoked = false AND expires_at IS NOT NULL"),
+            sqlite_where=text("revoked = 0 AND expires_at IS NOT NULL"),
+        ),
     )
     
     def __repr__(self) -> str:
@@ -111,6 +142,10 @@ class Permission(Base):
         """Check if permission is currently valid."""
         if self.revoked:
             return False
-        if self.expires_at and self.expires_at < datetime.utcnow():
-            return False
-        return True
+        if self.expires_at is None:
+            return True
+        expires_at = self.expires_at
+        # SQLite hands back naive datetimes; they are stored as UTC
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return expires_at.timestamp() > time.time()
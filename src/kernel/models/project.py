@@ -7,10 +7,10 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func, Uuid
+from sqlalchemy import DateTime, Enum as SQLEnum, ForeignKey, String, Text, func, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.kernel.models.base import Base, TimestampMixin, SoftDeleteMixin, generate_uuid
+from src.kernel.models.base import Base, TimestampMixin, SoftDeleteMixin, generate_uuid, server_uuid
 
 if TYPE_CHECKING:
     from src.kernel.models.user import User
@@ -51,6 +51,7 @@ class ResearchProject(Base, TimestampMixin, SoftDeleteMixin):
         Uuid(),
         primary_key=True,
         default=generate_uuid,
+        server_default=server_uuid(),
     )
     title: Mapped[str] = mapped_column(
         String(500),
@@ -66,7 +67,12 @@ class ResearchProject(Base, TimestampMixin, SoftDeleteMixin):
         nullable=False,
     )
     status: Mapped[ProjectStatus] = mapped_column(
-        String(50),
+        SQLEnum(
+            ProjectStatus,
+            name="project_status",
+            length=50,
+            values_callable=lambda statuses: [status.value for status in statuses],
+        ),
         default=ProjectStatus.DRAFT,
         nullable=False,
     )
@@ -124,6 +130,7 @@ class ProjectShare(Base, TimestampMixin):
         Uuid(),
         primary_key=True,
         default=generate_uuid,
+        server_default=server_uuid(),
     )
     project_id: Mapped[uuid.UUID] = mapped_column(
         Uuid(),
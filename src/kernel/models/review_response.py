@@ -12,7 +12,7 @@ from typing import Optional
 from sqlalchemy import DateTime, ForeignKey, String, Text, func, Index, JSON, Uuid
 from sqlalchemy.orm import Mapped, mapped_column
 
-from src.kernel.models.base import Base, generate_uuid
+from src.kernel.models.base import Base, generate_uuid, server_uuid
 
 
 class ReviewResponse(Base):
@@ -24,6 +24,7 @@ class ReviewResponse(Base):
         Uuid(),
         primary_key=True,
         default=generate_uuid,
+        server_default=server_uuid(),
     )
     review_request_id: Mapped[uuid.UUID] = mapped_column(
         Uuid(),
@@ -9,10 +9,10 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func, Index, JSON, Uuid
+from sqlalchemy import DateTime, Enum as SQLEnum, ForeignKey, String, Text, func, Index, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.kernel.models.base import Base, TimestampMixin, generate_uuid
+from src.kernel.models.base import Base, TimestampMixin, UuidArray, generate_uuid, server_uuid
 
 if TYPE_CHECKING:
     from src.kernel.models.project import ResearchProject
@@ -46,6 +46,7 @@ class SubmissionUnit(Base, TimestampMixin):
         Uuid(),
         primary_key=True,
         default=generate_uuid,
+        server_default=server_uuid(),
     )
     project_id: Mapped[uuid.UUID] = mapped_column(
         Uuid(),
@@ -58,15 +59,20 @@ class SubmissionUnit(Base, TimestampMixin):
         nullable=False,
     )
 
-    # Artifact IDs in this unit (JSON array)
-    artifact_ids: Mapped[Optional[list]] = mapped_column(
-        JSON,
+    # Artifact IDs in this unit (uuid[] on PostgreSQL, JSON array elsewhere)
+    artifact_ids: Mapped[Optional[List[uuid.UUID]]] = mapped_column(
+        UuidArray(),
         nullable=True,
     )
 
     # State (authoritative for review, defense, export)
     state: Mapped[SubmissionUnitState] = mapped_column(
-        String(50),
+        SQLEnum(
+            SubmissionUnitState,
+            name="submission_unit_state",
+            length=50,
+            values_callable=lambda states: [state.value for state in states],
+        ),
         default=SubmissionUnitState.DRAFT,
         nullable=False,
     )
@@ -102,6 +108,12 @@ class SubmissionUnit(Base, TimestampMixin):
 
     __table_args__ = (
         Index("ix_submission_units_project_state", "project_id", "state"),
+        # Units containing an artifact (artifact_ids @> ARRAY[...]), PostgreSQL only
+        Index(
+            "ix_submission_units_artifact_ids",
+            "artifact_ids",
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
     )
 
     def __repr__(self) -> str:
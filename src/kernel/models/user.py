@@ -7,10 +7,10 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import Boolean, DateTime, String, Text, func, Uuid
+from sqlalchemy import Boolean, CheckConstraint, DateTime, Enum as SQLEnum, Index, String, Text, func, text, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.kernel.models.base import Base, TimestampMixin, generate_uuid
+from src.kernel.models.base import Base, TimestampMixin, generate_uuid, server_uuid
 
 if TYPE_CHECKING:
     from src.kernel.models.project import ResearchProject, ProjectShare
@@ -34,6 +34,7 @@ class User(Base, TimestampMixin):
         Uuid(),
         primary_key=True,
         default=generate_uuid,
+        server_default=server_uuid(),
     )
     email: Mapped[str] = mapped_column(
         String(255),
@@ -49,8 +50,15 @@ class User(Base, TimestampMixin):
         String(255),
         nullable=False,
     )
+    # Native user_role enum on PostgreSQL, VARCHAR(50) on SQLite; always
+    # loaded as UserRole
     role: Mapped[UserRole] = mapped_column(
-        String(50),
+        SQLEnum(
+            UserRole,
+            name="user_role",
+            length=50,
+            values_callable=lambda roles: [role.value for role in roles],
+        ),
         default=UserRole.STUDENT,
         nullable=False,
     )
@@ -94,6 +102,15 @@ class User(Base, TimestampMixin):
         back_populates="author",
     )
     
+    __table_args__ = (
+        # Emails are stored already normalized (see normalize_email), so the
+        # plain unique index on email serves every lookup without lower()
+        CheckConstraint(
+            "email = lower(trim(email))",
+            name="ck_users_email_normalized",
+        ),
+    )
+    
     def __repr__(self) -> str:
         return f"<User {self.email}>"
 
@@ -107,6 +124,7 @@ class RefreshToken(Base):
         Uuid(),
         primary_key=True,
         default=generate_uuid,
+        server_default=server_uuid(),
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         Uuid(),
@@ -132,3 +150,21 @@ class RefreshToken(Base):
         server_default=func.now(),
         nullable=False,
     )
+    
+    __table_args__ = (
+        # Partial indexes over live (unrevoked) tokens only, for the refresh
+        # rotation lookup and logout(revoke_all=True)
+        Index(
+            "ix_refresh_tokens_hash_live",
+            "token_hash",
+            "expires_at",
+            postgresql_where=text("revoked = false"),
+            sqlite_where=text("revoked = 0"),
+        ),
+        Index(
+            "ix_refresh_tokens_user_live",
+            "user_id",
+            postgresql_where=text("revoked = false"),
+            sqlite_where=text("revoked = 0"),
+        ),
+    )
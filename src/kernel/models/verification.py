@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Optional
 from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
-from src.kernel.models.base import Base, TimestampMixin, generate_uuid
+from src.kernel.models.base import Base, TimestampMixin, generate_uuid, server_uuid
 
 if TYPE_CHECKING:
     from src.kernel.models.artifact import Source
@@ -27,6 +27,7 @@ class ContentVerificationRequest(Base, TimestampMixin):
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
         default=generate_uuid,
+        server_default=server_uuid(),
     )
     source_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("sources.id", ondelete="CASCADE"),
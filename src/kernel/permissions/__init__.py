@@ -5,11 +5,17 @@ Permission Core - RBAC access control.
 from src.kernel.permissions.permission_service import (
     PermissionService,
     check_permission,
+    clear_permission_cache,
+    permission_cache_scope,
     require_permission,
+    run_permission_expiry_sweep,
 )
 
 __all__ = [
     "PermissionService",
     "check_permission",
+    "clear_permission_cache",
+    "permission_cache_scope",
     "require_permission",
+    "run_permission_expiry_sweep",
 ]
@@ -2,17 +2,23 @@
 Permission service for RBAC access control.
 """
 
+import asyncio
 import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from functools import wraps
-from typing import Callable, List, Optional, Set
+from typing import Any, Callable, Dict, Iterator, Iterable, List, Optional, Sequence, Set, Tuple
 
-from sqlalchemy import select, and_, or_
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Select, exists, select, and_, or_, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.kernel.models.permission import Permission, PermissionLevel, ResourceType
 from src.kernel.models.project import ProjectShare, ResearchProject, PermissionLevel as SharePermissionLevel
 from src.kernel.models.user import User, UserRole
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
 
 
 # Permission hierarchy - higher levels include all lower levels
@@ -25,6 +31,36 @@ PERMISSION_HIERARCHY = {
     PermissionLevel.OWNER: 5,
 }
 
+# (resource_type, resource_id) pairs per query in check_permissions_bulk;
+# keeps bind parameters well under SQLite's limit
+BULK_CHECK_CHUNK_SIZE = 500
+
+# Per-request results of check_project_permission/check_artifact_permission,
+# keyed by (user_id, resource_type, resource_id, level). None outside a
+# permission_cache_scope(), which disables caching. A request checks only a
+# handful of keys, so a plain dict is enough.
+_request_cache: ContextVar[Optional[Dict[tuple, bool]]] = ContextVar(
+    "rbac_cache", default=None
+)
+
+
+@contextmanager
+def permission_cache_scope() -> Iterator[None]:
+    """Cache permission checks until the block exits (one HTTP request)."""
+    token = _request_cache.set({})
+    try:
+        yield
+    finally:
+        _request_cache.reset(token)
+
+
+def clear_permission_cache() -> None:
+    """Forget cached checks, e.g. after permissions change mid-request."""
+    cache = _request_cache.get()
+    if cache is not None:
+        cache.clear()
+
+
 # Map share permission levels to general permission levels
 SHARE_TO_PERMISSION = {
     SharePermissionLevel.VIEW: PermissionLevel.VIEW,
@@ -69,41 +105,51 @@ class PermissionService:
         Returns:
             True if user has sufficient permission
         """
-        required_rank = PERMISSION_HIERARCHY[required_level]
-        
+        cache = _request_cache.get()
+        key = (user.id, ResourceType.PROJECT, project_id, required_level)
+        if cache is not None and key in cache:
+            return cache[key]
+        allowed = await self._check_project_permission(user, project_id, required_level)
+        if cache is not None:
+            cache[key] = allowed
+        return allowed
+    
+    async def _check_project_permission(
+        self,
+        user: User,
+        project_id: uuid.UUID,
+        required_level: PermissionLevel,
+    ) -> bool:
         # Admins have full access
         if user.role == UserRole.ADMIN:
             return True
         
-        # Check if user is owner
-        query = select(ResearchProject).where(
+        result = await self.session.execute(self._project_access_query(user, project_id))
+        return self._allows(result.one(), required_level)
+    
+    @staticmethod
+    def _project_access_query(user: User, project_id: Any) -> Select:
+        """
+        Ownership, share level and explicit grant of `user` on a project.
+        
+        One round trip; most checks of non-owners would otherwise pay for
+        three queries. `project_id` may be a UUID or a scalar subquery that
+        yields one (e.g. an artifact's project).
+        """
+        is_owner = exists().where(
             and_(
                 ResearchProject.id == project_id,
                 ResearchProject.owner_id == user.id,
                 ResearchProject.deleted_at.is_(None),
             )
         )
-        result = await self.session.execute(query)
-        if result.scalar_one_or_none():
-            return True  # Owner has all permissions
-        
-        # Check project shares
-        query = select(ProjectShare).where(
+        share_level = select(ProjectShare.permission_level).where(
             and_(
                 ProjectShare.project_id == project_id,
                 ProjectShare.user_id == user.id,
             )
-        )
-        result = await self.session.execute(query)
-        share = result.scalar_one_or_none()
-        
-        if share:
-            share_level = SHARE_TO_PERMISSION.get(share.permission_level, PermissionLevel.VIEW)
-            if PERMISSION_HIERARCHY[share_level] >= required_rank:
-                return True
-        
-        # Check explicit permissions
-        query = select(Permission).where(
+        ).scalar_subquery()
+        grant_level = select(Permission.level).where(
             and_(
                 Permission.user_id == user.id,
                 Permission.resource_type == ResourceType.PROJECT,
@@ -114,11 +160,24 @@ class PermissionService:
                     Permission.expires_at > datetime.now(timezone.utc),
                 ),
             )
-        )
-        result = await self.session.execute(query)
-        permission = result.scalar_one_or_none()
+        ).limit(1).scalar_subquery()
+        return select(is_owner, share_level, grant_level)
+    
+    @staticmethod
+    def _allows(access: Sequence[Any], required_level: PermissionLevel) -> bool:
+        """Whether a _project_access_query row grants `required_level`."""
+        required_rank = PERMISSION_HIERARCHY[required_level]
+        owner, share, grant = access
+        
+        if owner:
+            return True  # Owner has all permissions
+        
+        if share is not None:
+            level = SHARE_TO_PERMISSION.get(share, PermissionLevel.VIEW)
+            if PERMISSION_HIERARCHY[level] >= required_rank:
+                return True
         
-        if permission and PERMISSION_HIERARCHY[permission.level] >= required_rank:
+        if grant is not None and PERMISSION_HIERARCHY[PermissionLevel(grant)] >= required_rank:
             return True
         
         return False
@@ -144,16 +203,147 @@ class PermissionService:
         """
         from src.kernel.models.artifact import Artifact
         
-        # Get the artifact's project
-        query = select(Artifact).where(Artifact.id == artifact_id)
+        cache = _request_cache.get()
+        key = (user.id, ResourceType.ARTIFACT, artifact_id, required_level)
+        if cache is not None and key in cache:
+            return cache[key]
+        
+        # The artifact's project is resolved inside the permission query, so
+        # the check (including the existence test) is one round trip
+        project_id = select(Artifact.project_id).where(
+            Artifact.id == artifact_id
+        ).scalar_subquery()
+        query = self._project_access_query(user, project_id).add_columns(project_id)
         result = await self.session.execute(query)
-        artifact = result.scalar_one_or_none()
+        *access, artifact_project_id = result.one()
         
-        if not artifact:
-            return False
+        allowed = artifact_project_id is not None and (
+            user.role == UserRole.ADMIN or self._allows(access, required_level)
+        )
+        if cache is not None:
+            cache[key] = allowed
+        return allowed
+    
+    async def check_permissions_bulk(
+        self,
+        user_id: uuid.UUID,
+        resources: Iterable[Tuple[ResourceType, uuid.UUID]],
+    ) -> Dict[Tuple[ResourceType, uuid.UUID], PermissionLevel]:
+        """
+        Explicit permission grants of a user on many resources at once.
+        
+        One (resource_type, resource_id) IN (...) query per chunk of
+        BULK_CHECK_CHUNK_SIZE pairs, instead of one query per resource.
+        Only covers explicit grants (not roles, ownership or shares).
+        
+        Args:
+            user_id: The user to check
+            resources: (resource_type, resource_id) pairs
+            
+        Returns:
+            Granted level keyed by (resource_type, resource_id); resources
+            without a valid grant are absent
+        """
+        pairs = list(dict.fromkeys(resources))
+        levels: Dict[Tuple[ResourceType, uuid.UUID], PermissionLevel] = {}
+        now = datetime.now(timezone.utc)
+        for start in range(0, len(pairs), BULK_CHECK_CHUNK_SIZE):
+            chunk = pairs[start:start + BULK_CHECK_CHUNK_SIZE]
+            query = select(
+                Permission.resource_type, Permission.resource_id, Permission.level
+            ).where(
+                and_(
+                    Permission.user_id == user_id,
+                    tuple_(Permission.resource_type, Permission.resource_id).in_(chunk),
+                    Permission.revoked == False,
+                    or_(
+                        Permission.expires_at.is_(None),
+                        Permission.expires_at > now,
+                    ),
+                )
+            )
+            result = await self.session.execute(query)
+            for resource_type, resource_id, level in result.all():
+                key = (ResourceType(resource_type), resource_id)
+                level = PermissionLevel(level)
+                current = levels.get(key)
+                if current is None or PERMISSION_HIERARCHY[level] > PERMISSION_HIERARCHY[current]:
+                    levels[key] = level
+        return levels
+    
+    async def check_many(
+        self,
+        user: User,
+        resources: Iterable[Tuple[ResourceType, uuid.UUID]],
+        required_level: PermissionLevel,
+    ) -> Dict[Tuple[ResourceType, uuid.UUID], bool]:
+        """
+        Check one permission level on many projects, artifacts and comments.
+        
+        Artifacts and comments inherit from their project, so each resource
+        is first mapped to its project (one query per resource type) and
+        each distinct project is then checked once, however many of the
+        resources live under it.
         
-        # Check project permission
-        return await self.check_project_permission(user, artifact.project_id, required_level)
+        Args:
+            user: The user to check
+            resources: (resource_type, resource_id) pairs
+            required_level: Minimum required permission level
+            
+        Returns:
+            Verdict keyed by (resource_type, resource_id); resources that
+            do not exist are False
+        """
+        pairs = list(dict.fromkeys(resources))
+        parent_projects = await self._resolve_parent_projects(pairs)
+        project_verdicts: Dict[uuid.UUID, bool] = {}
+        verdicts: Dict[Tuple[ResourceType, uuid.UUID], bool] = {}
+        for pair in pairs:
+            project_id = parent_projects.get(pair)
+            if project_id is None:
+                verdicts[pair] = False
+                continue
+            if project_id not in project_verdicts:
+                project_verdicts[project_id] = await self.check_project_permission(
+                    user, project_id, required_level
+                )
+            verdicts[pair] = project_verdicts[project_id]
+        return verdicts
+    
+    async def _resolve_parent_projects(
+        self,
+        pairs: List[Tuple[ResourceType, uuid.UUID]],
+    ) -> Dict[Tuple[ResourceType, uuid.UUID], uuid.UUID]:
+        """Project id of each (resource_type, resource_id); missing resources are absent."""
+        from src.kernel.models.artifact import Artifact
+        from src.kernel.models.collaboration import Comment, CommentThread
+        
+        ids_by_type: Dict[ResourceType, List[uuid.UUID]] = {}
+        for resource_type, resource_id in pairs:
+            ids_by_type.setdefault(ResourceType(resource_type), []).append(resource_id)
+        
+        projects: Dict[Tuple[ResourceType, uuid.UUID], uuid.UUID] = {
+            (ResourceType.PROJECT, project_id): project_id
+            for project_id in ids_by_type.get(ResourceType.PROJECT, [])
+        }
+        lookups = {
+            ResourceType.ARTIFACT: lambda ids: select(Artifact.id, Artifact.project_id).where(
+                Artifact.id.in_(ids)
+            ),
+            ResourceType.COMMENT: lambda ids: select(Comment.id, Artifact.project_id)
+            .join(CommentThread, Comment.thread_id == CommentThread.id)
+            .join(Artifact, CommentThread.artifact_id == Artifact.id)
+            .where(Comment.id.in_(ids)),
+        }
+        for resource_type, build_query in lookups.items():
+            ids = ids_by_type.get(resource_type, [])
+            for start in range(0, len(ids), BULK_CHECK_CHUNK_SIZE):
+                result = await self.session.execute(
+                    build_query(ids[start:start + BULK_CHECK_CHUNK_SIZE])
+                )
+                for resource_id, project_id in result.all():
+                    projects[(resource_type, resource_id)] = project_id
+        return projects
     
     async def get_user_projects(
         self,
@@ -223,7 +413,7 @@ class PermissionService:
         Returns:
             The created Permission record
         """
-        # Revoke any existing permission for this resource
+        # Revoke any existing permission for this resource (clears the cache)
         await self.revoke_permission(user_id, resource_type, resource_id)
         
         permission = Permission(
@@ -266,6 +456,7 @@ class PermissionService:
         result = await self.session.execute(query)
         permission = result.scalar_one_or_none()
         
+        clear_permission_cache()
         if permission:
             permission.revoked = True
             permission.revoked_at = datetime.now(timezone.utc)
@@ -273,6 +464,32 @@ class PermissionService:
         
         return False
     
+    async def revoke_expired_permissions(self) -> int:
+        """
+        Mark unrevoked permissions past their expiry as revoked.
+        
+        Checks already ignore expired grants; this keeps them out of the
+        unrevoked-only indexes. Uses ix_permissions_cleanup.
+        
+        Returns:
+            Number of permissions revoked
+        """
+        now = datetime.now(timezone.utc)
+        result = await self.session.execute(
+            update(Permission)
+            .where(
+                and_(
+                    Permission.revoked == False,
+                    Permission.expires_at.is_not(None),
+                    Permission.expires_at < now,
+                )
+            )
+            .values(revoked=True, revoked_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        clear_permission_cache()
+        return result.rowcount
+    
     async def get_project_collaborators(
         self,
         project_id: uuid.UUID,
@@ -328,6 +545,23 @@ class PermissionService:
 
 # Convenience functions and decorators
 
+async def run_permission_expiry_sweep(
+    session_maker: async_sessionmaker,
+    interval_seconds: float = 60 * 60,
+) -> None:
+    """Background loop revoking expired permissions every `interval_seconds`."""
+    while True:
+        try:
+            async with session_maker() as session:
+                revoked = await PermissionService(session).revoke_expired_permissions()
+                await session.commit()
+            if revoked:
+                logger.info("Revoked %d expired permissions", revoked)
+        except Exception as exc:
+            logger.warning("Permission expiry sweep failed: %s", exc)
+        await asyncio.sleep(interval_seconds)
+
+
 async def check_permission(
     session: AsyncSession,
     user: User,
@@ -4,6 +4,7 @@ Research Accountability & Mastery Platform (RAMP)
 FastAPI application entry point.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -13,8 +14,16 @@ from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 
 from src.config import get_settings
-from src.database import init_db, close_db
+from src.database import async_session_maker, engine, init_db, close_db
 from src.api.v1 import router as api_v1_router
+from src.kernel.events.background_queue import (
+    BackgroundEventQueue,
+    set_background_event_queue,
+)
+from src.kernel.events.partitions import run_event_log_partition_maintenance
+from src.kernel.permissions import run_permission_expiry_sweep
+from src.kernel.models.avatar_conversation import run_token_encoding_loader
+from src.api.middleware.permission_cache import PermissionCacheMiddleware
 from src.api.middleware.rate_limit import RateLimitMiddleware
 from src.api.middleware.request_id import RequestIdMiddleware
 from src.schemas.common import HealthResponse
@@ -43,10 +52,39 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     await init_db()
     logger.info("Database initialized")
 
+    # Keep monthly partitions ahead of time (no-op unless partitioned)
+    partition_task = asyncio.create_task(
+        run_event_log_partition_maintenance(
+            engine,
+            months_ahead=settings.event_log_partition_months_ahead,
+            retention_months=settings.event_log_retention_months,
+            avatar_message_retention_months=settings.avatar_message_retention_months,
+        )
+    )
+
+    # Tokenizer for avatar message token counts; loading may download the BPE
+    # file, so it runs in a thread instead of the first chat request
+    token_encoding_task = asyncio.create_task(run_token_encoding_loader())
+
+    # Revoke expired grants so they drop out of the permission indexes
+    permission_sweep_task = asyncio.create_task(
+        run_permission_expiry_sweep(async_session_maker)
+    )
+
+    # Batched writer for telemetry events (e.g. AI suggestion generated)
+    event_queue = BackgroundEventQueue(async_session_maker)
+    event_queue.start()
+    set_background_event_queue(event_queue)
+
     yield
 
     # Shutdown
     logger.info("Shutting down...")
+    set_background_event_queue(None)
+    await event_queue.stop()
+    partition_task.cancel()
+    permission_sweep_task.cancel()
+    token_encoding_task.cancel()
     await close_db()
     logger.info("Database connections closed")
 
@@ -97,6 +135,7 @@ if not (settings.debug or settings.environment == "development"):
     _cors_origins = ["https://ramp.example.com"] + _cors_origins
 
 # Add these first (they become inner middleware)
+app.add_middleware(PermissionCacheMiddleware)
 app.add_middleware(RateLimitMiddleware)
 app.add_middleware(RequestIdMiddleware)
 
@@ -11,12 +11,14 @@ T1-T6: Cumulative connectivity checks added after each phase.
 import os
 import tempfile
 import uuid
+from contextlib import contextmanager
 from typing import AsyncGenerator
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import select
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 # Use file-based SQLite so all connections share the same DB
@@ -93,6 +95,28 @@ async def db_session():
         await session.rollback()
 
 
+@pytest.fixture
+def assert_no_n_plus_one():
+    """Context manager factory: fail if the block runs more than `limit` statements."""
+
+    @contextmanager
+    def bound(limit: int):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        # Every engine: requests use the app's engine, fixtures the test one
+        event.listen(Engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(Engine, "before_cursor_execute", record)
+        assert len(statements) <= limit, "\n".join(statements)
+
+    return bound
+
+
 def pytest_sessionfinish(session, exitstatus):
     try:
         if os.path.exists(TEST_DB_PATH):
@@ -136,7 +160,442 @@ async def test_t0_auth_register_login(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_t0_projects_crud(client: AsyncClient):
+async def test_t0_identity_logout_revokes_all_tokens(client: AsyncClient, db_session: AsyncSession):
+    """logout(revoke_all=True) revokes every live refresh token of the user."""
+    from src.kernel.identity.identity_service import IdentityService
+    from src.kernel.models.user import RefreshToken
+
+    service = IdentityService(db_session)
+    email = f"t0-{uuid.uuid4().hex[:8]}@example.com"
+    user = await service.register_user(email, "SecurePass123", "T0 Logout")
+    await service.authenticate(email, "SecurePass123")
+    await service.authenticate(email, "SecurePass123")
+    await db_session.flush()
+
+    assert await service.logout(user.id, revoke_all=True)
+    result = await db_session.execute(
+        select(RefreshToken.revoked).where(RefreshToken.user_id == user.id)
+    )
+    assert result.scalars().all() == [True, True]
+
+    await db_session.commit()
+    event_store = EventStore(db_session)
+    assert await event_store.count_events(event_type=EventType.USER_LOGGED_IN, user_id=user.id) == 2
+    assert await event_store.count_events(event_type=EventType.USER_LOGGED_OUT, user_id=user.id) == 1
+
+
+@pytest.mark.asyncio
+async def test_t0_identity_refresh_rotates_token(client: AsyncClient, db_session: AsyncSession):
+    """A refresh token can be exchanged once; the rotated-out token is rejected."""
+    from src.kernel.identity.identity_service import IdentityService
+
+    service = IdentityService(db_session)
+    email = f"t0-{uuid.uuid4().hex[:8]}@example.com"
+    user = await service.register_user(email, "SecurePass123", "T0 Refresh")
+    _, tokens = await service.authenticate(email, "SecurePass123")
+    await db_session.flush()
+
+    refreshed = await service.refresh_tokens(tokens.refresh_token)
+    assert refreshed is not None
+    assert refreshed[0].id == user.id
+    await db_session.flush()
+    assert await service.refresh_tokens(tokens.refresh_token) is None
+
+
+@pytest.mark.asyncio
+async def test_t0_identity_refresh_accepts_legacy_hash(client: AsyncClient, db_session: AsyncSession):
+    """Refresh tokens stored under the legacy SHA-256 hash still rotate and log out."""
+    from sqlalchemy import update
+
+    from src.kernel.identity.identity_service import IdentityService
+    from src.kernel.identity.jwt import JWTManager
+    from src.kernel.models.user import RefreshToken
+
+    service = IdentityService(db_session)
+    email = f"t0-{uuid.uuid4().hex[:8]}@example.com"
+    user = await service.register_user(email, "SecurePass123", "T0 Legacy")
+    _, rotated = await service.authenticate(email, "SecurePass123")
+    _, logged_out = await service.authenticate(email, "SecurePass123")
+    await db_session.flush()
+    for token in (rotated.refresh_token, logged_out.refresh_token):
+        await db_session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.token_hash == JWTManager.hash_token(token))
+            .values(token_hash=JWTManager.legacy_hash_token(token))
+        )
+
+    assert await service.refresh_tokens(rotated.refresh_token) is not None
+    await service.logout(user.id, refresh_token=logged_out.refresh_token)
+    result = await db_session.execute(
+        select(RefreshToken.revoked).where(
+            RefreshToken.token_hash == JWTManager.legacy_hash_token(logged_out.refresh_token)
+        )
+    )
+    assert result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_t0_identity_user_lookups_reuse_loaded_user(client: AsyncClient, db_session: AsyncSession):
+    """Repeated lookups return the already-loaded user; rolled-back users are not served."""
+    from src.kernel.identity.identity_service import IdentityService
+
+    service = IdentityService(db_session)
+    email = f"t0-{uuid.uuid4().hex[:8]}@example.com"
+    user = await service.register_user(email, "SecurePass123", "T0 Lookup")
+
+    assert await service.get_user_by_email(email.upper()) is user
+    assert await service.get_user_by_id(user.id) is user
+
+    await db_session.rollback()
+    assert await service.get_user_by_email(email) is None
+
+
+@pytest.mark.asyncio
+async def test_t0_artifact_tree_ctes(client: AsyncClient, db_session: AsyncSession):
+    """Subtree and ancestor chain are each fetched with one recursive query."""
+    from datetime import datetime, timezone
+
+    from src.kernel.models.artifact import (
+        Artifact,
+        ArtifactType,
+        ancestors_query,
+        compute_content_hash,
+        descendants_query,
+    )
+
+    project_id = uuid.uuid4()
+
+    def make(parent=None, position=0, deleted=False):
+        artifact = Artifact(
+            id=uuid.uuid4(),
+            project_id=project_id,
+            artifact_type=ArtifactType.SECTION,
+            parent_id=parent.id if parent else None,
+            position=position,
+            content="",
+            content_hash=compute_content_hash(""),
+            deleted_at=datetime.now(timezone.utc) if deleted else None,
+        )
+        db_session.add(artifact)
+        return artifact
+
+    root = make()
+    first, second = make(root, 0), make(root, 1)
+    leaf = make(first)
+    removed = make(second, deleted=True)
+    make(removed)  # hidden below a soft-deleted parent
+    await db_session.flush()
+
+    result = await db_session.execute(descendants_query(root.id, project_id))
+    assert [a.id for a in result.scalars()] == [first.id, second.id, leaf.id]
+
+    result = await db_session.execute(ancestors_query(leaf.id, project_id))
+    assert [a.id for a in result.scalars()] == [root.id, first.id]
+
+    result = await db_session.execute(descendants_query(root.id, uuid.uuid4()))
+    assert result.scalars().all() == []
+
+
+@pytest.mark.asyncio
+async def test_t0_review_request_patch_required_change(client: AsyncClient, db_session: AsyncSession):
+    """Patching one required change leaves the other keys in place."""
+    from src.kernel.models.collaboration import ReviewRequest
+
+    review = ReviewRequest(
+        project_id=uuid.uuid4(),
+        requested_by=uuid.uuid4(),
+        reviewer_id=uuid.uuid4(),
+        required_changes={"methods": "Justify the sample size"},
+    )
+    db_session.add(review)
+    await db_session.flush()
+
+    await review.patch_required_change(db_session, "ethics", {"done": False})
+    await review.patch_required_change(db_session, "methods", "Resolved")
+    await db_session.refresh(review)
+    assert review.required_changes == {"methods": "Resolved", "ethics": {"done": False}}
+
+    empty = ReviewRequest(
+        project_id=uuid.uuid4(),
+        requested_by=uuid.uuid4(),
+        reviewer_id=uuid.uuid4(),
+    )
+    db_session.add(empty)
+    await db_session.flush()
+    await empty.patch_required_change(db_session, "scope", "Narrow the question")
+    await db_session.refresh(empty)
+    assert empty.required_changes == {"scope": "Narrow the question"}
+
+
+@pytest.mark.asyncio
+async def test_t0_avatar_messages_keyset_pages(client: AsyncClient, db_session: AsyncSession):
+    """Recent messages page backwards by cursor and respect a token budget."""
+    from datetime import datetime, timedelta, timezone
+
+    from src.kernel.models.avatar_conversation import AvatarMessage, fetch_recent
+
+    project_id, user_id = uuid.uuid4(), uuid.uuid4()
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    messages = [
+        AvatarMessage(
+            project_id=project_id,
+            user_id=user_id,
+            role="user" if i % 2 == 0 else "assistant",
+            content=f"message {i}",
+            token_count=10,
+            created_at=start + timedelta(minutes=i),
+        )
+        for i in range(5)
+    ]
+    db_session.add_all(messages)
+    await db_session.flush()
+    ids = [m.id for m in messages]
+
+    page = await fetch_recent(db_session, project_id, user_id, limit=2)
+    assert [m.id for m in page] == [ids[4], ids[3]]
+    page = await fetch_recent(db_session, project_id, user_id, before_id=page[-1].id, limit=2)
+    assert [m.id for m in page] == [ids[2], ids[1]]
+    page = await fetch_recent(db_session, project_id, user_id, before_id=page[-1].id, limit=2)
+    assert [m.id for m in page] == [ids[0]]
+
+    page = await fetch_recent(db_session, project_id, user_id, roles=("user",))
+    assert [m.id for m in page] == [ids[4], ids[2], ids[0]]
+    page = await fetch_recent(db_session, project_id, user_id, token_budget=25)
+    assert [m.id for m in page] == [ids[4], ids[3]]
+
+
+@pytest.mark.asyncio
+async def test_t0_bulk_create_artifacts_and_comments(client: AsyncClient, db_session: AsyncSession):
+    """Bulk creation assigns ids and content hashes without the unit of work."""
+    from sqlalchemy import func
+
+    from src.kernel.models.artifact import Artifact, ArtifactType, compute_content_hash
+    from src.kernel.models.collaboration import Comment, CommentThread
+
+    project_id, author_id = uuid.uuid4(), uuid.uuid4()
+    artifact_ids = await Artifact.bulk_create(db_session, [
+        {"project_id": project_id, "artifact_type": ArtifactType.CLAIM, "content": f"claim {i}"}
+        for i in range(3)
+    ])
+    thread_ids = await CommentThread.bulk_create(
+        db_session, [{"artifact_id": artifact_id} for artifact_id in artifact_ids]
+    )
+    comment_ids = await Comment.bulk_create(db_session, [
+        {"thread_id": thread_id, "author_id": author_id, "content": "Cite this"}
+        for thread_id in thread_ids
+    ])
+    assert not db_session.new
+    assert all(i.version == 7 for i in artifact_ids + comment_ids)
+
+    result = await db_session.execute(
+        select(Artifact.content, Artifact.content_hash).where(Artifact.id.in_(artifact_ids))
+    )
+    assert all(h == compute_content_hash(c) for c, h in result)
+    count = await db_session.scalar(
+        select(func.count()).select_from(Comment).where(Comment.id.in_(comment_ids))
+    )
+    assert count == 3
+
+
+@pytest.mark.asyncio
+async def test_t0_permissions_bulk_check(client: AsyncClient, db_session: AsyncSession):
+    """Explicit grants for many resources come back from one lookup."""
+    from datetime import datetime, timedelta, timezone
+
+    from src.kernel.models.permission import PermissionLevel, ResourceType
+    from src.kernel.permissions import PermissionService
+
+    service = PermissionService(db_session)
+    user_id, granter_id = uuid.uuid4(), uuid.uuid4()
+    viewed, edited, expired, revoked, ungranted = (uuid.uuid4() for _ in range(5))
+    await service.grant_permission(user_id, ResourceType.PROJECT, viewed, PermissionLevel.VIEW, granter_id)
+    await service.grant_permission(user_id, ResourceType.ARTIFACT, edited, PermissionLevel.EDIT, granter_id)
+    await service.grant_permission(
+        user_id, ResourceType.PROJECT, expired, PermissionLevel.EDIT, granter_id,
+        expires_at=datetime.now(timezone.utc) - timedelta(days=1),
+    )
+    await service.grant_permission(user_id, ResourceType.PROJECT, revoked, PermissionLevel.ADMIN, granter_id)
+    await db_session.flush()
+    await service.revoke_permission(user_id, ResourceType.PROJECT, revoked)
+    await db_session.flush()
+
+    levels = await service.check_permissions_bulk(user_id, [
+        (ResourceType.PROJECT, viewed),
+        (ResourceType.ARTIFACT, edited),
+        (ResourceType.PROJECT, edited),  # granted on the artifact, not a project
+        (ResourceType.PROJECT, expired),
+        (ResourceType.PROJECT, revoked),
+        (ResourceType.PROJECT, ungranted),
+    ])
+    assert levels == {
+        (ResourceType.PROJECT, viewed): PermissionLevel.VIEW,
+        (ResourceType.ARTIFACT, edited): PermissionLevel.EDIT,
+    }
+
+
+@pytest.mark.asyncio
+async def test_t0_project_permission_sources(client: AsyncClient, db_session: AsyncSession):
+    """Ownership, shares and explicit grants each grant access up to their level."""
+    from src.kernel.models.permission import PermissionLevel, ResourceType
+    from src.kernel.models.project import PermissionLevel as ShareLevel, ProjectShare, ResearchProject
+    from src.kernel.models.user import User, UserRole
+    from src.kernel.permissions import PermissionService
+
+    def make_user(name):
+        return User(id=uuid.uuid4(), email=f"{name}@example.com", password_hash="x", role=UserRole.STUDENT)
+
+    owner, commenter, granted, stranger = (make_user(n) for n in ("own", "com", "gra", "str"))
+    project = ResearchProject(id=uuid.uuid4(), title="Sources", owner_id=owner.id)
+    db_session.add(project)
+    db_session.add(ProjectShare(
+        project_id=project.id, user_id=commenter.id,
+        permission_level=ShareLevel.COMMENT, invited_by=owner.id,
+    ))
+    service = PermissionService(db_session)
+    await service.grant_permission(granted.id, ResourceType.PROJECT, project.id, PermissionLevel.EDIT, owner.id)
+    await db_session.flush()
+
+    async def allowed(user, level):
+        return await service.check_project_permission(user, project.id, level)
+
+    assert await allowed(owner, PermissionLevel.OWNER)
+    assert await allowed(commenter, PermissionLevel.COMMENT)
+    assert not await allowed(commenter, PermissionLevel.EDIT)
+    assert await allowed(granted, PermissionLevel.EDIT)
+    assert not await allowed(granted, PermissionLevel.ADMIN)
+    assert not await allowed(stranger, PermissionLevel.VIEW)
+
+
+@pytest.mark.asyncio
+async def test_t0_artifact_permission_single_query(
+    client: AsyncClient, db_session: AsyncSession, assert_no_n_plus_one
+):
+    """An artifact check resolves its project inside the one permission query."""
+    from src.kernel.models.artifact import Artifact, ArtifactType
+    from src.kernel.models.permission import PermissionLevel
+    from src.kernel.models.project import ResearchProject
+    from src.kernel.models.user import User, UserRole
+    from src.kernel.permissions import PermissionService
+
+    owner = User(id=uuid.uuid4(), email="art-own@example.com", password_hash="x", role=UserRole.STUDENT)
+    admin = User(id=uuid.uuid4(), email="art-adm@example.com", password_hash="x", role=UserRole.ADMIN)
+    project = ResearchProject(id=uuid.uuid4(), title="Artifacts", owner_id=owner.id)
+    artifact = Artifact(
+        id=uuid.uuid4(), project_id=project.id, artifact_type=ArtifactType.NOTE,
+        content="x", content_hash="x",
+    )
+    db_session.add_all([project, artifact])
+    await db_session.flush()
+    service = PermissionService(db_session)
+
+    with assert_no_n_plus_one(1):
+        assert await service.check_artifact_permission(owner, artifact.id, PermissionLevel.EDIT)
+    with assert_no_n_plus_one(1):
+        assert not await service.check_artifact_permission(admin, uuid.uuid4(), PermissionLevel.VIEW)
+    assert await service.check_artifact_permission(admin, artifact.id, PermissionLevel.ADMIN)
+    stranger = User(id=uuid.uuid4(), email="art-str@example.com", password_hash="x", role=UserRole.STUDENT)
+    assert not await service.check_artifact_permission(stranger, artifact.id, PermissionLevel.VIEW)
+
+
+@pytest.mark.asyncio
+async def test_t0_check_many_checks_each_project_once(
+    client: AsyncClient, db_session: AsyncSession, assert_no_n_plus_one
+):
+    """check_many resolves artifacts and comments to projects and checks each project once."""
+    from src.kernel.models.artifact import Artifact, ArtifactType
+    from src.kernel.models.collaboration import Comment, CommentThread
+    from src.kernel.models.permission import PermissionLevel, ResourceType
+    from src.kernel.models.project import ResearchProject
+    from src.kernel.models.user import User, UserRole
+    from src.kernel.permissions import PermissionService
+
+    owner = User(id=uuid.uuid4(), email="many@example.com", password_hash="x", role=UserRole.STUDENT)
+    mine = ResearchProject(id=uuid.uuid4(), title="Mine", owner_id=owner.id)
+    other = ResearchProject(id=uuid.uuid4(), title="Other", owner_id=uuid.uuid4())
+    db_session.add_all([mine, other])
+    artifacts = [
+        Artifact(id=uuid.uuid4(), project_id=project.id, artifact_type=ArtifactType.NOTE, content="x", content_hash="x")
+        for project in (mine, mine, mine, other)
+    ]
+    db_session.add_all(artifacts)
+    thread = CommentThread(id=uuid.uuid4(), artifact_id=artifacts[0].id)
+    comment = Comment(id=uuid.uuid4(), thread_id=thread.id, author_id=owner.id, content="hi")
+    db_session.add_all([thread, comment])
+    await db_session.flush()
+
+    resources = [(ResourceType.ARTIFACT, a.id) for a in artifacts] + [
+        (ResourceType.COMMENT, comment.id),
+        (ResourceType.PROJECT, mine.id),
+        (ResourceType.ARTIFACT, uuid.uuid4()),
+    ]
+    # Artifact lookup, comment lookup, one check per distinct project
+    with assert_no_n_plus_one(4):
+        verdicts = await PermissionService(db_session).check_many(
+            owner, resources, PermissionLevel.EDIT
+        )
+
+    assert [verdicts[r] for r in resources] == [True, True, True, False, True, True, False]
+
+
+@pytest.mark.asyncio
+async def test_t0_permission_checks_cached_per_scope(client: AsyncClient, db_session: AsyncSession):
+    """Within a cache scope a repeated check is answered without the database."""
+    from sqlalchemy import delete
+
+    from src.kernel.models.permission import Permission, PermissionLevel, ResourceType
+    from src.kernel.models.user import User, UserRole
+    from src.kernel.permissions import PermissionService, permission_cache_scope
+
+    user = User(id=uuid.uuid4(), email="cached@example.com", password_hash="x", role=UserRole.STUDENT)
+    project_id = uuid.uuid4()
+    service = PermissionService(db_session)
+    await service.grant_permission(user.id, ResourceType.PROJECT, project_id, PermissionLevel.VIEW, uuid.uuid4())
+    await db_session.flush()
+
+    with permission_cache_scope():
+        assert await service.check_project_permission(user, project_id, PermissionLevel.VIEW)
+        await db_session.execute(delete(Permission).where(Permission.resource_id == project_id))
+        assert await service.check_project_permission(user, project_id, PermissionLevel.VIEW)
+        # Revoking through the service drops cached results
+        await service.revoke_permission(user.id, ResourceType.PROJECT, project_id)
+        assert not await service.check_project_permission(user, project_id, PermissionLevel.VIEW)
+
+    assert not await service.check_project_permission(user, project_id, PermissionLevel.VIEW)
+
+
+@pytest.mark.asyncio
+async def test_t0_expired_permissions_swept(client: AsyncClient, db_session: AsyncSession):
+    """The expiry sweep revokes lapsed grants and leaves open-ended ones alone."""
+    from datetime import datetime, timedelta, timezone
+
+    from src.kernel.models.permission import PermissionLevel, ResourceType
+    from src.kernel.permissions import PermissionService
+
+    service = PermissionService(db_session)
+    now = datetime.now(timezone.utc)
+    expired = await service.grant_permission(
+        uuid.uuid4(), ResourceType.PROJECT, uuid.uuid4(), PermissionLevel.VIEW,
+        uuid.uuid4(), expires_at=now - timedelta(hours=1),
+    )
+    current = await service.grant_permission(
+        uuid.uuid4(), ResourceType.PROJECT, uuid.uuid4(), PermissionLevel.VIEW,
+        uuid.uuid4(), expires_at=now + timedelta(hours=1),
+    )
+    permanent = await service.grant_permission(
+        uuid.uuid4(), ResourceType.PROJECT, uuid.uuid4(), PermissionLevel.VIEW, uuid.uuid4(),
+    )
+    await db_session.flush()
+
+    assert await service.revoke_expired_permissions() >= 1
+    for permission in (expired, current, permanent):
+        await db_session.refresh(permission)
+    assert expired.revoked and expired.revoked_at is not None
+    assert not current.revoked
+    assert not permanent.revoked
+
+
+@pytest.mark.asyncio
+async def test_t0_projects_crud(client: AsyncClient, assert_no_n_plus_one):
     """Projects CRUD works."""
     email = f"t0-proj-{uuid.uuid4().hex[:8]}@example.com"
     await client.post(
@@ -158,14 +617,32 @@ async def test_t0_projects_crud(client: AsyncClient):
     assert r.status_code == 201
     project_id = r.json()["id"]
 
-    r = await client.get("/api/v1/projects", headers=headers)
+    # User lookup, owned projects, shared projects, artifact counts
+    with assert_no_n_plus_one(4):
+        r = await client.get("/api/v1/projects", headers=headers)
     assert r.status_code == 200
-    assert any(p["id"] == project_id for p in r.json())
+    listed = next(p for p in r.json() if p["id"] == project_id)
+    assert listed["is_owner"] and listed["artifact_count"] > 0  # scaffolded sections
 
     r = await client.get(f"/api/v1/projects/{project_id}", headers=headers)
     assert r.status_code == 200
     assert r.json()["title"] == "T0 Project"
 
+    # Artifact detail reads eagerly load children and links (other lazy loads raise)
+    r = await client.post(
+        f"/api/v1/artifacts/projects/{project_id}/artifacts",
+        json={"artifact_type": "section", "title": "T0 Section", "content": "Body"},
+        headers=headers,
+    )
+    assert r.status_code == 201, r.text
+    r = await client.get(f"/api/v1/artifacts/{r.json()['id']}", headers=headers)
+    assert r.status_code == 200, r.text
+    assert r.json()["children_count"] == 0
+
+    r = await client.get(f"/api/v1/artifacts/projects/{project_id}/tree", headers=headers)
+    assert r.status_code == 200, r.text
+    assert any(a["title"] == "T0 Section" for a in r.json()["root_artifacts"])
+
 
 @pytest.mark.asyncio
 async def test_t0_mastery_progress(client: AsyncClient):
@@ -254,6 +731,116 @@ async def test_t0_event_store_logs_and_counts(client: AsyncClient, db_session: A
     assert count >= 1
 
 
+@pytest.mark.asyncio
+async def test_t0_event_store_log_many(client: AsyncClient, db_session: AsyncSession):
+    """Event store writes a batch of events in one call."""
+    event_store = EventStore(db_session)
+    entity_id = uuid.uuid4()
+
+    written = await event_store.log_many([
+        {
+            "event_type": EventType.ARTIFACT_UPDATED,
+            "entity_type": "artifact",
+            "entity_id": entity_id,
+            "payload": {"version_number": i},
+        }
+        for i in range(3)
+    ])
+    # Bulk INSERT: executed immediately, nothing left in the unit of work
+    assert not db_session.new
+    await db_session.commit()
+
+    assert written == 3
+    count = await event_store.count_events(entity_type="artifact", entity_id=entity_id)
+    assert count == 3
+
+
+@pytest.mark.asyncio
+async def test_t0_event_store_stream_entity_history(client: AsyncClient, db_session: AsyncSession):
+    """Streaming read yields the same events as the list-returning method."""
+    event_store = EventStore(db_session)
+    entity_id = uuid.uuid4()
+    await event_store.log_many([
+        {"event_type": EventType.ARTIFACT_UPDATED, "entity_type": "artifact", "entity_id": entity_id}
+        for _ in range(3)
+    ])
+    await db_session.commit()
+
+    streamed = [e.id async for e in event_store.stream_entity_history("artifact", entity_id)]
+    listed = [e.id for e in await event_store.get_entity_history("artifact", entity_id)]
+    assert len(streamed) == 3
+    assert set(streamed) == set(listed)
+
+
+@pytest.mark.asyncio
+async def test_t0_event_store_log_from_model(client: AsyncClient, db_session: AsyncSession):
+    """Model payloads are stored as their JSON encoding, with project_id promoted."""
+    from src.kernel.events.event_types import ArtifactEvent
+
+    event_store = EventStore(db_session)
+    artifact_id = uuid.uuid4()
+    project_id = uuid.uuid4()
+    await event_store.log_from_model(
+        event_type=EventType.ARTIFACT_CREATED,
+        entity_type="artifact",
+        entity_id=artifact_id,
+        user_id=None,
+        payload_model=ArtifactEvent(project_id=project_id, artifact_type="claim"),
+    )
+    await db_session.commit()
+
+    [event] = await event_store.get_entity_history("artifact", artifact_id)
+    assert event.project_id == project_id
+    assert event.payload["project_id"] == str(project_id)
+    assert event.payload["artifact_type"] == "claim"
+
+
+@pytest.mark.asyncio
+async def test_t0_event_store_exists_and_approximate_count(client: AsyncClient, db_session: AsyncSession):
+    """exists() finds matching events; approximate_count() falls back to an exact count on SQLite."""
+    from sqlalchemy import delete
+
+    event_store = EventStore(db_session)
+    entity_id = uuid.uuid4()
+
+    # Unfiltered on an empty table (emptied in a savepoint; the test DB is shared)
+    savepoint = await db_session.begin_nested()
+    await db_session.execute(delete(EventLog))
+    assert not await event_store.exists()
+    await savepoint.rollback()
+
+    assert not await event_store.exists(entity_type="artifact", entity_id=entity_id)
+    await event_store.log(
+        event_type=EventType.ARTIFACT_CREATED,
+        entity_type="artifact",
+        entity_id=entity_id,
+    )
+    await db_session.commit()
+
+    assert await event_store.exists(entity_type="artifact", entity_id=entity_id)
+    assert await event_store.approximate_count() == await event_store.count_events()
+
+
+@pytest.mark.asyncio
+async def test_t0_background_event_queue_writes_on_stop(client: AsyncClient, db_session: AsyncSession):
+    """Queued telemetry events are batch-written, and stop() drains the queue."""
+    from src.kernel.events.background_queue import BackgroundEventQueue
+
+    queue = BackgroundEventQueue(TEST_SESSION_MAKER, batch_size=2)
+    queue.start()
+    entity_id = uuid.uuid4()
+    for _ in range(3):
+        assert queue.enqueue({
+            "event_type": EventType.AI_SUGGESTION_GENERATED,
+            "entity_type": "ai_suggestion",
+            "entity_id": entity_id,
+        })
+    await queue.stop()
+
+    count = await EventStore(db_session).count_events(entity_type="ai_suggestion", entity_id=entity_id)
+    assert count == 3
+
+
 @pytest.mark.asyncio
 async def test_t0_export_controller_callable():
     """Export controller evaluate_export_readiness is callable."""
@@ -322,6 +909,23 @@ async def test_t1_submission_unit_api_registered(client: AsyncClient):
     assert isinstance(r.json(), list)
 
 
+@pytest.mark.asyncio
+async def test_t1_submission_unit_artifact_ids_load_as_uuids(client: AsyncClient, db_session: AsyncSession):
+    """artifact_ids accepts UUIDs or strings and always loads UUIDs."""
+    from src.kernel.models.submission_unit import SubmissionUnit
+
+    ids = [uuid.uuid4(), uuid.uuid4()]
+    unit = SubmissionUnit(project_id=uuid.uuid4(), title="Ids", artifact_ids=[ids[0], str(ids[1])])
+    empty = SubmissionUnit(project_id=uuid.uuid4(), title="None")
+    db_session.add_all([unit, empty])
+    await db_session.flush()
+    await db_session.refresh(unit)
+    await db_session.refresh(empty)
+
+    assert unit.artifact_ids == ids
+    assert empty.artifact_ids is None
+
+
 @pytest.mark.asyncio
 async def test_t1_state_machine_valid_transitions():
     """State machine service valid_transitions and can_transition return expected values."""
@@ -0,0 +1,28 @@
+"""Unit tests for avatar message token counting."""
+
+from src.kernel.models import avatar_conversation
+from src.kernel.models.avatar_conversation import (
+    MAX_TOKENIZED_CHARS,
+    count_tokens,
+    load_token_encoding,
+)
+
+
+class TestCountTokens:
+    """Tests for count_tokens."""
+    
+    def test_empty_content(self):
+        """Empty content has no tokens."""
+        assert count_tokens("") == 0
+    
+    def test_long_content_is_estimated(self):
+        """Content past the tokenization limit uses the 4 chars/token estimate."""
+        content = "a" * (MAX_TOKENIZED_CHARS + 4)
+        assert count_tokens(content) == len(content) // 4
+    
+    def test_failed_load_is_not_cached(self):
+        """A model whose encoding cannot be loaded is estimated and retried later."""
+        model = "no-such-model"
+        assert not load_token_encoding(model)
+        assert model not in avatar_conversation._encodings
+        assert count_tokens("abcdefgh", model=model) == 2
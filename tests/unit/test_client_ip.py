@@ -0,0 +1,34 @@
+"""Unit tests for client IP extraction."""
+
+from starlette.requests import Request
+
+from src.api.deps import get_client_ip
+
+
+def _request(client_host=None, forwarded=None) -> Request:
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    scope = {
+        "type": "http",
+        "headers": headers,
+        "client": (client_host, 50000) if client_host else None,
+    }
+    return Request(scope)
+
+
+class TestGetClientIp:
+    """Tests for get_client_ip."""
+    
+    def test_client_host(self):
+        """The socket peer address is used without a proxy header."""
+        assert get_client_ip(_request("10.0.0.7")) == "10.0.0.7"
+    
+    def test_forwarded_first_hop(self):
+        """The first X-Forwarded-For hop wins, IPv6 included."""
+        request = _request("10.0.0.7", forwarded="2001:db8::1, 10.0.0.1")
+        assert get_client_ip(request) == "2001:db8::1"
+    
+    def test_invalid_addresses_dropped(self):
+        """Values that are not IP addresses are not passed on."""
+        assert get_client_ip(_request("10.0.0.7", forwarded="evil; DROP")) is None
+        assert get_client_ip(_request("testclient")) is None
+        assert get_client_ip(_request()) is None
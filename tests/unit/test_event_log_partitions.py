@@ -0,0 +1,46 @@
+"""Unit tests for event log partition maintenance helpers."""
+
+from datetime import date
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.kernel.events.partitions import (
+    add_months,
+    detach_expired_event_log_partitions,
+    ensure_event_log_partitions,
+    partition_name,
+)
+
+
+class TestPartitionNaming:
+    """Tests for month arithmetic and partition names."""
+    
+    def test_add_months_wraps_years(self):
+        """Adding or subtracting months crosses year boundaries."""
+        assert add_months(date(2026, 11, 15), 3) == date(2027, 2, 1)
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    
+    def test_partition_name(self):
+        """Partition names are zero-padded by year and month."""
+        assert partition_name(date(2026, 3, 1)) == "event_logs_y2026m03"
+        assert (
+            partition_name(date(2026, 3, 1), "avatar_messages")
+            == "avatar_messages_y2026m03"
+        )
+
+
+class TestPartitionMaintenance:
+    """Tests for maintenance on non-PostgreSQL databases."""
+    
+    @pytest.mark.asyncio
+    async def test_noop_on_sqlite(self):
+        """SQLite has no partitions, so maintenance does nothing."""
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            assert await ensure_event_log_partitions(conn, months_ahead=3) == []
+            assert await detach_expired_event_log_partitions(conn, retention_months=12) == []
+            assert await ensure_event_log_partitions(
+                conn, months_ahead=3, table="avatar_messages"
+            ) == []
+        await engine.dispose()
@@ -0,0 +1,88 @@
+"""Unit tests for JWT token management."""
+
+import uuid
+
+from src.kernel.identity.jwt import JWTManager
+
+
+SECRET = "test-secret-key-with-at-least-32-characters"
+
+
+class TestJWTManager:
+    """Tests for JWTManager."""
+    
+    def test_access_token_round_trip(self):
+        """A created access token verifies to its claims."""
+        manager = JWTManager(secret_key=SECRET)
+        user_id = uuid.uuid4()
+        token, _, jti = manager.create_access_token(user_id, "a@example.com", "student")
+        
+        payload = manager.verify_access_token(token)
+        assert payload is not None
+        assert payload.sub == str(user_id)
+        assert payload.jti == jti
+    
+    def test_refresh_token_is_not_an_access_token(self):
+        """Token types are not interchangeable."""
+        manager = JWTManager(secret_key=SECRET)
+        token, _, _ = manager.create_refresh_token(uuid.uuid4())
+        
+        assert manager.verify_access_token(token) is None
+        assert manager.verify_refresh_token(token) is not None
+    
+    def test_verified_payload_is_cached(self):
+        """Re-verifying the same token reuses the cached payload."""
+        manager = JWTManager(secret_key=SECRET)
+        token, _, _ = manager.create_access_token(uuid.uuid4(), "a@example.com", "student")
+        
+        assert manager.verify_access_token(token) is manager.verify_access_token(token)
+    
+    def test_cache_can_be_disabled(self):
+        """A zero TTL decodes the token on every call."""
+        manager = JWTManager(secret_key=SECRET, verify_cache_ttl_seconds=0)
+        token, _, _ = manager.create_access_token(uuid.uuid4(), "a@example.com", "student")
+        
+        first = manager.verify_access_token(token)
+        assert first is not None
+        assert manager.verify_access_token(token) is not first
+    
+    def test_tampered_token_rejected(self):
+        """A token signed with another key does not verify."""
+        token, _, _ = JWTManager(secret_key="x" * 40).create_access_token(
+            uuid.uuid4(), "a@example.com", "student"
+        )
+        assert JWTManager(secret_key=SECRET).verify_access_token(token) is None
+    
+    def test_token_hashes(self):
+        """Tokens hash to BLAKE2b-256; the legacy fallback is SHA-256."""
+        import hashlib
+        
+        token = "some.refresh.token"
+        current = JWTManager.hash_token(token)
+        
+        assert current == hashlib.blake2b(token.encode(), digest_size=32).hexdigest()
+        assert len(current) == 64
+        assert JWTManager.legacy_hash_token(token) == hashlib.sha256(token.encode()).hexdigest()
+    
+    def test_tokens_readable_by_standard_pyjwt(self):
+        """orjson-encoded claims are plain JWT JSON (e.g. for the rate limiter)."""
+        import jwt
+        
+        manager = JWTManager(secret_key=SECRET)
+        user_id = uuid.uuid4()
+        token, _, _ = manager.create_access_token(user_id, "a@example.com", "student")
+        
+        claims = jwt.decode(token, SECRET, algorithms=["HS256"])
+        assert claims["sub"] == str(user_id)
+        assert isinstance(claims["exp"], int)
+    
+    def test_exp_and_iat_are_epoch_seconds(self):
+        """exp/iat are NumericDate ints; exp_datetime converts for display."""
+        manager = JWTManager(secret_key=SECRET)
+        token, expire, _ = manager.create_refresh_token(uuid.uuid4())
+        
+        payload = manager.verify_refresh_token(token)
+        assert isinstance(payload.exp, int)
+        assert payload.exp == int(expire.timestamp())
+        assert payload.exp_datetime == expire.replace(microsecond=0)
+        assert payload.iat <= payload.exp
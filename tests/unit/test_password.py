@@ -4,8 +4,11 @@ import pytest
 
 from src.kernel.identity.password import (
     PasswordHasher,
+    dummy_verify_async,
     hash_password,
+    hash_password_async,
     verify_password,
+    verify_password_async,
 )
 
 
@@ -19,7 +22,7 @@ class TestPasswordHasher:
         hash2 = PasswordHasher.hash(password)
         
         assert hash1 != hash2
-        assert hash1.startswith("$2b$")  # bcrypt prefix
+        assert hash1.startswith("$argon2id$")
     
     def test_verify_correct_password(self):
         """Correct password should verify successfully."""
@@ -42,3 +45,44 @@ class TestPasswordHasher:
         
         assert verify_password(password, hashed) is True
         assert verify_password("wrong", hashed) is False
+    
+    def test_legacy_bcrypt_hash_verifies_and_needs_rehash(self):
+        """Existing bcrypt hashes still verify and are flagged for upgrade."""
+        import bcrypt
+        
+        legacy = bcrypt.hashpw(b"TestPassword123", bcrypt.gensalt(rounds=4)).decode()
+        
+        assert verify_password("TestPassword123", legacy) is True
+        assert verify_password("wrong", legacy) is False
+        assert PasswordHasher.needs_rehash(legacy) is True
+        assert PasswordHasher.needs_rehash(hash_password("TestPassword123")) is False
+    
+    @pytest.mark.asyncio
+    async def test_async_wrappers(self):
+        """Async wrappers hash and verify like the sync functions."""
+        hashed = await hash_password_async("TestPassword123")
+        
+        assert await verify_password_async("TestPassword123", hashed) is True
+        assert await verify_password_async("wrong", hashed) is False
+    
+    @pytest.mark.asyncio
+    async def test_dummy_verify_reuses_one_hash(self):
+        """The missing-user verification hashes once and then only verifies."""
+        from src.kernel.identity import password
+        
+        await dummy_verify_async("whatever")
+        first = password._dummy_hash
+        await dummy_verify_async("something else")
+        
+        assert first is not None and first.startswith("$argon2id$")
+        assert password._dummy_hash == first
+    
+    @pytest.mark.asyncio
+    async def test_async_calls_use_bounded_pool(self):
+        """Async hashing runs on the dedicated, size-capped executor."""
+        from src.kernel.identity import password
+        
+        await hash_password_async("TestPassword123")
+        
+        executor = password._get_hash_executor()
+        assert executor._max_workers == password.HASH_WORKERS
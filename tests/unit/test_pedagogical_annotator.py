@@ -0,0 +1,51 @@
+"""Unit tests for the pedagogical annotator."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.engines.validation import pedagogical_annotator
+from src.engines.validation.pedagogical_annotator import (
+    annotate_section_deep,
+    annotate_section_rule_based,
+    clear_annotation_cache,
+)
+
+
+SECTION_TEXT = (
+    "This chapter examines how feedback loops shape the adoption of new "
+    "teaching tools in secondary schools across several regions.\n\n"
+    "However, prior studies rarely followed teachers for more than a single "
+    "term, which leaves the longer-term picture largely unexplored here."
+)
+
+
+class TestRuleBasedAnnotator:
+    """Tests for annotate_section_rule_based."""
+
+    def test_one_annotation_per_paragraph(self):
+        """Each matching paragraph gets exactly one annotation."""
+        result = annotate_section_rule_based(SECTION_TEXT, "Intro")
+        assert result.total_paragraphs == 2
+        assert [a.annotation_type for a in result.annotations] == ["structural", "rhetorical"]
+
+
+class TestDeepAnnotatorCache:
+    """Tests for the AI response cache in annotate_section_deep."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_call_uses_cache(self):
+        """Identical section text only triggers one AI request."""
+        clear_annotation_cache()
+        settings = MagicMock(openai_api_key="sk-test-key")
+        ai_data = [{"paragraph_index": 5, "type": "CLAIM", "explanation": "x"}]
+        with patch.object(pedagogical_annotator, "get_settings", return_value=settings), \
+             patch.object(
+                 pedagogical_annotator,
+                 "_request_ai_annotations",
+                 AsyncMock(return_value=ai_data),
+             ) as mock_request:
+            first = await annotate_section_deep(SECTION_TEXT, "Intro")
+            second = await annotate_section_deep(SECTION_TEXT, "Intro")
+        assert mock_request.await_count == 1
+        assert first.model_used == second.model_used == "gpt-4o-mini"
+        clear_annotation_cache()
@@ -0,0 +1,30 @@
+"""Unit tests for Permission.is_valid."""
+
+from datetime import datetime, timedelta, timezone
+
+from src.kernel.models.permission import Permission
+
+
+class TestPermissionIsValid:
+    """Tests for revocation and expiry handling."""
+    
+    def test_open_ended_grant_is_valid(self):
+        """A grant without expiry stays valid until revoked."""
+        assert Permission(revoked=False, expires_at=None).is_valid
+    
+    def test_revoked_grant_is_invalid(self):
+        """Revocation wins over a future expiry."""
+        future = datetime.now(timezone.utc) + timedelta(hours=1)
+        assert not Permission(revoked=True, expires_at=future).is_valid
+    
+    def test_expiry_with_timezone(self):
+        """Aware expiry times (PostgreSQL) compare against the current time."""
+        now = datetime.now(timezone.utc)
+        assert Permission(revoked=False, expires_at=now + timedelta(minutes=1)).is_valid
+        assert not Permission(revoked=False, expires_at=now - timedelta(minutes=1)).is_valid
+    
+    def test_naive_expiry_is_utc(self):
+        """Naive expiry times (SQLite) are read as UTC, not local time."""
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        assert Permission(revoked=False, expires_at=now + timedelta(minutes=1)).is_valid
+        assert not Permission(revoked=False, expires_at=now - timedelta(minutes=1)).is_valid
@@ -0,0 +1,31 @@
+"""Unit tests for time-ordered UUID generation."""
+
+import time
+import uuid
+
+from src.kernel.models.base import generate_uuid7
+
+
+class TestGenerateUuid7:
+    """Tests for version 7 UUIDs."""
+    
+    def test_version_and_variant(self):
+        """Generated ids carry the version 7 nibble and RFC 4122 variant."""
+        value = generate_uuid7()
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+    
+    def test_timestamp_prefix(self):
+        """The top 48 bits hold the current Unix time in milliseconds."""
+        before = time.time_ns() // 1_000_000
+        value = generate_uuid7()
+        after = time.time_ns() // 1_000_000
+        assert before <= value.int >> 80 <= after
+    
+    def test_ids_sort_by_creation_time(self):
+        """Ids generated in later milliseconds sort after earlier ones."""
+        first = generate_uuid7()
+        time.sleep(0.002)
+        second = generate_uuid7()
+        assert first < second
+        assert first != generate_uuid7()
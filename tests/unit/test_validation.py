@@ -1,11 +1,18 @@
 """Unit tests for validation engine."""
 
+import uuid
+
 import pytest
 
 from src.engines.validation.format_validator import (
     FormatValidator,
     ValidationStatus,
 )
+from src.engines.validation.red_flag_detector import (
+    RedFlagDetector,
+    RedFlagType,
+    normalize_author_names,
+)
 
 
 class TestFormatValidator:
@@ -94,3 +101,68 @@ class TestFormatValidator:
         results = FormatValidator.validate_required_fields("journal", citation_data)
         invalid_results = [r for r in results if r.status == ValidationStatus.INVALID]
         assert len(invalid_results) == 3  # authors, journal, year
+
+
+class TestRedFlagDetector:
+    """Tests for RedFlagDetector."""
+    
+    def test_normalize_author_names(self):
+        """Author lists should normalize to lowercase full and last-name sets."""
+        full, last = normalize_author_names(["John Smith", "Jane  Doe", "  "])
+        assert full == {"john smith", "jane  doe"}
+        assert last == {"smith", "doe"}
+    
+    def test_author_mismatch_flagged(self):
+        """Disjoint author last names should raise a blocking flag."""
+        flag = RedFlagDetector.check_author_mismatch(
+            uuid.uuid4(), ["John Smith"], ["Alice Jones"]
+        )
+        assert flag is not None
+        assert flag.flag_type == RedFlagType.AUTHOR_MISMATCH
+    
+    def test_author_mismatch_uses_precomputed_sets(self):
+        """Precomputed last-name sets should be used instead of re-normalizing."""
+        flag = RedFlagDetector.check_author_mismatch(
+            uuid.uuid4(),
+            ["John Smith"],
+            ["Alice Jones"],
+            precomputed_last_names=(frozenset({"smith"}), frozenset({"smith"})),
+        )
+        assert flag is None
+    
+    def test_self_citation_ratio_matches_last_names(self):
+        """Self-citations are counted by exact last-name membership."""
+        sources = [
+            {"authors": ["Ann Smith", "Bob Lee"]},
+            {"authors": ["Carl Smithson"]},
+            {"authors": ["Dana Smith"]},
+        ]
+        flag = RedFlagDetector.check_self_citation_ratio("Ann Smith", sources)
+        assert flag is not None
+        assert flag.details["self_citations"] == 2
+    
+    def test_suspicious_journal_flagged(self):
+        """Known predatory-journal fragments raise a non-blocking flag."""
+        flag = RedFlagDetector.check_suspicious_patterns(
+            uuid.uuid4(), {"journal": "International Instant Accept Review"}
+        )
+        assert flag is not None
+        assert flag.blocks_export is False
+        assert RedFlagDetector.check_suspicious_patterns(uuid.uuid4(), {"journal": None}) is None
+    
+    def test_aggregate_flags_collects_all_checks(self):
+        """aggregate_flags returns every triggered flag, in check order."""
+        from src.engines.validation.existence_checker import SourceMetadata
+        
+        flags = RedFlagDetector.aggregate_flags(
+            uuid.uuid4(),
+            {"doi": "10.1234/x", "year": 1990, "authors": ["John Smith"], "journal": "Predatory Letters"},
+            SourceMetadata(year=2020, authors=["Alice Jones"]),
+            api_found=False,
+        )
+        assert [f.flag_type for f in flags] == [
+            RedFlagType.NONEXISTENT_DOI,
+            RedFlagType.DATE_MISMATCH,
+            RedFlagType.AUTHOR_MISMATCH,
+            RedFlagType.SUSPICIOUS_CITATION,
+        ]